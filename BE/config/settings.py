@@ -4,6 +4,7 @@ Django settings for deepfake backend project.
 
 from pathlib import Path
 import os
+import tempfile
 from dotenv import load_dotenv
 import pymysql
 
@@ -102,6 +103,62 @@ DATABASES = {
 }
 
 
+# Cache
+# ⚠️ 다음 상태는 모두 'default' 캐시에 저장되며 워커 간에 공유되어야 올바르게 동작한다.
+#    AI 추론 어드미션 컨트롤 슬롯/대기열, AI 서킷 브레이커, Zoom 세션 상태/종료 표시, 분석 간격
+#    SSE 이벤트 우편함은 별도 'zoom_events' 캐시를 사용한다 (이벤트가 많아도 위 상태가 밀려나지 않도록).
+#    기본값 LocMemCache 는 프로세스별 캐시라 워커가 1개인 개발 환경에서만 맞게 동작하므로,
+#    운영(워커 여러 개)에서는 CACHE_BACKEND / ZOOM_EVENT_CACHE_BACKEND 를 Redis 등 공유 백엔드로 지정한다.
+#    (예: django.core.cache.backends.redis.RedisCache, CACHE_LOCATION=redis://127.0.0.1:6379/1)
+#    DEBUG=False 인데 프로세스 로컬 캐시를 쓰면 manage.py check / 서버 시작 시 경고한다 (detection.W001, zoom.W001).
+
+LOCAL_CACHE_BACKEND = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+def local_cache_options(backend, max_entries):
+    """
+    LocMemCache 항목 수 상한 (기본 300개는 세션/슬롯 키가 밀려나기에 너무 작음)
+
+    Redis 등은 OPTIONS 를 클라이언트 연결 인자로 넘기므로 LocMemCache 일 때만 지정한다.
+    """
+    if backend != LOCAL_CACHE_BACKEND:
+        return {}
+    return {
+        'MAX_ENTRIES': max_entries,
+        'CULL_FREQUENCY': 10,  # 가득 차면 가장 오래 쓰지 않은 1/10 정리
+    }
+
+
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', LOCAL_CACHE_BACKEND)
+AI_RESULT_CACHE_BACKEND = os.getenv('AI_RESULT_CACHE_BACKEND', LOCAL_CACHE_BACKEND)
+ZOOM_EVENT_CACHE_BACKEND = os.getenv('ZOOM_EVENT_CACHE_BACKEND', LOCAL_CACHE_BACKEND)
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': os.getenv('CACHE_LOCATION', 'deepfake-default'),
+        'OPTIONS': local_cache_options(CACHE_BACKEND, int(os.getenv('CACHE_MAX_ENTRIES', '20000'))),
+    },
+    # 콘텐츠 해시 기반 AI 분석 결과 캐시 (TTL + LRU)
+    'ai_results': {
+        'BACKEND': AI_RESULT_CACHE_BACKEND,
+        'LOCATION': os.getenv('AI_RESULT_CACHE_LOCATION', 'deepfake-ai-results'),
+        'TIMEOUT': int(os.getenv('AI_RESULT_CACHE_TTL', '3600')),
+        'OPTIONS': local_cache_options(
+            AI_RESULT_CACHE_BACKEND, int(os.getenv('AI_RESULT_CACHE_MAX_ENTRIES', '5000'))
+        ),
+    },
+    # Zoom 판정 결과 SSE 이벤트 우편함 (이벤트 1개당 키 1개, ZOOM_PUSH_EVENT_TTL 뒤 만료)
+    'zoom_events': {
+        'BACKEND': ZOOM_EVENT_CACHE_BACKEND,
+        'LOCATION': os.getenv('ZOOM_EVENT_CACHE_LOCATION', 'deepfake-zoom-events'),
+        'OPTIONS': local_cache_options(
+            ZOOM_EVENT_CACHE_BACKEND, int(os.getenv('ZOOM_EVENT_CACHE_MAX_ENTRIES', '20000'))
+        ),
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -201,6 +258,11 @@ CORS_ALLOW_HEADERS = [
 
 
 # 파일 업로드 설정
+# 업로드 스트리밍 중 SHA-256 계산 (분석 결과 캐시 키)
+FILE_UPLOAD_HANDLERS = [
+    'media_files.upload_handlers.HashingMemoryFileUploadHandler',
+    'media_files.upload_handlers.HashingTemporaryFileUploadHandler',
+]
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 
@@ -215,8 +277,177 @@ VIDEO_ALLOWED_EXTENSIONS = ['mp4', 'mov', 'avi']
 
 
 # FastAPI AI 서버 설정
-FASTAPI_URL = os.getenv('FASTAPI_URL', 'http://localhost:8001')
+# 여러 대일 경우 콤마로 구분 (예: http://ai1:8001,http://ai2:8001)
+FASTAPI_URLS = [
+    url.strip().rstrip('/')
+    for url in os.getenv('FASTAPI_URL', 'http://localhost:8001').split(',')
+    if url.strip()
+]
+FASTAPI_URL = FASTAPI_URLS[0]  # 대표 URL (단일 서버 구성 호환)
 AI_REQUEST_TIMEOUT = 300  # 5분
+AI_MODEL_VERSION = os.getenv('AI_MODEL_VERSION', 'v1.0')
+
+# AI 서버 HTTP 커넥션 풀 설정 (워커 프로세스당 공유)
+AI_HTTP_POOL_CONNECTIONS = int(os.getenv('AI_HTTP_POOL_CONNECTIONS', '4'))
+AI_HTTP_POOL_MAXSIZE = int(os.getenv('AI_HTTP_POOL_MAXSIZE', '20'))
+AI_CONNECT_TIMEOUT = float(os.getenv('AI_CONNECT_TIMEOUT', '3'))
+AI_READ_TIMEOUT = float(os.getenv('AI_READ_TIMEOUT', str(AI_REQUEST_TIMEOUT)))
+AI_HEALTH_TIMEOUT = float(os.getenv('AI_HEALTH_TIMEOUT', '10'))
+AI_HTTP_MAX_RETRIES = int(os.getenv('AI_HTTP_MAX_RETRIES', '2'))
+AI_HTTP_BACKOFF_FACTOR = float(os.getenv('AI_HTTP_BACKOFF_FACTOR', '0.2'))
+
+# 엔드포인트별 요청 마감 시간(초): Zoom 프레임은 짧게, 영상은 길게
+AI_DEADLINES = {
+    'zoom': float(os.getenv('AI_DEADLINE_ZOOM', '8')),
+    'image': float(os.getenv('AI_DEADLINE_IMAGE', '60')),
+    'video': float(os.getenv('AI_DEADLINE_VIDEO', str(AI_REQUEST_TIMEOUT))),
+}
+
+# AI 호출 재시도 (연결 오류/타임아웃/5xx, 지터 적용 지수 백오프, 마감 시간 내에서만)
+AI_RETRY_MAX_ATTEMPTS = int(os.getenv('AI_RETRY_MAX_ATTEMPTS', '2'))  # 최초 요청 제외
+AI_RETRY_BASE_DELAY = float(os.getenv('AI_RETRY_BASE_DELAY', '0.2'))
+AI_RETRY_MAX_DELAY = float(os.getenv('AI_RETRY_MAX_DELAY', '2'))
+
+# AI 호출 헤징 (p95 지연 시간을 넘기면 같은 요청을 한 번 더 전송)
+AI_HEDGE_ENABLED = os.getenv('AI_HEDGE_ENABLED', 'False') == 'True'
+AI_HEDGE_PROFILES = os.getenv('AI_HEDGE_PROFILES', 'zoom,image').split(',')
+AI_HEDGE_MIN_DELAY = float(os.getenv('AI_HEDGE_MIN_DELAY', '0.5'))
+AI_HEDGE_MIN_SAMPLES = int(os.getenv('AI_HEDGE_MIN_SAMPLES', '20'))  # p95 계산 최소 샘플 수
+AI_HEDGE_MAX_WORKERS = int(os.getenv('AI_HEDGE_MAX_WORKERS', '16'))  # 중복 요청 전송 스레드 수 (첫 요청은 호출 스레드)
+
+# AI 추론 동시 실행 제어 (모든 워커 공유, 캐시 세마포어)
+AI_ADMISSION_ENABLED = os.getenv('AI_ADMISSION_ENABLED', 'True') == 'True'
+AI_ADMISSION_LIMITS = {  # 분석 종류별 동시 추론 수
+    'zoom': int(os.getenv('AI_ADMISSION_LIMIT_ZOOM', '16')),
+    'image': int(os.getenv('AI_ADMISSION_LIMIT_IMAGE', '8')),
+    'video': int(os.getenv('AI_ADMISSION_LIMIT_VIDEO', '2')),
+}
+AI_ADMISSION_MAX_QUEUE = {  # 분석 종류별 최대 대기 요청 수 (초과 시 503)
+    'zoom': int(os.getenv('AI_ADMISSION_MAX_QUEUE_ZOOM', '16')),
+    'image': int(os.getenv('AI_ADMISSION_MAX_QUEUE_IMAGE', '16')),
+    'video': int(os.getenv('AI_ADMISSION_MAX_QUEUE_VIDEO', '4')),
+}
+AI_ADMISSION_USER_LIMIT = int(os.getenv('AI_ADMISSION_USER_LIMIT', '4'))  # 사용자별 동시 추론 수 (초과 시 429)
+AI_ADMISSION_MAX_WAIT = float(os.getenv('AI_ADMISSION_MAX_WAIT', '5'))  # 대기열 최대 대기 시간(초)
+AI_ADMISSION_RETRY_AFTER = int(os.getenv('AI_ADMISSION_RETRY_AFTER', '5'))  # Retry-After 헤더(초)
+
+# AI 서버 풀 (least outstanding requests 라우팅)
+AI_BACKEND_SLOW_START = int(os.getenv('AI_BACKEND_SLOW_START', '30'))  # 복구 후 가중치 회복 시간(초)
+AI_BACKEND_SLOW_START_MIN_WEIGHT = float(os.getenv('AI_BACKEND_SLOW_START_MIN_WEIGHT', '0.1'))
+
+# AI 서버 이미지 전달 방식
+#   'url'    : S3 업로드 후 Presigned URL 전달 (AI 서버가 S3에서 다시 다운로드)
+#   'inline' : 업로드 버퍼를 요청 본문으로 바로 전송, S3 저장은 병렬 수행
+AI_TRANSPORT_MODE = os.getenv('AI_TRANSPORT_MODE', 'url')
+AI_INLINE_ENDPOINT = os.getenv('AI_INLINE_ENDPOINT', '/detect_deepfake')
+AI_INLINE_STORAGE_WORKERS = int(os.getenv('AI_INLINE_STORAGE_WORKERS', '8'))
+
+# 분석 품질 등급(AppSetting.analysis_quality)별 추론 전 이미지 축소
+#   max_side: 긴 변 최대 픽셀, quality: 재인코딩 품질
+AI_QUALITY_TIERS = {
+    'low': {
+        'max_side': int(os.getenv('AI_QUALITY_LOW_MAX_SIDE', '640')),
+        'quality': int(os.getenv('AI_QUALITY_LOW_QUALITY', '70')),
+    },
+    'medium': {
+        'max_side': int(os.getenv('AI_QUALITY_MEDIUM_MAX_SIDE', '1280')),
+        'quality': int(os.getenv('AI_QUALITY_MEDIUM_QUALITY', '80')),
+    },
+    'high': {
+        'max_side': int(os.getenv('AI_QUALITY_HIGH_MAX_SIDE', '1920')),
+        'quality': int(os.getenv('AI_QUALITY_HIGH_QUALITY', '90')),
+    },
+}
+AI_QUALITY_DEFAULT_TIER = os.getenv('AI_QUALITY_DEFAULT_TIER', 'medium')
+AI_DOWNSCALE_FORMAT = os.getenv('AI_DOWNSCALE_FORMAT', 'JPEG')  # 'JPEG' / 'WEBP'
+AI_DOWNSCALE_WORKERS = int(os.getenv('AI_DOWNSCALE_WORKERS', '2'))  # 프로세스 수 (0이면 요청 스레드에서 실행)
+
+# AI 추론 마이크로 배칭 (AI 서버가 InputUrls 배치 요청을 지원할 때 사용)
+AI_BATCH_ENABLED = os.getenv('AI_BATCH_ENABLED', 'False') == 'True'
+AI_BATCH_MAX_SIZE = int(os.getenv('AI_BATCH_MAX_SIZE', '8'))
+AI_BATCH_MAX_WAIT_MS = int(os.getenv('AI_BATCH_MAX_WAIT_MS', '50'))
+AI_BATCH_MAX_INFLIGHT = int(os.getenv('AI_BATCH_MAX_INFLIGHT', '4'))  # 동시 전송 배치 수
+
+# AI 서버 서킷 브레이커 설정
+AI_BREAKER_WINDOW = int(os.getenv('AI_BREAKER_WINDOW', '60'))  # 오류율 집계 윈도우(초)
+AI_BREAKER_ERROR_THRESHOLD = float(os.getenv('AI_BREAKER_ERROR_THRESHOLD', '0.5'))
+AI_BREAKER_MIN_REQUESTS = int(os.getenv('AI_BREAKER_MIN_REQUESTS', '5'))
+AI_BREAKER_RESET_TIMEOUT = int(os.getenv('AI_BREAKER_RESET_TIMEOUT', '30'))  # open → half_open 대기(초)
+AI_HEALTH_CACHE_TTL = int(os.getenv('AI_HEALTH_CACHE_TTL', '300'))
+
+# 비동기 분석 작업 큐 (DB 기반, run_analysis_worker 커맨드로 처리)
+VIDEO_ANALYSIS_ASYNC = os.getenv('VIDEO_ANALYSIS_ASYNC', 'True') == 'True'
+ANALYSIS_JOB_MAX_ATTEMPTS = int(os.getenv('ANALYSIS_JOB_MAX_ATTEMPTS', '3'))
+ANALYSIS_JOB_RETRY_DELAY = int(os.getenv('ANALYSIS_JOB_RETRY_DELAY', '10'))  # 초, 시도마다 2배
+# 잠금 만료(초): 워커가 실행 중 LOCK_TIMEOUT/3 마다 locked_at 을 갱신하므로 이 시간 동안 갱신이 없으면 워커 종료로 판단
+#   기본값은 영상 마감 시간(재시도·헤지 포함 전체 예산) + 승인 대기열 대기 시간의 2배
+ANALYSIS_JOB_LOCK_TIMEOUT = int(os.getenv(
+    'ANALYSIS_JOB_LOCK_TIMEOUT',
+    str(int((AI_DEADLINES['video'] + AI_ADMISSION_MAX_WAIT) * 2))
+))
+
+# 쓰기 지연 버퍼 (시스템 로그 INSERT / 세션 카운터 증가 / 분 단위 집계를 워커별로 모아 일괄 반영)
+#   MAX_ROWS 개가 쌓이거나 FLUSH_INTERVAL 초마다 반영, 반영 전까지는 로컬 저널에 기록
+WRITE_BUFFER_ENABLED = os.getenv('WRITE_BUFFER_ENABLED', 'True') == 'True'
+WRITE_BUFFER_MAX_ROWS = int(os.getenv('WRITE_BUFFER_MAX_ROWS', '200'))
+WRITE_BUFFER_FLUSH_INTERVAL = float(os.getenv('WRITE_BUFFER_FLUSH_INTERVAL', '1.0'))
+WRITE_BUFFER_JOURNAL_DIR = os.getenv('WRITE_BUFFER_JOURNAL_DIR', str(BASE_DIR / 'logs' / 'write_journal'))
+WRITE_BUFFER_FSYNC = os.getenv('WRITE_BUFFER_FSYNC', 'False') == 'True'  # 서버 전원 장애까지 대비 (쓰기마다 fsync)
+
+# Zoom 캡처 유사 프레임 판정 (dHash 해밍 거리)
+ZOOM_FRAME_HASH_MAX_DISTANCE = int(os.getenv('ZOOM_FRAME_HASH_MAX_DISTANCE', '5'))  # 64비트 중
+ZOOM_FRAME_HASH_MAX_AGE = int(os.getenv('ZOOM_FRAME_HASH_MAX_AGE', '300'))  # 판정 재사용 최대 시간(초)
+
+# Zoom AI 분석 간격 (세션별 적응형)
+#   suspicious/deepfake 판정 직후: 최소 간격 (AppSetting.zoom_capture_interval 이상)
+#   safe 판정이 이어지면 BACKOFF 배씩 늘려 MAX 까지
+#   AI 혼잡도(zoom 동시 실행/대기열)가 LOAD_THRESHOLD 를 넘으면 모든 간격을 최대 LOAD_MAX_MULTIPLIER 배까지 늘림
+ZOOM_ANALYSIS_BASE_INTERVAL = int(os.getenv('ZOOM_ANALYSIS_BASE_INTERVAL', '30'))
+ZOOM_ANALYSIS_MIN_INTERVAL = int(os.getenv('ZOOM_ANALYSIS_MIN_INTERVAL', '5'))
+ZOOM_ANALYSIS_MAX_INTERVAL = int(os.getenv('ZOOM_ANALYSIS_MAX_INTERVAL', '120'))
+ZOOM_ANALYSIS_BACKOFF = float(os.getenv('ZOOM_ANALYSIS_BACKOFF', '1.5'))
+ZOOM_ANALYSIS_LOAD_THRESHOLD = float(os.getenv('ZOOM_ANALYSIS_LOAD_THRESHOLD', '0.5'))
+ZOOM_ANALYSIS_LOAD_MAX_MULTIPLIER = float(os.getenv('ZOOM_ANALYSIS_LOAD_MAX_MULTIPLIER', '4'))
+
+# Zoom 미분석 프레임 링 버퍼 (세션별 최근 프레임만 로컬 디스크에 보관)
+#   분석된 프레임과 경고 전후 ZOOM_ALERT_WINDOW 초 이내의 프레임만 S3/DB에 저장
+ZOOM_FRAME_BUFFER_DIR = os.getenv('ZOOM_FRAME_BUFFER_DIR', os.path.join(tempfile.gettempdir(), 'zoom_frames'))
+ZOOM_FRAME_BUFFER_SIZE = int(os.getenv('ZOOM_FRAME_BUFFER_SIZE', '6'))  # 세션별 최대 프레임 수
+ZOOM_ALERT_WINDOW = int(os.getenv('ZOOM_ALERT_WINDOW', '30'))  # 경고 전후 보존 구간(초)
+
+# Zoom 캡처 처리용 세션 상태 캐시 (캡처마다 하던 세션/앱 설정 조회 대체, 종료 시 종료 상태로 덮어씀)
+ZOOM_SESSION_STATE_TTL = int(os.getenv('ZOOM_SESSION_STATE_TTL', '3600'))
+
+# Zoom 원본 프레임 수신 (/frames/, multipart 없이 image/jpeg·image/webp 본문 그대로)
+ZOOM_FRAME_MAX_BYTES = int(os.getenv('ZOOM_FRAME_MAX_BYTES', str(IMAGE_MAX_SIZE)))
+ZOOM_FRAME_MIN_SIDE = int(os.getenv('ZOOM_FRAME_MIN_SIDE', '32'))  # px
+ZOOM_FRAME_MAX_SIDE = int(os.getenv('ZOOM_FRAME_MAX_SIDE', '4096'))  # px
+
+# Zoom 판정 결과 푸시 (Server-Sent Events, ASGI 서버에서 제공)
+#   캡처 요청에 push=true 를 보내면 접수 즉시 응답하고 결과는 /zoom/sessions/<id>/events/ 로 전달
+#   이벤트 우편함은 'zoom_events' 캐시에 저장되므로 워커가 여러 개면 공유 캐시(ZOOM_EVENT_CACHE_BACKEND)가 필요
+ZOOM_PUSH_WORKERS = int(os.getenv('ZOOM_PUSH_WORKERS', '8'))  # 백그라운드 처리 스레드 수
+ZOOM_PUSH_MAX_PENDING = int(os.getenv('ZOOM_PUSH_MAX_PENDING', '16'))  # 처리 중+대기 프레임 최대 수 (초과 시 동기 처리)
+ZOOM_PUSH_EVENT_TTL = int(os.getenv('ZOOM_PUSH_EVENT_TTL', '120'))  # 이벤트 보관 시간(초)
+ZOOM_PUSH_MAX_BACKLOG = int(os.getenv('ZOOM_PUSH_MAX_BACKLOG', '50'))  # 재연결 시 다시 보낼 최대 이벤트 수
+ZOOM_PUSH_POLL_INTERVAL = float(os.getenv('ZOOM_PUSH_POLL_INTERVAL', '0.5'))
+ZOOM_PUSH_KEEPALIVE = int(os.getenv('ZOOM_PUSH_KEEPALIVE', '15'))
+ZOOM_PUSH_STREAM_TIMEOUT = int(os.getenv('ZOOM_PUSH_STREAM_TIMEOUT', '300'))  # 이후 클라이언트가 재연결
+ZOOM_PUSH_RETRY_MS = int(os.getenv('ZOOM_PUSH_RETRY_MS', '3000'))  # EventSource 재연결 대기
+
+# Zoom 세션 보고서
+#   요약 통계는 DB 집계 1회, 캡처 목록은 커서 페이지네이션 (?cursor=, ?page_size=, ?alerts_only=true)
+ZOOM_REPORT_PAGE_SIZE = int(os.getenv('ZOOM_REPORT_PAGE_SIZE', '50'))
+ZOOM_REPORT_MAX_PAGE_SIZE = int(os.getenv('ZOOM_REPORT_MAX_PAGE_SIZE', '200'))
+#   종료 후 ZOOM_REPORT_SNAPSHOT_GRACE 초가 지나면 보고서를 압축 스냅샷으로 저장하고 ETag/304 로 제공
+#   이미지 URL은 ZOOM_REPORT_RESIGN_INTERVAL 초마다 다시 서명 (AWS_PRESIGNED_URL_EXPIRATION 보다 짧게)
+ZOOM_REPORT_SNAPSHOT_GRACE = int(os.getenv('ZOOM_REPORT_SNAPSHOT_GRACE', '10'))
+ZOOM_REPORT_RESIGN_INTERVAL = int(os.getenv('ZOOM_REPORT_RESIGN_INTERVAL', '1800'))
+
+# Zoom 세션 마무리 (분석 워커에서 실행되는 AnalysisJob 'zoom_finalize')
+#   종료 ZOOM_FINALIZE_DELAY 초 뒤 안전 판정 캡처의 원본/기록을 요약 기록 1개로 압축하고 스냅샷 재생성
+ZOOM_FINALIZE_DELAY = int(os.getenv('ZOOM_FINALIZE_DELAY', '10'))
+ZOOM_FINALIZE_BATCH_SIZE = int(os.getenv('ZOOM_FINALIZE_BATCH_SIZE', '500'))
 
 FASTAPI_WATERMARK_URL = os.getenv('FASTAPI_WATERMARK_URL', 'http://localhost:8002')
 
@@ -269,6 +500,16 @@ AWS_STORAGE_BUCKET_NAME = os.getenv('AWS_STORAGE_BUCKET_NAME')
 AWS_REGION = os.getenv('AWS_REGION', 'ap-northeast-2')
 AWS_S3_CUSTOM_DOMAIN = f'{AWS_STORAGE_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com'
 
+# S3 클라이언트 종류: 'boto3' (실제 AWS) / 'memory' (로컬 벤치마크/테스트용 프로세스 메모리 저장소)
+AWS_S3_BACKEND = os.getenv('AWS_S3_BACKEND', 'boto3')
+
+# S3 클라이언트 (프로세스당 1개를 모든 요청/스레드가 공유)
+#   연결 풀은 동시 업로드/삭제 스레드 수 이상으로 (푸시 워커 + 요청 스레드)
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.getenv('AWS_S3_MAX_POOL_CONNECTIONS', '50'))
+AWS_S3_TCP_KEEPALIVE = os.getenv('AWS_S3_TCP_KEEPALIVE', 'True') == 'True'
+AWS_S3_RETRY_MODE = os.getenv('AWS_S3_RETRY_MODE', 'adaptive')  # legacy / standard / adaptive
+AWS_S3_MAX_ATTEMPTS = int(os.getenv('AWS_S3_MAX_ATTEMPTS', '5'))
+
 # S3 URL 만료 시간 (초)
 AWS_PRESIGNED_URL_EXPIRATION = 259200  # 1시간
 
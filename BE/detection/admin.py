@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import AnalysisRecord
+from .models import AnalysisRecord, AnalysisJob
 
 
 @admin.register(AnalysisRecord)
@@ -18,4 +18,24 @@ class AnalysisRecordAdmin(admin.ModelAdmin):
     list_filter = ['analysis_type', 'analysis_result', 'created_at']
     search_fields = ['user__email', 'file_name']
     readonly_fields = ['record_id', 'created_at', 'updated_at']
-    ordering = ['-created_at']
\ No newline at end of file
+    ordering = ['-created_at']
+
+
+@admin.register(AnalysisJob)
+class AnalysisJobAdmin(admin.ModelAdmin):
+    """분석 작업 관리자"""
+    
+    list_display = [
+        'job_id',
+        'user',
+        'job_type',
+        'status',
+        'attempts',
+        'locked_by',
+        'created_at',
+        'finished_at'
+    ]
+    list_filter = ['job_type', 'status', 'created_at']
+    search_fields = ['user__email']
+    readonly_fields = ['job_id', 'created_at', 'updated_at']
+    ordering = ['-created_at']
@@ -0,0 +1,174 @@
+import math
+import random
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+class AdmissionRejected(Exception):
+    """AI 추론 동시 실행 한도 초과 (429 / 503 + Retry-After)"""
+
+    def __init__(self, message, status_code, retry_after):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CacheSemaphore:
+    """
+    공유 캐시 기반 세마포어 (모든 워커 공유)
+
+    슬롯마다 cache.add 로 임대(lease)를 잡고 TTL을 두어
+    워커가 비정상 종료되어도 슬롯이 영구히 점유되지 않는다.
+    """
+
+    def __init__(self, name, limit, lease_ttl):
+        self.name = name
+        self.limit = limit
+        self.lease_ttl = lease_ttl
+
+    def try_acquire(self):
+        """
+        빈 슬롯 1개 점유
+
+        Returns:
+            tuple | None: (슬롯 번호, 토큰) 또는 빈 슬롯이 없으면 None
+        """
+        token = uuid.uuid4().hex
+        # 슬롯 탐색 시작 위치를 섞어 워커 간 경합을 줄인다
+        for index in random.sample(range(self.limit), self.limit):
+            if cache.add(self._slot_key(index), token, timeout=self.lease_ttl):
+                return index, token
+        return None
+
+    def release(self, lease):
+        index, token = lease
+        key = self._slot_key(index)
+        # 임대가 만료되어 다른 요청이 가져간 슬롯은 건드리지 않음
+        if cache.get(key) == token:
+            cache.delete(key)
+
+    def in_flight(self):
+        return len(cache.get_many([self._slot_key(i) for i in range(self.limit)]))
+
+    def _slot_key(self, index):
+        return f'ai:admission:{self.name}:slot:{index}'
+
+
+class AdmissionController:
+    """
+    AI 추론 동시 실행 제어 (분석 종류별 + 사용자별)
+
+    - 사용자 한도 초과: 대기 없이 429
+    - 분석 종류 한도 초과: 대기열에서 빈 슬롯을 기다리고,
+      대기열이 가득 찼거나 대기 시간/마감 시간을 넘기면 503
+    """
+
+    POLL_MIN = 0.01
+    POLL_MAX = 0.1
+
+    def __init__(self, profile, user_id):
+        self.profile = profile
+        lease_ttl = int(settings.AI_DEADLINES.get(profile, settings.AI_REQUEST_TIMEOUT)) + 30
+
+        self.semaphore = CacheSemaphore(
+            profile,
+            settings.AI_ADMISSION_LIMITS.get(profile, 1),
+            lease_ttl
+        )
+        self.user_semaphore = CacheSemaphore(
+            f'user:{user_id}',
+            settings.AI_ADMISSION_USER_LIMIT,
+            lease_ttl
+        )
+        self.max_queue = settings.AI_ADMISSION_MAX_QUEUE.get(profile, 0)
+        # 대기 요청도 만료되는 임대로 센다 (대기 중 워커가 죽어도 대기열 길이가 부풀지 않음)
+        self.queue_semaphore = CacheSemaphore(
+            f'{profile}:queue',
+            self.max_queue,
+            math.ceil(settings.AI_ADMISSION_MAX_WAIT) + 5
+        )
+
+    @contextmanager
+    def slot(self, deadline=None):
+        """
+        추론 슬롯 점유 후 실행
+
+        Raises:
+            AdmissionRejected: 한도 초과
+        """
+        if not settings.AI_ADMISSION_ENABLED:
+            yield
+            return
+
+        user_lease = self.user_semaphore.try_acquire()
+        if user_lease is None:
+            raise AdmissionRejected(
+                '동시에 진행 중인 분석이 너무 많습니다. 잠시 후 다시 시도해주세요.',
+                429,
+                settings.AI_ADMISSION_RETRY_AFTER
+            )
+
+        try:
+            lease = self.semaphore.try_acquire() or self._wait(deadline)
+            try:
+                yield
+            finally:
+                self.semaphore.release(lease)
+        finally:
+            self.user_semaphore.release(user_lease)
+
+    def stats(self):
+        """현재 처리 중/대기 중 요청 수"""
+        return {
+            'in_flight': self.semaphore.in_flight(),
+            'queued': self.queue_semaphore.in_flight(),
+            'limit': self.semaphore.limit,
+            'max_queue': self.max_queue,
+        }
+
+    def _wait(self, deadline):
+        """대기열에서 빈 슬롯 대기"""
+        queue_lease = self.queue_semaphore.try_acquire()
+        if queue_lease is None:
+            self._reject()
+
+        try:
+            max_wait = settings.AI_ADMISSION_MAX_WAIT
+            if deadline is not None:
+                max_wait = min(max_wait, deadline.remaining())
+            give_up_at = time.monotonic() + max_wait
+
+            delay = self.POLL_MIN
+            while time.monotonic() < give_up_at:
+                time.sleep(min(delay, max(0.0, give_up_at - time.monotonic())))
+                lease = self.semaphore.try_acquire()
+                if lease is not None:
+                    return lease
+                delay = min(self.POLL_MAX, delay * 2)
+
+            self._reject()
+        finally:
+            self.queue_semaphore.release(queue_lease)
+
+    def _reject(self):
+        raise AdmissionRejected(
+            'AI 서버가 혼잡합니다. 잠시 후 다시 시도해주세요.',
+            503,
+            settings.AI_ADMISSION_RETRY_AFTER
+        )
+
+
+def get_admission_stats():
+    """분석 종류별 처리 중/대기 중 요청 수 (모든 워커 합산)"""
+    return {
+        'enabled': settings.AI_ADMISSION_ENABLED,
+        'user_limit': settings.AI_ADMISSION_USER_LIMIT,
+        'profiles': {
+            profile: AdmissionController(profile, None).stats()
+            for profile in settings.AI_ADMISSION_LIMITS
+        },
+    }
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DetectionConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "detection"
+
+    def ready(self):
+        from . import checks  # noqa: F401 (시스템 체크 등록)
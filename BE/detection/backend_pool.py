@@ -0,0 +1,187 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .circuit_breaker import AICircuitBreaker
+
+
+class AIBackend:
+    """
+    AI 서버 백엔드 1대
+
+    상태(서킷 브레이커)와 복구 시각은 공유 캐시에 저장되어 모든 워커가 같이 보고,
+    처리 중 요청 수와 응답 시간은 워커 프로세스 단위로 집계된다.
+    """
+
+    LATENCY_ALPHA = 0.2  # 응답 시간 EWMA 가중치
+
+    def __init__(self, url):
+        self.url = url
+        self.breaker = AICircuitBreaker(name=url)
+        self.recovered_key = f'ai:backend:{url}:recovered_at'
+        self.outstanding = 0
+        self.latency = None  # EWMA (초)
+
+    def record_success(self):
+        """성공 기록 (장애에서 복구된 경우 slow-start 시작)"""
+        if self.breaker.record_success():
+            cache.set(self.recovered_key, time.time(), timeout=settings.AI_BACKEND_SLOW_START)
+
+    def record_failure(self, exc):
+        """요청 실패를 서킷 브레이커에 반영 (4xx는 서버 장애로 보지 않음)"""
+        response = getattr(exc, 'response', None)
+        if response is not None and response.status_code < 500:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def observe_latency(self, seconds):
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += self.LATENCY_ALPHA * (seconds - self.latency)
+
+
+class AIBackendPool:
+    """
+    AI 서버 풀 (least outstanding requests 라우팅)
+
+    - 처리 중 요청 수가 가장 적은 백엔드를 고른다.
+    - 오류율이 높아 서킷이 열린 백엔드는 제외(ejection)되고,
+      reset_timeout 이 지나면 탐색 요청 1개로 복구 여부를 확인한다.
+    - 복구 직후에는 AI_BACKEND_SLOW_START 동안 가중치를 점진적으로 올려
+      밀린 요청이 한꺼번에 몰리지 않게 한다.
+    """
+
+    def __init__(self, urls):
+        self.urls = list(urls)
+        self.backends = [AIBackend(url) for url in self.urls]
+        self._lock = threading.Lock()
+
+    def pick(self, exclude=()):
+        """
+        요청을 보낼 백엔드 선택
+
+        Args:
+            exclude: 가능하면 피할 백엔드 (재시도 시 직전에 실패한 백엔드)
+
+        Returns:
+            AIBackend | None: 사용 가능한 백엔드가 없으면 None
+        """
+        states = AICircuitBreaker.get_states([b.breaker for b in self.backends])
+
+        # 제외된 백엔드 중 복구 확인 시점이 된 것은 탐색 요청으로 사용
+        for backend in self.backends:
+            if backend in exclude or states[backend.url] == AICircuitBreaker.CLOSED:
+                continue
+            if backend.breaker.allow_request():
+                return backend
+
+        healthy = [b for b in self.backends if states[b.url] == AICircuitBreaker.CLOSED]
+        candidates = [b for b in healthy if b not in exclude] or healthy
+        if not candidates:
+            return None
+
+        weights = self._weights(candidates)
+        with self._lock:
+            return min(
+                candidates,
+                key=lambda b: ((b.outstanding + 1) / weights[b.url], random.random())
+            )
+
+    def has_healthy(self):
+        """정상(closed) 백엔드가 하나라도 있는지"""
+        states = AICircuitBreaker.get_states([b.breaker for b in self.backends])
+        return AICircuitBreaker.CLOSED in states.values()
+
+    @contextmanager
+    def track(self, backend):
+        """요청 처리 중 카운트 및 응답 시간 측정"""
+        with self._lock:
+            backend.outstanding += 1
+        start_time = time.monotonic()
+        try:
+            yield backend
+        finally:
+            elapsed = time.monotonic() - start_time
+            with self._lock:
+                backend.outstanding -= 1
+                backend.observe_latency(elapsed)
+
+    def stats(self):
+        """백엔드별 상태/처리 중 요청 수/응답 시간 게이지"""
+        weights = self._weights(self.backends)
+        result = []
+        for backend in self.backends:
+            snapshot = backend.breaker.snapshot()
+            result.append({
+                'url': backend.url,
+                'state': snapshot['state'],
+                'error_rate': snapshot['error_rate'],
+                'recent_requests': snapshot['recent_requests'],
+                'in_flight': backend.outstanding,
+                'latency_ms': round(backend.latency * 1000, 1) if backend.latency is not None else None,
+                'weight': round(weights[backend.url], 2),
+            })
+        return result
+
+    def health_snapshot(self):
+        """
+        풀 전체 상태
+
+        state: 모두 closed → closed, 모두 open → open, 일부만 정상 → half_open
+        """
+        backends = self.stats()
+        states = {b['state'] for b in backends}
+        if states == {AICircuitBreaker.CLOSED}:
+            state = AICircuitBreaker.CLOSED
+        elif states == {AICircuitBreaker.OPEN}:
+            state = AICircuitBreaker.OPEN
+        else:
+            state = AICircuitBreaker.HALF_OPEN
+
+        snapshots = [b.breaker.snapshot() for b in self.backends]
+        total = sum(s['recent_requests'] for s in snapshots)
+        errors = sum(s['recent_errors'] for s in snapshots)
+
+        return {
+            'state': state,
+            'recent_requests': total,
+            'recent_errors': errors,
+            'error_rate': round(errors / total, 4) if total else 0.0,
+            'window_seconds': settings.AI_BREAKER_WINDOW,
+            'backends': backends,
+        }
+
+    def _weights(self, backends):
+        """slow-start 가중치 (복구 직후 AI_BACKEND_SLOW_START_MIN_WEIGHT → 1.0)"""
+        recovered = cache.get_many([b.recovered_key for b in backends])
+        now = time.time()
+        weights = {}
+        for backend in backends:
+            recovered_at = recovered.get(backend.recovered_key)
+            if recovered_at is None or settings.AI_BACKEND_SLOW_START <= 0:
+                weights[backend.url] = 1.0
+                continue
+            ramp = (now - recovered_at) / settings.AI_BACKEND_SLOW_START
+            weights[backend.url] = min(1.0, max(settings.AI_BACKEND_SLOW_START_MIN_WEIGHT, ramp))
+        return weights
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_backend_pool():
+    """프로세스 공유 백엔드 풀 (FASTAPI_URL 목록이 바뀌면 다시 생성)"""
+    global _pool
+
+    if _pool is None or _pool.urls != settings.FASTAPI_URLS:
+        with _pool_lock:
+            if _pool is None or _pool.urls != settings.FASTAPI_URLS:
+                _pool = AIBackendPool(settings.FASTAPI_URLS)
+    return _pool
@@ -0,0 +1,169 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+from .http_client import get_ai_session, get_ai_timeout
+
+
+class InferenceBatcher:
+    """
+    AI 추론 요청 마이크로 배칭
+
+    한 백엔드로 향하는 여러 요청 스레드(세션)의 이미지 분석 요청을 모아
+    최대 batch_size 개 또는 max_wait 경과 시점에 한 번의
+    /detect_deepfake 배치 호출로 보내고, 결과를 각 요청에 돌려준다.
+
+    배치 요청/응답 형식:
+        요청: {"request_version": ..., "InputUrls": [url, ...]}
+        응답: {"results": [{"face_count": int, "face_quality_scores": [...]}, ...]}
+              (InputUrls 와 같은 순서)
+    """
+
+    BATCHES_KEY = 'ai:batch:batches'
+    ITEMS_KEY = 'ai:batch:items'
+
+    def __init__(self, fastapi_url, max_size=None, max_wait_ms=None):
+        self.fastapi_url = fastapi_url
+        self.max_size = max_size or settings.AI_BATCH_MAX_SIZE
+        self.max_wait = (max_wait_ms or settings.AI_BATCH_MAX_WAIT_MS) / 1000
+        self._queue = queue.Queue()
+        # 배치 호출이 끝나기를 기다리는 동안에도 다음 배치를 모을 수 있도록 별도 풀에서 전송
+        self._senders = ThreadPoolExecutor(
+            max_workers=settings.AI_BATCH_MAX_INFLIGHT,
+            thread_name_prefix='ai-batch-sender'
+        )
+        self._thread = threading.Thread(
+            target=self._run,
+            name='ai-inference-batcher',
+            daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, input_url):
+        """분석 요청 등록 → Future (결과 dict)"""
+        future = Future()
+        self._queue.put((input_url, future))
+        return future
+
+    def analyze(self, input_url, timeout=None):
+        """
+        분석 요청 후 결과 대기
+
+        Raises:
+            requests.exceptions.RequestException: 배치 호출 실패 또는 대기 시간 초과
+        """
+        future = self.submit(input_url)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # 아직 배치로 보내지 않은 요청이면 취소 (호출한 쪽은 이미 실패 처리하므로 AI 서버로 보내지 않음)
+            future.cancel()
+            raise requests.exceptions.Timeout('배치 추론 대기 시간 초과')
+
+    # ------------------------------------------------------------------
+    # 디스패처
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item[1].cancelled():
+                # 대기 시간 초과로 취소된 요청은 배치 자리를 차지하지 않음
+                continue
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if not item[1].cancelled():
+                    batch.append(item)
+
+            self._senders.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch):
+        # 배치를 모은 뒤 전송 전까지 취소된 요청도 제외
+        batch = [(url, future) for url, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        try:
+            results = self._post_batch([url for url, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+        self._incr(self.BATCHES_KEY, 1)
+        self._incr(self.ITEMS_KEY, len(batch))
+
+    def _post_batch(self, input_urls):
+        response = get_ai_session().post(
+            f"{self.fastapi_url}/detect_deepfake",
+            json={
+                "request_version": "Multi Person Deepfake detection",
+                "InputUrls": input_urls
+            },
+            timeout=get_ai_timeout()
+        )
+        response.raise_for_status()
+
+        results = response.json().get('results', [])
+        if len(results) != len(input_urls):
+            raise requests.exceptions.RequestException(
+                f'배치 응답 개수 불일치: {len(results)}/{len(input_urls)}'
+            )
+        return results
+
+    def _incr(self, key, delta):
+        if not cache.add(key, delta, timeout=None):
+            try:
+                cache.incr(key, delta)
+            except ValueError:
+                cache.set(key, delta, timeout=None)
+
+
+def get_batch_stats():
+    """배치 통계 (전체 워커 합산, 배처 스레드를 시작하지 않음)"""
+    values = cache.get_many([InferenceBatcher.BATCHES_KEY, InferenceBatcher.ITEMS_KEY])
+    batches = values.get(InferenceBatcher.BATCHES_KEY, 0)
+    items = values.get(InferenceBatcher.ITEMS_KEY, 0)
+    max_size = settings.AI_BATCH_MAX_SIZE
+    avg_size = items / batches if batches else 0.0
+
+    return {
+        'enabled': settings.AI_BATCH_ENABLED,
+        'max_size': max_size,
+        'max_wait_ms': settings.AI_BATCH_MAX_WAIT_MS,
+        'batches': batches,
+        'items': items,
+        'avg_batch_size': round(avg_size, 2),
+        'avg_fill_ratio': round(avg_size / max_size, 4) if max_size else 0.0,
+    }
+
+
+_batchers = {}
+_batcher_lock = threading.Lock()
+
+
+def get_batcher(fastapi_url):
+    """백엔드별 프로세스 공유 배처 (최초 사용 시 디스패처 스레드 시작)"""
+    batcher = _batchers.get(fastapi_url)
+    if batcher is None:
+        with _batcher_lock:
+            batcher = _batchers.get(fastapi_url)
+            if batcher is None:
+                batcher = _batchers[fastapi_url] = InferenceBatcher(fastapi_url)
+    return batcher
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+# 워커(프로세스)마다 따로 저장되는 캐시 백엔드
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_process_local_cache(alias):
+    """캐시가 워커 간에 공유되지 않는지 여부"""
+    return settings.CACHES[alias]['BACKEND'] in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """어드미션 컨트롤/서킷 브레이커는 공유 캐시가 있어야 워커 전체 기준으로 동작"""
+    if settings.DEBUG or not is_process_local_cache('default'):
+        return []
+
+    hint = 'AI 서킷 브레이커 상태가 워커마다 따로 관리되어 장애 감지가 워커별로 늦어집니다. '
+    if settings.AI_ADMISSION_ENABLED:
+        hint += '어드미션 컨트롤 슬롯/대기열도 워커마다 따로 세므로 동시 실행 한도가 워커 수만큼 늘어납니다. '
+    return [
+        Warning(
+            f"'default' 캐시가 프로세스 로컬 캐시({settings.CACHES['default']['BACKEND']})입니다.",
+            hint=hint + '워커가 여러 개면 CACHE_BACKEND 를 Redis 등 공유 백엔드로 지정하세요.',
+            id='detection.W001',
+        )
+    ]
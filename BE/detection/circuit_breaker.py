@@ -0,0 +1,160 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+class AICircuitBreaker:
+    """
+    AI 서버 서킷 브레이커 (closed / open / half_open)
+
+    실제 요청 결과로 상태가 갱신되며, 상태와 최근 성공/실패 카운터는
+    공유 캐시에 TTL과 함께 저장되어 모든 워커가 같은 상태를 본다.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    BUCKET_COUNT = 6  # 집계 윈도우를 나누는 버킷 수
+
+    def __init__(self, name='default'):
+        self.name = name
+        self.window = settings.AI_BREAKER_WINDOW
+        self.bucket_size = max(1, self.window // self.BUCKET_COUNT)
+        self.error_threshold = settings.AI_BREAKER_ERROR_THRESHOLD
+        self.min_requests = settings.AI_BREAKER_MIN_REQUESTS
+        self.reset_timeout = settings.AI_BREAKER_RESET_TIMEOUT
+        self.state_ttl = settings.AI_HEALTH_CACHE_TTL
+
+    # ------------------------------------------------------------------
+    # 요청 전/후 훅
+    # ------------------------------------------------------------------
+    def allow_request(self):
+        """요청을 AI 서버로 보내도 되는지 여부"""
+        state = self._get_state()
+
+        if state['state'] == self.CLOSED:
+            return True
+
+        if state['state'] == self.OPEN:
+            if time.time() - state['opened_at'] < self.reset_timeout:
+                return False
+            # 대기 시간이 지나면 half_open 으로 전환 후 탐색 요청 1개 허용
+            self._set_state(self.HALF_OPEN, opened_at=state['opened_at'])
+
+        # half_open: 탐색 요청은 워커 전체에서 1개만 허용
+        return cache.add(self._key('probe'), 1, timeout=max(self.reset_timeout, 1))
+
+    def is_closed(self):
+        """정상(closed) 상태 여부 (probe 슬롯을 소비하지 않음)"""
+        return self._get_state()['state'] == self.CLOSED
+
+    def record_success(self):
+        """
+        성공한 요청 기록
+
+        Returns:
+            bool: 이번 요청으로 open/half_open → closed 로 복구되었는지 여부
+        """
+        self._incr_bucket('ok')
+
+        if self._get_state()['state'] != self.CLOSED:
+            self._set_state(self.CLOSED)
+            cache.delete(self._key('probe'))
+            return True
+        return False
+
+    def record_failure(self):
+        """실패한 요청 기록 (연결 오류, 타임아웃, 5xx)"""
+        self._incr_bucket('err')
+
+        state = self._get_state()
+        if state['state'] == self.HALF_OPEN:
+            self._open()
+            return
+
+        if state['state'] == self.CLOSED:
+            ok, err = self._window_counts()
+            total = ok + err
+            if total >= self.min_requests and err / total >= self.error_threshold:
+                self._open()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def snapshot(self):
+        """현재 브레이커 상태 및 최근 오류율"""
+        state = self._get_state()
+        ok, err = self._window_counts()
+        total = ok + err
+
+        return {
+            'state': state['state'],
+            'opened_at': state['opened_at'],
+            'recent_requests': total,
+            'recent_errors': err,
+            'error_rate': round(err / total, 4) if total else 0.0,
+            'window_seconds': self.window,
+        }
+
+    @classmethod
+    def get_states(cls, breakers):
+        """여러 브레이커의 상태를 한 번에 조회 → {name: state}"""
+        keys = {breaker._key('state'): breaker.name for breaker in breakers}
+        values = cache.get_many(list(keys))
+        return {
+            name: (values.get(key) or {'state': cls.CLOSED})['state']
+            for key, name in keys.items()
+        }
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _key(self, suffix):
+        return f'ai:breaker:{self.name}:{suffix}'
+
+    def _get_state(self):
+        return cache.get(self._key('state')) or {
+            'state': self.CLOSED,
+            'opened_at': None,
+        }
+
+    def _set_state(self, state, opened_at=None):
+        # 열린 상태는 reset_timeout 이상 유지되어야 하므로 TTL을 넉넉히 준다
+        ttl = max(self.state_ttl, self.reset_timeout * 2)
+        cache.set(
+            self._key('state'),
+            {'state': state, 'opened_at': opened_at},
+            timeout=ttl
+        )
+
+    def _open(self):
+        self._set_state(self.OPEN, opened_at=time.time())
+        cache.delete(self._key('probe'))
+
+    def _bucket_id(self, now=None):
+        return int((now or time.time()) // self.bucket_size)
+
+    def _incr_bucket(self, kind):
+        key = self._key(f'{kind}:{self._bucket_id()}')
+        # 버킷은 윈도우가 지나면 자연스럽게 만료된다
+        if not cache.add(key, 1, timeout=self.window + self.bucket_size):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, timeout=self.window + self.bucket_size)
+
+    def _window_counts(self):
+        current = self._bucket_id()
+        bucket_ids = range(current - self.BUCKET_COUNT + 1, current + 1)
+
+        keys = []
+        for bucket_id in bucket_ids:
+            keys.append(self._key(f'ok:{bucket_id}'))
+            keys.append(self._key(f'err:{bucket_id}'))
+
+        values = cache.get_many(keys)
+        ok = sum(v for k, v in values.items() if ':ok:' in k)
+        err = sum(v for k, v in values.items() if ':err:' in k)
+        return ok, err
@@ -0,0 +1,67 @@
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_ai_session():
+    """
+    AI 서버 호출용 공유 HTTP 세션 반환 (워커 프로세스당 1개)
+
+    keep-alive 커넥션 풀을 재사용하므로 캡처/업로드마다
+    TCP(및 TLS) 핸드셰이크를 다시 하지 않는다.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get_ai_timeout(read_timeout=None):
+    """(connect, read) 타임아웃 튜플 생성"""
+    if read_timeout is None:
+        read_timeout = settings.AI_READ_TIMEOUT
+    return (settings.AI_CONNECT_TIMEOUT, read_timeout)
+
+
+def reset_ai_session():
+    """공유 세션 종료 (설정 변경/테스트용)"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def _build_session():
+    """커넥션 풀 및 재시도 정책이 적용된 세션 생성"""
+    retry = Retry(
+        total=settings.AI_HTTP_MAX_RETRIES,
+        connect=settings.AI_HTTP_MAX_RETRIES,
+        read=0,  # 추론 요청은 읽기 단계에서 재전송하지 않음
+        backoff_factor=settings.AI_HTTP_BACKOFF_FACTOR,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        # 백엔드(호스트)마다 커넥션 풀 1개가 필요
+        pool_connections=max(settings.AI_HTTP_POOL_CONNECTIONS, len(settings.FASTAPI_URLS)),
+        pool_maxsize=settings.AI_HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
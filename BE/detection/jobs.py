@@ -0,0 +1,247 @@
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from media_files.models import SystemLog
+from media_files.write_buffer import get_write_buffer
+from .admission import AdmissionRejected
+from .models import AnalysisJob
+from .pipeline import DetectionPipeline
+
+
+def get_worker_id():
+    """현재 워커 식별자 (호스트:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_video_analysis(user, media_file, input_url=None):
+    """
+    영상 분석 작업 등록
+
+    Args:
+        user: 요청 사용자
+        media_file: 업로드가 끝난 MediaFile
+        input_url: 로컬 저장 파일인 경우 AI 서버가 내려받을 절대 URL
+
+    Returns:
+        AnalysisJob: 등록된 작업
+    """
+    return AnalysisJob.objects.create(
+        user=user,
+        job_type='video',
+        media_file=media_file,
+        payload={'input_url': input_url} if input_url else {},
+        max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+        available_at=timezone.now()
+    )
+
+
+def enqueue_zoom_finalization(session):
+    """
+    Zoom 세션 마무리 작업 등록
+
+    다른 워커의 쓰기 버퍼/백그라운드 캡처가 반영되도록 ZOOM_FINALIZE_DELAY 초 뒤에 실행한다.
+
+    Returns:
+        AnalysisJob: 등록된 작업
+    """
+    return AnalysisJob.objects.create(
+        user=session.user,
+        job_type='zoom_finalize',
+        payload={'session_id': session.session_id},
+        max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+        available_at=timezone.now() + timedelta(seconds=settings.ZOOM_FINALIZE_DELAY)
+    )
+
+
+def claim_next_job(worker_id=None):
+    """
+    실행 가능한 작업 1개를 잠그고 running 상태로 전환
+
+    여러 워커가 동시에 돌아도 같은 작업을 가져가지 않도록
+    SELECT ... FOR UPDATE SKIP LOCKED 로 조회한다.
+
+    Returns:
+        AnalysisJob | None
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        job = (
+            AnalysisJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(status='queued', available_at__lte=now)
+            .order_by('available_at', 'job_id')
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.status = 'running'
+        job.attempts += 1
+        job.locked_by = worker_id or get_worker_id()
+        job.locked_at = now
+        job.started_at = job.started_at or now
+        job.save(update_fields=[
+            'status', 'attempts', 'locked_by', 'locked_at', 'started_at', 'updated_at'
+        ])
+        return job
+
+
+def requeue_stale_jobs():
+    """
+    잠금 시간이 초과된 running 작업을 다시 대기열로 (워커 비정상 종료 대비)
+
+    Returns:
+        int: 재등록된 작업 수
+    """
+    threshold = timezone.now() - timedelta(seconds=settings.ANALYSIS_JOB_LOCK_TIMEOUT)
+
+    return AnalysisJob.objects.filter(
+        status='running',
+        locked_at__lt=threshold
+    ).update(status='queued', locked_by=None, locked_at=None, available_at=timezone.now())
+
+
+def touch_job(job):
+    """
+    실행 중인 작업의 잠금 시간 갱신
+
+    Returns:
+        bool: 아직 이 워커가 잡고 있는 작업이면 True
+    """
+    return AnalysisJob.objects.filter(
+        pk=job.pk,
+        status='running',
+        locked_by=job.locked_by
+    ).update(locked_at=timezone.now()) > 0
+
+
+@contextmanager
+def _heartbeat(job):
+    """
+    실행 중 LOCK_TIMEOUT/3 마다 locked_at 갱신
+
+    재시도·헤지로 추론이 길어져도 requeue_stale_jobs 가 작업을 다른 워커에 넘기지 않도록 한다.
+    """
+    stop = threading.Event()
+    interval = settings.ANALYSIS_JOB_LOCK_TIMEOUT / 3
+
+    def beat():
+        try:
+            while not stop.wait(interval):
+                touch_job(job)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f'job-heartbeat-{job.pk}', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def process_job(job):
+    """
+    작업 1개 실행 후 결과 저장
+
+    Returns:
+        AnalysisJob: 갱신된 작업
+    """
+    try:
+        with _heartbeat(job):
+            if job.job_type == 'video':
+                record = _run_video_analysis(job)
+            elif job.job_type == 'zoom_finalize':
+                record = _run_zoom_finalization(job)
+            else:
+                raise ValueError(f"지원하지 않는 작업 유형입니다: {job.job_type}")
+    except AdmissionRejected as e:
+        # AI 서버 혼잡: 재시도 횟수를 소모하지 않고 잠시 후 다시 실행
+        return _defer_job(job, e.retry_after)
+    except Exception as e:
+        return _fail_job(job, str(e))
+
+    job.status = 'completed'
+    job.record = record
+    job.error_message = None
+    job.locked_by = None
+    job.finished_at = timezone.now()
+    job.save(update_fields=[
+        'status', 'record', 'error_message', 'locked_by', 'finished_at', 'updated_at'
+    ])
+    return job
+
+
+def _defer_job(job, delay):
+    """실행을 미루고 대기열로 되돌림 (재시도 횟수 미차감)"""
+    job.status = 'queued'
+    job.attempts -= 1
+    job.locked_by = None
+    job.available_at = timezone.now() + timedelta(seconds=delay)
+    job.save(update_fields=[
+        'status', 'attempts', 'locked_by', 'available_at', 'updated_at'
+    ])
+    return job
+
+
+def _fail_job(job, error_message):
+    """실패 처리 (재시도 가능하면 지수 백오프 후 재등록)"""
+    job.error_message = error_message
+    job.locked_by = None
+
+    if job.attempts < job.max_attempts:
+        delay = settings.ANALYSIS_JOB_RETRY_DELAY * (2 ** (job.attempts - 1))
+        job.status = 'queued'
+        job.available_at = timezone.now() + timedelta(seconds=delay)
+    else:
+        job.status = 'failed'
+        job.finished_at = timezone.now()
+
+        get_write_buffer().create(
+            SystemLog,
+            user=job.user,
+            log_level='error',
+            log_category='detection',
+            message=f'분석 작업 실패: #{job.job_id} {error_message}',
+            error_code='ANALYSIS_JOB_FAILED',
+            request_data={'job_id': job.job_id, 'attempts': job.attempts}
+        )
+
+    job.save(update_fields=[
+        'status', 'error_message', 'locked_by', 'available_at', 'finished_at', 'updated_at'
+    ])
+    return job
+
+
+def _run_video_analysis(job):
+    """영상 분석 실행 및 AnalysisRecord 생성"""
+    media_file = job.media_file
+    if media_file is None or media_file.is_deleted:
+        raise ValueError("분석 대상 파일을 찾을 수 없습니다.")
+
+    pipeline = DetectionPipeline(job.user, profile='video')
+    input_url = pipeline.locate(media_file, input_url=(job.payload or {}).get('input_url'))
+    output = pipeline.analyze(media_file, input_url, 'video', kind='video')
+    return output['record']
+
+
+def _run_zoom_finalization(job):
+    """Zoom 세션 마무리 실행 (요약 기록 반환)"""
+    from zoom.finalize import finalize_session
+    from zoom.models import ZoomSession
+
+    try:
+        session = ZoomSession.objects.get(session_id=(job.payload or {}).get('session_id'))
+    except ZoomSession.DoesNotExist:
+        raise ValueError("마무리할 세션을 찾을 수 없습니다.")
+
+    return finalize_session(session)
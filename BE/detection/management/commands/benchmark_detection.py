@@ -0,0 +1,264 @@
+import io
+import itertools
+import math
+import threading
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+from PIL import Image, ImageDraw
+from rest_framework.test import APIClient
+
+from detection.stub_server import StubAIServer, add_stub_arguments, config_from_options
+from media_files.write_buffer import get_write_buffer
+from users.models import User
+
+
+def percentile(sorted_values, pct):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    """
+    탐지 API 부하 벤치마크 (한 대의 Linux 서버에서 실행)
+
+    ImageAnalysisView / VideoAnalysisView / ZoomCaptureView / ZoomFrameView 를 지정한 동시성으로
+    호출하고 처리량, p50/p95/p99 지연 시간, 요청당 서버 CPU 시간을 출력한다.
+    (APIClient 는 요청 스레드에서 뷰를 실행하므로 스레드 CPU 시간 = 요청 처리 CPU 시간.
+     zoom 은 multipart 캡처, zoom-raw 는 원본 프레임 본문 전송)
+    --stub 옵션으로 스텁 AI 서버를 같은 프로세스에서 띄우고,
+    S3 는 기본적으로 프로세스 메모리 저장소(AWS_S3_BACKEND='memory')를 사용한다.
+
+    사용법:
+        python manage.py benchmark_detection --stub --concurrency 16 --requests 200
+        python manage.py benchmark_detection --endpoints image zoom --stub --stub-latency lognormal:120:0.4
+        python manage.py benchmark_detection --endpoints zoom zoom-raw --stub --image-size 1920x1080
+    """
+
+    help = '탐지 API(이미지/영상/Zoom)의 처리량과 지연 시간을 측정합니다.'
+
+    ENDPOINTS = ('image', 'video', 'zoom', 'zoom-raw')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--endpoints', nargs='+', choices=self.ENDPOINTS,
+                            default=list(self.ENDPOINTS), help='측정할 API')
+        parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수')
+        parser.add_argument('--requests', type=int, default=100, help='API별 요청 수')
+        parser.add_argument('--image-size', default='1280x720', help='이미지 크기 WxH')
+        parser.add_argument('--video-kb', type=int, default=512, help='영상 파일 크기(KB)')
+        parser.add_argument('--sync-video', action='store_true',
+                            help='영상 분석을 동기 모드로 측정 (VIDEO_ANALYSIS_ASYNC=False)')
+        parser.add_argument('--reuse-content', action='store_true',
+                            help='모든 요청에 같은 이미지 사용 (결과 캐시 히트 측정)')
+        parser.add_argument('--s3', choices=['memory', 'boto3'], default='memory',
+                            help='S3 클라이언트 (기본: 프로세스 메모리)')
+        parser.add_argument('--keep-data', action='store_true',
+                            help='벤치마크 사용자/기록을 삭제하지 않음')
+        parser.add_argument('--stub', action='store_true',
+                            help='스텁 AI 서버를 같은 프로세스에서 실행')
+        parser.add_argument('--stub-host', default='127.0.0.1')
+        parser.add_argument('--stub-port', type=int, default=0, help='0이면 빈 포트 사용')
+        add_stub_arguments(parser, prefix='stub-')
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency']
+        overrides = {
+            'ALLOWED_HOSTS': list(settings.ALLOWED_HOSTS) + ['testserver'],
+            'AWS_S3_BACKEND': options['s3'],
+        }
+        if options['sync_video']:
+            overrides['VIDEO_ANALYSIS_ASYNC'] = False
+        if options['s3'] == 'memory' and not settings.AWS_STORAGE_BUCKET_NAME:
+            overrides['AWS_STORAGE_BUCKET_NAME'] = 'benchmark'
+
+        server = None
+        if options['stub']:
+            server = StubAIServer(
+                options['stub_host'],
+                options['stub_port'],
+                config=config_from_options(options, prefix='stub-')
+            )
+            server.start_in_thread()
+            overrides['FASTAPI_URLS'] = [server.url]
+            overrides['FASTAPI_URL'] = server.url
+            self.stdout.write(f'스텁 AI 서버: {server.url}')
+
+        run_id = uuid.uuid4().hex[:8]
+        users = [
+            User.objects.create_user(
+                email=f'benchmark-{run_id}-{i}@localhost',
+                nickname=f'benchmark-{i}'
+            )
+            for i in range(concurrency)
+        ]
+
+        try:
+            with override_settings(**overrides):
+                for endpoint in options['endpoints']:
+                    payloads = self._build_payloads(endpoint, options)
+                    result = self._run(endpoint, users, payloads, concurrency)
+                    self._report(endpoint, result)
+
+            if server is not None:
+                self.stdout.write(f'스텁 AI 서버 통계: {server.stats.snapshot()}')
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+            # 쓰기 버퍼에 남은 로그/카운터를 사용자 삭제 전에 반영
+            get_write_buffer().flush()
+            if not options['keep_data']:
+                User.objects.filter(user_id__in=[u.user_id for u in users]).delete()
+
+    # ------------------------------------------------------------------
+    # 요청 데이터
+    # ------------------------------------------------------------------
+    def _build_payloads(self, endpoint, options):
+        """요청 본문 미리 생성 (측정 시간에서 제외)"""
+        total = options['requests']
+
+        if endpoint == 'video':
+            size = options['video_kb'] * 1024
+            return [
+                (f'{i}'.encode().ljust(16, b'\0') + b'\0' * (size - 16), 'video/mp4', 'clip.mp4')
+                for i in range(total)
+            ]
+
+        width, height = (int(n) for n in options['image_size'].split('x'))
+        base = Image.effect_noise((width, height), 64).convert('RGB')
+        count = 1 if options['reuse_content'] else total
+
+        images = []
+        for i in range(count):
+            img = base.copy()
+            # 요청마다 다른 위치/색의 사각형 → 서로 다른 바이트 (결과 캐시 미스)
+            ImageDraw.Draw(img).rectangle(
+                [(i * 37) % width, (i * 53) % height, (i * 37) % width + 40, (i * 53) % height + 40],
+                fill=((i * 7) % 256, (i * 13) % 256, (i * 29) % 256)
+            )
+            buffer = io.BytesIO()
+            img.save(buffer, 'JPEG', quality=85)
+            images.append((buffer.getvalue(), 'image/jpeg', 'frame.jpg'))
+
+        return [images[i % count] for i in range(total)]
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def _run(self, endpoint, users, payloads, concurrency):
+        counter = itertools.count()
+        latencies = []
+        cpu_times = []
+        statuses = Counter()
+        lock = threading.Lock()
+
+        def worker(user):
+            client = APIClient()
+            client.force_authenticate(user)
+            try:
+                session_id = None
+                if endpoint in ('zoom', 'zoom-raw'):
+                    response = client.post(
+                        '/api/zoom/sessions/start/',
+                        {'session_name': 'benchmark'},
+                        format='json'
+                    )
+                    session_id = response.data['session_id']
+
+                while True:
+                    index = next(counter)
+                    if index >= len(payloads):
+                        break
+
+                    content, content_type, name = payloads[index]
+                    upload = SimpleUploadedFile(name, content, content_type)
+
+                    start_time = time.perf_counter()
+                    start_cpu = time.thread_time()
+                    if endpoint == 'image':
+                        response = client.post(
+                            '/api/detection/image/',
+                            {'image': upload, 'analysis_type': 'image'},
+                            format='multipart'
+                        )
+                    elif endpoint == 'video':
+                        response = client.post(
+                            '/api/detection/video/',
+                            {'video': upload},
+                            format='multipart'
+                        )
+                    elif endpoint == 'zoom':
+                        response = client.post(
+                            f'/api/zoom/sessions/{session_id}/capture/',
+                            {'screenshot': upload, 'participant_count': 2},
+                            format='multipart'
+                        )
+                    else:
+                        response = client.post(
+                            f'/api/zoom/sessions/{session_id}/frames/?participant_count=2',
+                            content,
+                            content_type=content_type
+                        )
+                    elapsed = time.perf_counter() - start_time
+                    cpu = time.thread_time() - start_cpu
+
+                    with lock:
+                        latencies.append(elapsed)
+                        cpu_times.append(cpu)
+                        statuses[response.status_code] += 1
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(users[i],), name=f'benchmark-{i}')
+            for i in range(concurrency)
+        ]
+
+        start_time = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall_time = time.perf_counter() - start_time
+
+        return {
+            'latencies': sorted(latencies),
+            'cpu_times': sorted(cpu_times),
+            'statuses': statuses,
+            'wall_time': wall_time,
+        }
+
+    def _report(self, endpoint, result):
+        latencies = result['latencies']
+        count = len(latencies)
+        ok = sum(n for code, n in result['statuses'].items() if 200 <= code < 300)
+        throughput = count / result['wall_time'] if result['wall_time'] else 0.0
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'[{endpoint}]'))
+        self.stdout.write(
+            f'  요청 {count}건 (성공 {ok}), 상태 코드 {dict(sorted(result["statuses"].items()))}'
+        )
+        self.stdout.write(f'  처리량 {throughput:.1f} req/s (총 {result["wall_time"]:.2f}s)')
+        self.stdout.write(
+            '  지연 시간(ms) '
+            f'p50={percentile(latencies, 50) * 1000:.1f} '
+            f'p95={percentile(latencies, 95) * 1000:.1f} '
+            f'p99={percentile(latencies, 99) * 1000:.1f} '
+            f'max={(latencies[-1] if latencies else 0) * 1000:.1f}'
+        )
+        cpu_times = result['cpu_times']
+        self.stdout.write(
+            '  요청당 CPU(ms) '
+            f'avg={(sum(cpu_times) / count if count else 0) * 1000:.2f} '
+            f'p50={percentile(cpu_times, 50) * 1000:.2f} '
+            f'p95={percentile(cpu_times, 95) * 1000:.2f}'
+        )
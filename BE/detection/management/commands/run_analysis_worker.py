@@ -0,0 +1,66 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from detection.jobs import claim_next_job, get_worker_id, process_job, requeue_stale_jobs
+
+
+class Command(BaseCommand):
+    """
+    DB 작업 큐 워커 (외부 브로커 없이 로컬 실행)
+
+    사용법:
+        python manage.py run_analysis_worker
+        python manage.py run_analysis_worker --once
+    """
+
+    help = '대기 중인 분석 작업(AnalysisJob)을 처리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='대기 작업이 없을 때 재조회 간격(초)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='현재 대기 중인 작업만 처리하고 종료'
+        )
+
+    def handle(self, *args, **options):
+        poll_interval = options['poll_interval']
+        worker_id = get_worker_id()
+        self._stopping = False
+
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        self.stdout.write(f'분석 워커 시작: {worker_id}')
+
+        while not self._stopping:
+            close_old_connections()
+
+            requeued = requeue_stale_jobs()
+            if requeued:
+                self.stdout.write(f'잠금 만료 작업 재등록: {requeued}개')
+
+            job = claim_next_job(worker_id)
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            self.stdout.write(f'작업 처리 시작: #{job.job_id} ({job.job_type})')
+            job = process_job(job)
+            self.stdout.write(f'작업 처리 종료: #{job.job_id} → {job.status}')
+
+        self.stdout.write('분석 워커 종료')
+
+    def _request_stop(self, signum, frame):
+        """현재 작업을 마친 뒤 종료"""
+        self._stopping = True
@@ -0,0 +1,46 @@
+# Generated by Django 5.1 on 2026-10-17 01:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('detection', '0003_analysisrecord_detection_details_and_more'),
+        ('media_files', '0003_mediafile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalysisJob',
+            fields=[
+                ('job_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('job_type', models.CharField(choices=[('video', '영상 분석')], max_length=20, verbose_name='작업 유형')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '처리 중'), ('completed', '완료'), ('failed', '실패')], default='queued', max_length=20, verbose_name='작업 상태')),
+                ('payload', models.JSONField(blank=True, null=True, verbose_name='작업 데이터')),
+                ('error_message', models.TextField(blank=True, null=True, verbose_name='오류 메시지')),
+                ('attempts', models.IntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.IntegerField(default=3, verbose_name='최대 시도 횟수')),
+                ('available_at', models.DateTimeField(verbose_name='실행 가능 시각')),
+                ('locked_by', models.CharField(blank=True, max_length=100, null=True, verbose_name='처리 워커')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='잠금 시각')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('media_file', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='analysis_jobs', to='media_files.mediafile', verbose_name='분석 대상 파일')),
+                ('record', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='detection.analysisrecord', verbose_name='분석 기록')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='analysis_jobs', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '분석 작업',
+                'verbose_name_plural': '분석 작업 목록',
+                'db_table': 'analysis_jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='analysis_jo_status_53c978_idx'), models.Index(fields=['user', '-created_at'], name='analysis_jo_user_id_d17b83_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-17 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('detection', '0004_analysisjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisrecord',
+            name='processing_stages',
+            field=models.JSONField(blank=True, help_text='{"upload": 120, "locate": 3, "infer": 850, "rewrite": 2, "score": 0}', null=True, verbose_name='단계별 처리 시간(ms)'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-17 02:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('detection', '0005_analysisrecord_processing_stages'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='analysisjob',
+            name='job_type',
+            field=models.CharField(choices=[('video', '영상 분석'), ('zoom_finalize', 'Zoom 세션 마무리')], max_length=20, verbose_name='작업 유형'),
+        ),
+    ]
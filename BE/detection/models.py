@@ -63,6 +63,12 @@ class AnalysisRecord(models.Model):
     )
     
     processing_time = models.IntegerField(verbose_name='처리 시간(ms)')
+    processing_stages = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name='단계별 처리 시간(ms)',
+        help_text='{"upload": 120, "locate": 3, "infer": 850, "rewrite": 2, "score": 0}'
+    )
     ai_model_version = models.CharField(max_length=50, verbose_name='AI 모델 버전')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
@@ -79,4 +85,81 @@ class AnalysisRecord(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.file_name} - {self.get_analysis_result_display()}"
\ No newline at end of file
+        return f"{self.file_name} - {self.get_analysis_result_display()}"
+
+class AnalysisJob(models.Model):
+    """비동기 분석 작업 (DB 기반 작업 큐)"""
+    
+    JOB_TYPE_CHOICES = [
+        ('video', '영상 분석'),
+        ('zoom_finalize', 'Zoom 세션 마무리'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('queued', '대기'),
+        ('running', '처리 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    job_id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='analysis_jobs',
+        verbose_name='사용자'
+    )
+    job_type = models.CharField(
+        max_length=20,
+        choices=JOB_TYPE_CHOICES,
+        verbose_name='작업 유형'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='queued',
+        verbose_name='작업 상태'
+    )
+    media_file = models.ForeignKey(
+        'media_files.MediaFile',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='analysis_jobs',
+        verbose_name='분석 대상 파일'
+    )
+    record = models.ForeignKey(
+        AnalysisRecord,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs',
+        verbose_name='분석 기록'
+    )
+    payload = models.JSONField(null=True, blank=True, verbose_name='작업 데이터')
+    error_message = models.TextField(null=True, blank=True, verbose_name='오류 메시지')
+    
+    # 재시도 / 잠금
+    attempts = models.IntegerField(default=0, verbose_name='시도 횟수')
+    max_attempts = models.IntegerField(default=3, verbose_name='최대 시도 횟수')
+    available_at = models.DateTimeField(verbose_name='실행 가능 시각')
+    locked_by = models.CharField(max_length=100, null=True, blank=True, verbose_name='처리 워커')
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name='잠금 시각')
+    
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='시작일시')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='종료일시')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'analysis_jobs'
+        verbose_name = '분석 작업'
+        verbose_name_plural = '분석 작업 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+            models.Index(fields=['user', '-created_at']),
+        ]
+    
+    def __str__(self):
+        return f"#{self.job_id} {self.get_job_type_display()} - {self.get_status_display()}"
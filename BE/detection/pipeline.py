@@ -0,0 +1,398 @@
+import io
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+
+from media_files.services import FileService
+from media_files.storage import S3Storage
+from users.models import AppSetting
+from .admission import AdmissionController
+from .models import AnalysisRecord
+from .preprocess import QualityTierStats, downscale_upload
+from .result_cache import analyze_image_cached
+from .retry import Deadline
+from .services import AIModelService
+
+
+class AnalysisFailedError(Exception):
+    """AI 추론 실패"""
+
+
+class AnalysisDeadlineExceeded(AnalysisFailedError):
+    """마감 시간이 지나 AI 추론을 하지 않고 폐기"""
+
+
+def extract_s3_key(url):
+    """S3 URL(Presigned 포함)에서 키 추출"""
+    match = re.search(r'amazonaws\.com/(.+?)(\?|$)', url)
+    return match.group(1) if match else None
+
+
+class DetectionPipeline:
+    """
+    공통 탐지 파이프라인
+
+    업로드 → 위치(URL) → 추론 → ResultUrl 변환 → 판정 → 저장
+    이미지/영상/Zoom 캡처가 모두 같은 단계를 사용하며 요청당 추론은 1회만 수행한다.
+    단계별 소요 시간(ms)은 `timings` 에 기록되어 AnalysisRecord.processing_stages 로 저장된다.
+    AI 호출 마감 시간은 파이프라인 생성 시점부터 profile(zoom/image/video) 기준으로 계산된다.
+    """
+
+    AI_INPUT_PREFIX = 'ai-input'  # 'url' 모드 축소본 임시 객체 S3 키 접두사
+
+    def __init__(self, user, request=None, profile='image'):
+        self.user = user
+        self.request = request
+        self.profile = profile
+        self.deadline = Deadline.for_profile(profile)
+        self.timings = {}
+        self.media_file = None
+        self.input_url = None
+
+    @property
+    def quality(self):
+        """사용자 분석 품질 등급 (AppSetting.analysis_quality)"""
+        try:
+            return self.user.app_settings.analysis_quality
+        except AppSetting.DoesNotExist:
+            return settings.AI_QUALITY_DEFAULT_TIER
+
+    @contextmanager
+    def stage(self, name):
+        """단계 소요 시간 측정"""
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            elapsed = int((time.time() - start_time) * 1000)
+            self.timings[name] = self.timings.get(name, 0) + elapsed
+
+    @property
+    def processing_time(self):
+        """지금까지 측정된 전체 처리 시간 (ms)"""
+        return sum(self.timings.values())
+
+    # ------------------------------------------------------------------
+    # 단계
+    # ------------------------------------------------------------------
+    def upload(self, uploaded_file, file_type, purpose, is_temporary=False, metadata=None):
+        """파일 저장 → MediaFile"""
+        with self.stage('upload'):
+            return FileService(self.user).upload_file(
+                uploaded_file=uploaded_file,
+                file_type=file_type,
+                purpose=purpose,
+                is_temporary=is_temporary,
+                metadata=metadata,
+                use_s3=True
+            )
+
+    def locate(self, media_file, input_url=None):
+        """AI 서버가 내려받을 URL 생성"""
+        with self.stage('locate'):
+            if media_file.storage_type == 's3':
+                url = S3Storage().get_presigned_url(media_file.s3_key)
+            elif input_url:
+                url = input_url
+            elif self.request is not None:
+                # 로컬 파일인 경우 전체 URL 생성
+                url = self.request.build_absolute_uri(f'/media/{media_file.file_path}')
+            else:
+                url = None
+
+        if not url:
+            raise ValueError("분석 대상 URL을 생성할 수 없습니다.")
+        return url
+
+    def infer(self, input_url=None, kind='image', content_hash=None, file_obj=None, content_type=None):
+        """
+        AI 추론 (요청당 1회)
+
+        file_obj 가 주어지면 URL 대신 이미지 바이트를 직접 전송한다 (inline 모드).
+
+        Raises:
+            AnalysisFailedError: AI 분석 실패
+            AnalysisDeadlineExceeded: 마감 시간 초과로 폐기
+            AdmissionRejected: 동시 추론 한도 초과
+        """
+        with self.stage('infer'):
+            ai_service = AIModelService(profile=self.profile, deadline=self.deadline)
+            if kind == 'video':
+                result = self._admitted(lambda: ai_service.analyze_video(input_url))()
+                result['cache_hit'] = False
+            elif file_obj is not None:
+                result = analyze_image_cached(
+                    self._admitted(lambda: ai_service.analyze_image_inline(file_obj, content_type)),
+                    content_hash
+                )
+            else:
+                # 동일 콘텐츠는 캐시 재사용 (캐시 히트는 동시 실행 한도에 포함되지 않음)
+                result = analyze_image_cached(
+                    self._admitted(lambda: ai_service.analyze_image(input_url)),
+                    content_hash
+                )
+
+        if not result['success']:
+            if result.get('deadline_exceeded'):
+                raise AnalysisDeadlineExceeded(result['error'])
+            raise AnalysisFailedError(result['error'])
+        return result
+
+    def ingest(self, uploaded_file):
+        """품질 등급별 축소/재인코딩 (디코딩 1회, 프로세스 풀에서 실행)"""
+        with self.stage('ingest'):
+            return downscale_upload(uploaded_file, self.quality, timeout=self.deadline.remaining())
+
+    def _admitted(self, analyze):
+        """분석 종류별/사용자별 동시 실행 한도 안에서 analyze 실행"""
+        def run():
+            with AdmissionController(self.profile, self.user.pk).slot(self.deadline):
+                return analyze()
+        return run
+
+    def upload_and_infer(self, uploaded_file, file_type, purpose, is_temporary=False,
+                         metadata=None, content_hash=None):
+        """
+        이미지 업로드 + 추론
+
+        원본을 검사한 뒤 분석 품질 등급에 맞게 축소한 이미지는 AI 서버 전송에만 사용하고,
+        스토리지/MediaFile/AnalysisRecord 에는 사용자가 올린 원본을 그대로 저장한다.
+        'url' 모드는 저장한 원본의 URL 을, 축소한 경우 축소본을 임시 S3 객체로 올린 URL 을 전달하고
+        (추론 후 삭제), 'inline' 모드는 원본 또는 축소본을 요청 본문으로 전송한다.
+        inline 전송 시 스토리지 저장은 별도 스레드에서 동시에 진행한다.
+        결과 MediaFile / URL 은 self.media_file, self.input_url 에 저장된다.
+
+        Raises:
+            AnalysisFailedError: AI 분석 실패 (파일 저장은 완료된 상태)
+        """
+        tier = self.quality
+        FileService(self.user).validate_file(uploaded_file, file_type)
+
+        prepared = self.ingest(uploaded_file)
+        if content_hash:
+            # 같은 원본이라도 등급마다 전송 이미지가 다르므로 캐시 키에 등급 포함
+            content_hash = f'{content_hash}:{tier}'
+
+        result = self._upload_and_infer(
+            uploaded_file, prepared, file_type, purpose, is_temporary, metadata, content_hash
+        )
+
+        if not result['cache_hit']:
+            QualityTierStats().record(tier, uploaded_file.size, prepared.size, self.timings['infer'])
+        return result
+
+    def _upload_and_infer(self, uploaded_file, prepared, file_type, purpose, is_temporary, metadata,
+                          content_hash):
+        downscaled = prepared is not uploaded_file
+
+        if settings.AI_TRANSPORT_MODE != 'inline':
+            self.media_file = self.upload(
+                uploaded_file, file_type, purpose,
+                is_temporary=is_temporary, metadata=metadata
+            )
+            self.input_url = self.locate(self.media_file)
+            if downscaled:
+                return self._infer_temporary_copy(prepared, content_hash)
+            return self.infer(self.input_url, content_hash=content_hash)
+
+        file_service = FileService(self.user)
+        storage_reader, ai_reader = _open_readers(uploaded_file)
+        if downscaled:
+            # 저장은 원본, AI 서버에는 축소본만 전송
+            ai_reader.close()
+            ai_reader = prepared.file
+        try:
+            pending = _storage_executor.submit(
+                file_service.store_file, storage_reader, purpose, True
+            )
+            try:
+                return self.infer(
+                    content_hash=content_hash,
+                    file_obj=ai_reader,
+                    content_type=prepared.content_type
+                )
+            finally:
+                # 추론 결과와 관계없이 저장은 끝까지 마친다
+                with self.stage('upload'):
+                    stored = pending.result()
+                    self.media_file = file_service.register_file(
+                        uploaded_file, stored,
+                        file_type=file_type,
+                        purpose=purpose,
+                        is_temporary=is_temporary,
+                        metadata=metadata
+                    )
+                self.input_url = self.locate(self.media_file)
+        finally:
+            storage_reader.close()
+            ai_reader.close()
+
+    def _infer_temporary_copy(self, prepared, content_hash):
+        """
+        축소본을 임시 S3 객체로 올려 그 URL 로 추론 ('url' 모드)
+
+        임시 객체는 추론이 끝나면 백그라운드에서 삭제한다 (남은 객체는 AI_INPUT_PREFIX 수명 주기 규칙으로 정리).
+        임시 객체를 만들지 못하면 저장한 원본 URL 로 추론한다.
+        """
+        storage = S3Storage()
+        extension = os.path.splitext(prepared.name)[1]
+        s3_key = f'{self.AI_INPUT_PREFIX}/user_{self.user.user_id}/{uuid.uuid4().hex}{extension}'
+
+        with self.stage('upload'):
+            uploaded = storage.upload(prepared, s3_key, content_type=prepared.content_type)
+        if not uploaded:
+            return self.infer(self.input_url, content_hash=content_hash)
+
+        try:
+            with self.stage('locate'):
+                url = storage.get_presigned_url(s3_key)
+            return self.infer(url or self.input_url, content_hash=content_hash)
+        finally:
+            _storage_executor.submit(storage.delete, s3_key)
+
+    def rewrite_result_urls(self, face_scores):
+        """ResultUrl 을 Presigned URL 로 변환 (in-place)"""
+        with self.stage('rewrite'):
+            s3_storage = None
+            for face in face_scores:
+                if not face.get('ResultUrl'):
+                    continue
+                s3_key = extract_s3_key(face['ResultUrl'])
+                if s3_key:
+                    s3_storage = s3_storage or S3Storage()
+                    face['ResultUrl'] = s3_storage.get_presigned_url(s3_key)
+        return face_scores
+
+    def score(self, face_scores):
+        """
+        다중 얼굴 결과 → 최종 판정
+
+        Returns:
+            tuple: (analysis_result, confidence_score 0-100)
+        """
+        with self.stage('score'):
+            is_any_deepfake = any(face['is_deepfake'] for face in face_scores)
+            avg_confidence = sum(face['rate'] for face in face_scores) / len(face_scores) if face_scores else 0
+
+            if is_any_deepfake:
+                analysis_result = 'deepfake' if avg_confidence >= 0.8 else 'suspicious'
+            else:
+                analysis_result = 'safe'
+
+        return analysis_result, avg_confidence * 100
+
+    def persist(self, media_file, analysis_type, analysis_result, confidence_score, detection_details):
+        """AnalysisRecord 저장 및 MediaFile 연결"""
+        # 저장 단계 자체의 시간은 기록 이후에 확정되므로 응답의 timings 에만 포함된다
+        stages = dict(self.timings)
+
+        with self.stage('persist'):
+            record = AnalysisRecord.objects.create(
+                user=self.user,
+                analysis_type=analysis_type,
+                file_name=media_file.original_name,
+                file_size=media_file.file_size,
+                file_format=media_file.file_format,
+                original_path=media_file.file_path,
+                analysis_result=analysis_result,
+                confidence_score=confidence_score,
+                detection_details=detection_details,
+                processing_time=sum(stages.values()),
+                processing_stages=stages,
+                ai_model_version=settings.AI_MODEL_VERSION
+            )
+
+            # 관계 연결 (기록 삭제/세션 마무리가 related_record_id 로 원본 파일을 찾으므로 쓰기 버퍼 없이 바로 저장)
+            media_file.related_model = 'AnalysisRecord'
+            media_file.related_record_id = record.record_id
+            media_file.save(update_fields=['related_model', 'related_record_id', 'updated_at'])
+
+        return record
+
+    # ------------------------------------------------------------------
+    # 전체 실행
+    # ------------------------------------------------------------------
+    def analyze(self, media_file, input_url, analysis_type, kind='image', content_hash=None):
+        """
+        추론 → ResultUrl 변환 → 판정 → 저장
+
+        Returns:
+            dict: {'record', 'face_count', 'face_quality_scores', 'cache_hit'}
+        """
+        result = self.infer(input_url, kind=kind, content_hash=content_hash)
+        return self.complete(media_file, result, analysis_type)
+
+    def complete(self, media_file, result, analysis_type):
+        """ResultUrl 변환 → 판정 → 저장"""
+        face_scores = self.rewrite_result_urls(result['face_quality_scores'])
+        analysis_result, confidence_score = self.score(face_scores)
+
+        record = self.persist(
+            media_file,
+            analysis_type,
+            analysis_result,
+            confidence_score,
+            face_scores
+        )
+
+        return {
+            'record': record,
+            'face_count': result['face_count'],
+            'face_quality_scores': face_scores,
+            'cache_hit': result['cache_hit'],
+        }
+
+    def run(self, uploaded_file, file_type, purpose, analysis_type, is_temporary=True,
+            content_hash=None):
+        """이미지 업로드부터 저장까지 전체 실행"""
+        result = self.upload_and_infer(
+            uploaded_file,
+            file_type,
+            purpose,
+            is_temporary=is_temporary,
+            content_hash=content_hash
+        )
+        return self.complete(self.media_file, result, analysis_type)
+
+
+# inline 모드에서 추론과 동시에 스토리지 저장을 수행하는 스레드 풀
+_storage_executor = ThreadPoolExecutor(
+    max_workers=settings.AI_INLINE_STORAGE_WORKERS,
+    thread_name_prefix='inline-storage'
+)
+
+
+def _open_readers(uploaded_file):
+    """
+    같은 업로드 내용을 서로 독립적으로 읽는 파일 객체 2개 생성 (데이터 복사 없음)
+
+    메모리 업로드는 BytesIO 의 내부 bytes 를 공유하고,
+    임시 파일 업로드는 같은 경로를 두 번 연다.
+    """
+    def wrap(file_obj):
+        return UploadedFile(
+            file=file_obj,
+            name=uploaded_file.name,
+            content_type=uploaded_file.content_type,
+            size=uploaded_file.size,
+            charset=uploaded_file.charset
+        )
+
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        path = uploaded_file.temporary_file_path()
+        return wrap(open(path, 'rb')), open(path, 'rb')
+
+    source = uploaded_file.file
+    if isinstance(source, io.BytesIO):
+        data = source.getvalue()  # 내부 버퍼 공유 (복사 없음)
+    else:
+        uploaded_file.seek(0)
+        data = uploaded_file.read()
+        uploaded_file.seek(0)
+    return wrap(io.BytesIO(data)), io.BytesIO(data)
@@ -0,0 +1,171 @@
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+FORMAT_EXTENSIONS = {
+    'JPEG': ('jpg', 'image/jpeg'),
+    'WEBP': ('webp', 'image/webp'),
+}
+
+
+def resize_image_bytes(data, max_side, quality, image_format):
+    """
+    이미지 1회 디코딩 → 축소 → 재인코딩 (프로세스 풀에서 실행)
+
+    Args:
+        data: 원본 이미지 바이트
+        max_side: 긴 변 최대 픽셀
+        quality: JPEG/WebP 품질
+        image_format: 'JPEG' / 'WEBP'
+
+    Returns:
+        bytes | None: 변환 결과 (이미 max_side 이하이거나, 디코딩 실패 또는 원본보다 크면 None)
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            # 축소할 필요가 없는 이미지는 재인코딩하지 않음 (화질 손실, 불필요한 inline 전송 방지)
+            if max(img.size) <= max_side:
+                return None
+            # JPEG는 디코딩 단계에서 축소 (전체 해상도 디코딩 생략)
+            img.draft('RGB', (max_side, max_side))
+            img = img.convert('RGB')
+            img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
+            output = io.BytesIO()
+            img.save(output, image_format, quality=quality)
+    except (OSError, ValueError):
+        return None
+
+    result = output.getvalue()
+    return result if len(result) < len(data) else None
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """축소 작업용 프로세스 풀 (요청 스레드가 GIL을 잡지 않도록 별도 프로세스에서 실행)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # 요청 스레드가 여러 개인 프로세스에서 fork 하지 않도록 spawn 사용
+                _executor = ProcessPoolExecutor(
+                    max_workers=settings.AI_DOWNSCALE_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    return _executor
+
+
+def _discard_executor(executor):
+    """손상된 프로세스 풀 폐기 (다음 요청에서 새로 생성)"""
+    global _executor
+
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def downscale_upload(uploaded_file, tier, timeout=None):
+    """
+    분석 품질 등급에 맞게 업로드 이미지 축소
+
+    Args:
+        uploaded_file: 원본 업로드 파일
+        tier: 'low' / 'medium' / 'high'
+        timeout: 변환 대기 최대 시간(초)
+
+    Returns:
+        UploadedFile: 변환된 파일 (변환하지 않거나 변환에 실패하면 원본 그대로)
+    """
+    spec = settings.AI_QUALITY_TIERS.get(tier)
+    if not spec:
+        return uploaded_file
+
+    uploaded_file.seek(0)
+    data = uploaded_file.read()
+    uploaded_file.seek(0)
+
+    image_format = settings.AI_DOWNSCALE_FORMAT
+    args = (data, spec['max_side'], spec['quality'], image_format)
+
+    if settings.AI_DOWNSCALE_WORKERS > 0:
+        executor = _get_executor()
+        try:
+            result = executor.submit(resize_image_bytes, *args).result(timeout=timeout)
+        except FutureTimeoutError:
+            result = None
+        except BrokenProcessPool:
+            # 작업 프로세스가 비정상 종료됨 → 원본 전송
+            logger.exception('이미지 축소 프로세스 풀 손상 (원본 전송, 풀 재생성)')
+            _discard_executor(executor)
+            result = None
+        except Exception:
+            # 직렬화 오류 등 → 축소는 최적화일 뿐이므로 원본 전송
+            logger.exception('이미지 축소 실패 (원본 전송)')
+            result = None
+    else:
+        result = resize_image_bytes(*args)
+
+    if result is None:
+        return uploaded_file
+
+    extension, content_type = FORMAT_EXTENSIONS[image_format]
+    name = f'{os.path.splitext(uploaded_file.name)[0]}.{extension}'
+    return SimpleUploadedFile(name, result, content_type)
+
+
+class QualityTierStats:
+    """
+    품질 등급별 전송 바이트/추론 시간 통계 (모든 워커 합산)
+
+    캐시 히트 요청은 AI 서버로 보내지 않으므로 집계하지 않는다.
+    """
+
+    FIELDS = ('requests', 'bytes_in', 'bytes_sent', 'infer_ms')
+
+    def record(self, tier, bytes_in, bytes_sent, infer_ms):
+        for field, value in zip(self.FIELDS, (1, bytes_in, bytes_sent, infer_ms)):
+            self._incr(self._key(tier, field), int(value))
+
+    def stats(self):
+        tiers = list(settings.AI_QUALITY_TIERS)
+        values = cache.get_many([self._key(t, f) for t in tiers for f in self.FIELDS])
+
+        result = {}
+        for tier in tiers:
+            requests, bytes_in, bytes_sent, infer_ms = (
+                values.get(self._key(tier, f), 0) for f in self.FIELDS
+            )
+            result[tier] = {
+                'requests': requests,
+                'avg_bytes_in': bytes_in // requests if requests else 0,
+                'avg_bytes_sent': bytes_sent // requests if requests else 0,
+                'avg_infer_ms': round(infer_ms / requests, 1) if requests else 0.0,
+            }
+        return result
+
+    def _key(self, tier, field):
+        return f'ai:tier:{tier}:{field}'
+
+    def _incr(self, key, delta):
+        if not cache.add(key, delta, timeout=None):
+            try:
+                cache.incr(key, delta)
+            except ValueError:
+                cache.set(key, delta, timeout=None)
@@ -0,0 +1,95 @@
+import copy
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+
+
+class AnalysisResultCache:
+    """
+    콘텐츠 해시 기반 AI 분석 결과 캐시
+
+    키: (SHA-256, ai_model_version)
+    만료: 캐시 백엔드 TIMEOUT (TTL) + MAX_ENTRIES 초과 시 LRU 정리
+    히트/미스 카운터는 기본 캐시에 저장되어 워커 간 공유된다.
+    """
+
+    HITS_KEY = 'ai:result_cache:hits'
+    MISSES_KEY = 'ai:result_cache:misses'
+
+    def __init__(self, model_version=None):
+        self.model_version = model_version or settings.AI_MODEL_VERSION
+        self.store = caches['ai_results']
+
+    def get(self, content_hash):
+        """캐시된 AI 결과 조회 (없으면 None)"""
+        if not content_hash:
+            return None
+
+        result = self.store.get(self._key(content_hash))
+        self._incr(self.HITS_KEY if result is not None else self.MISSES_KEY)
+
+        # 호출 측에서 ResultUrl 등을 수정하므로 사본 반환
+        return copy.deepcopy(result)
+
+    def set(self, content_hash, result):
+        """AI 결과 저장 (성공한 실제 추론 결과만)"""
+        if not content_hash or not result.get('success') or result.get('is_mock'):
+            return
+
+        self.store.set(self._key(content_hash), {
+            'success': True,
+            'face_count': result.get('face_count', 0),
+            'face_quality_scores': copy.deepcopy(result.get('face_quality_scores', [])),
+        })
+
+    def stats(self):
+        """히트/미스 통계"""
+        values = cache.get_many([self.HITS_KEY, self.MISSES_KEY])
+        hits = values.get(self.HITS_KEY, 0)
+        misses = values.get(self.MISSES_KEY, 0)
+        total = hits + misses
+
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 4) if total else 0.0,
+        }
+
+    def _key(self, content_hash):
+        return f'ai:result:{content_hash}:{self.model_version}'
+
+    def _incr(self, key):
+        if not cache.add(key, 1, timeout=None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, timeout=None)
+
+
+def analyze_image_cached(analyze, content_hash):
+    """
+    캐시 우선 이미지 분석
+
+    같은 바이트가 이미 분석된 경우 AI 호출 없이 이전 결과를 재사용한다.
+
+    Args:
+        analyze: 캐시 미스 시 실제 분석을 수행하는 함수 (인자 없음)
+        content_hash: 이미지 SHA-256
+
+    Returns:
+        dict: AIModelService.analyze_image 와 동일한 구조 + 'cache_hit'
+    """
+    start_time = time.time()
+    result_cache = AnalysisResultCache()
+
+    cached = result_cache.get(content_hash)
+    if cached is not None:
+        cached['processing_time'] = int((time.time() - start_time) * 1000)
+        cached['cache_hit'] = True
+        return cached
+
+    result = analyze()
+    result_cache.set(content_hash, result)
+    result['cache_hit'] = False
+    return result
@@ -0,0 +1,164 @@
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """요청 마감 시간 초과 (AI 서버로 보내지 않고 폐기)"""
+
+
+class Deadline:
+    """요청 단위 마감 시간"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def for_profile(cls, profile):
+        """엔드포인트 종류(zoom / image / video)별 마감 시간 생성"""
+        return cls(settings.AI_DEADLINES.get(profile, settings.AI_REQUEST_TIMEOUT))
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def timeout(self):
+        """남은 시간에 맞춘 (connect, read) 타임아웃"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded('요청 마감 시간이 지났습니다.')
+        return (
+            min(settings.AI_CONNECT_TIMEOUT, remaining),
+            min(settings.AI_READ_TIMEOUT, remaining)
+        )
+
+
+class LatencyTracker:
+    """프로필별 최근 응답 시간 (헤징 기준 p95 계산용, 프로세스 단위)"""
+
+    def __init__(self, size=200):
+        self._samples = defaultdict(lambda: deque(maxlen=size))
+        self._lock = threading.Lock()
+
+    def observe(self, profile, seconds):
+        with self._lock:
+            self._samples[profile].append(seconds)
+
+    def percentile(self, profile, pct):
+        with self._lock:
+            samples = sorted(self._samples[profile])
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * pct / 100))
+        return samples[index]
+
+    def count(self, profile):
+        with self._lock:
+            return len(self._samples[profile])
+
+
+latency_tracker = LatencyTracker()
+
+# 헤징 중복 요청 전송용 스레드 풀 (첫 요청은 호출 스레드에서 전송)
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=settings.AI_HEDGE_MAX_WORKERS,
+    thread_name_prefix='ai-hedge'
+)
+
+
+def is_retryable(exc):
+    """재시도 가능한 오류 (연결 오류, 타임아웃, 5xx)"""
+    if isinstance(exc, DeadlineExceeded):
+        return False
+    response = getattr(exc, 'response', None)
+    if response is not None:
+        return response.status_code >= 500
+    return isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def call_with_retries(send, deadline, can_retry=None):
+    """
+    마감 시간 안에서 지터가 적용된 지수 백오프로 재시도
+
+    Args:
+        send: timeout 튜플을 받아 요청을 보내는 함수
+        deadline: Deadline
+        can_retry: 재시도 전에 호출하여 False 면 재시도하지 않음 (서킷 상태 등)
+
+    Raises:
+        requests.exceptions.RequestException: 마지막 시도 실패 또는 마감 초과
+    """
+    attempt = 0
+    while True:
+        try:
+            return send(deadline.timeout())
+        except requests.exceptions.RequestException as e:
+            attempt += 1
+            if attempt > settings.AI_RETRY_MAX_ATTEMPTS or not is_retryable(e):
+                raise
+            if can_retry is not None and not can_retry():
+                raise
+
+            # full jitter: 0 ~ min(max_delay, base * 2^n)
+            backoff = min(
+                settings.AI_RETRY_MAX_DELAY,
+                settings.AI_RETRY_BASE_DELAY * (2 ** (attempt - 1))
+            )
+            delay = random.uniform(0, backoff)
+            if delay >= deadline.remaining():
+                raise
+            time.sleep(delay)
+
+
+def call_hedged(call, hedge_delay, deadline, hedge_call=None):
+    """
+    헤징 요청
+
+    첫 요청은 호출 스레드에서 보내고, hedge_delay 안에 끝나지 않으면 같은 요청을
+    헤징 스레드 풀로 한 번 더 보낸다 (풀은 중복 요청에만 쓰므로 동시 요청 수를 제한하지 않음).
+    첫 요청이 실패하면 중복 요청의 응답을 사용한다. hedge_call 이 주어지면 중복 요청에 사용한다.
+    """
+    lock = threading.Lock()
+    primary_done = threading.Event()
+    hedges = []
+
+    def start_hedge():
+        with lock:
+            if not primary_done.is_set() and deadline.remaining() > hedge_delay:
+                hedges.append(_hedge_executor.submit(hedge_call or call))
+
+    timer = threading.Timer(hedge_delay, start_hedge)
+    timer.daemon = True
+    timer.start()
+    try:
+        return call()
+    except requests.exceptions.RequestException as error:
+        with lock:
+            primary_done.set()
+        if not hedges:
+            raise
+        try:
+            return hedges[0].result()
+        except requests.exceptions.RequestException:
+            raise error
+    finally:
+        timer.cancel()
+        with lock:
+            primary_done.set()
+
+
+def get_hedge_delay(profile):
+    """프로필 p95 기준 헤징 대기 시간 (샘플이 부족하면 None → 헤징 안 함)"""
+    if not settings.AI_HEDGE_ENABLED or profile not in settings.AI_HEDGE_PROFILES:
+        return None
+    if latency_tracker.count(profile) < settings.AI_HEDGE_MIN_SAMPLES:
+        return None
+    return max(settings.AI_HEDGE_MIN_DELAY, latency_tracker.percentile(profile, 95))
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import AnalysisRecord
+from .models import AnalysisRecord, AnalysisJob
 
 
 class AnalysisRecordSerializer(serializers.ModelSerializer):
@@ -41,6 +41,7 @@ class AnalysisRecordSerializer(serializers.ModelSerializer):
             'confidence_score',
             'detection_details',
             'processing_time',
+            'processing_stages',
             'ai_model_version',
             'created_at',
             'updated_at'
@@ -245,6 +246,32 @@ class AnalysisRecordListSerializer(serializers.ModelSerializer):
         
         return None
     
+class AnalysisJobSerializer(serializers.ModelSerializer):
+    """비동기 분석 작업 Serializer"""
+    
+    status_display = serializers.CharField(
+        source='get_status_display',
+        read_only=True
+    )
+    record = AnalysisRecordSerializer(read_only=True)
+    
+    class Meta:
+        model = AnalysisJob
+        fields = [
+            'job_id',
+            'job_type',
+            'status',
+            'status_display',
+            'attempts',
+            'error_message',
+            'record',
+            'created_at',
+            'started_at',
+            'finished_at'
+        ]
+        read_only_fields = fields
+
+
 class AnalysisStatisticsSerializer(serializers.Serializer):
     """분석 통계 Serializer"""
     
@@ -1,15 +1,39 @@
+import logging
 import requests
+import threading
 import time
 from django.conf import settings
 from media_files.models import SystemLog
+from media_files.write_buffer import get_write_buffer
+from .backend_pool import get_backend_pool
+from .batching import get_batcher
+from .circuit_breaker import AICircuitBreaker
+from .http_client import get_ai_session, get_ai_timeout
+from .retry import (
+    Deadline, DeadlineExceeded, call_hedged, call_with_retries, get_hedge_delay, latency_tracker
+)
+
+
+logger = logging.getLogger(__name__)
+
+# AI 서버 부재 경고는 장애 구간마다 한 번만 (매 요청 로그가 쌓이지 않도록)
+_unavailable = threading.Event()
 
 
 class AIModelService:
-    """AI 모델 서비스 (FastAPI 연동)"""
+    """
+    AI 모델 서비스 (FastAPI 연동)
+    
+    Args:
+        profile: 엔드포인트 종류 ('zoom' / 'image' / 'video'), 마감 시간과 헤징 기준
+        deadline: 요청 마감 시간 (없으면 호출 시점부터 프로필 마감 시간 적용)
+    """
     
-    def __init__(self):
-        self.fastapi_url = settings.FASTAPI_URL
-        self.timeout = settings.AI_REQUEST_TIMEOUT
+    def __init__(self, profile='image', deadline=None):
+        self.profile = profile
+        self.deadline = deadline
+        self.session = get_ai_session()
+        self.pool = get_backend_pool()
     
     def analyze_image(self, s3_url):
         """
@@ -34,51 +58,45 @@ class AIModelService:
             }
         """
         
-        start_time = time.time()
+        def send(base_url, timeout):
+            if settings.AI_BATCH_ENABLED:
+                # 같은 백엔드로 가는 다른 요청들과 묶어서 배치 호출
+                return get_batcher(base_url).analyze(s3_url, timeout=timeout[1])
+            return self._post_url(base_url, s3_url, timeout)
         
-        # 🔧 AI 서버 연결 확인
-        if not self.check_health():
-            print("⚠️ AI 서버 없음 - Mock 데이터 반환")
-            return self._get_mock_image_response(start_time)
+        return self._detect(send, self._get_mock_image_response, 'AI 모델 분석 실패')
+    
+    def analyze_image_inline(self, file_obj, content_type):
+        """
+        이미지 딥페이크 분석 (이미지 바이트 직접 전송)
         
-        # 실제 AI 서버 호출 (새로운 명세)
-        try:
-            payload = {
-                "request_version": "Multi Person Deepfake detection",
-                "InputUrl": s3_url
-            }
-            
-            response = requests.post(
-                f"{self.fastapi_url}/detect_deepfake",
-                json=payload,  # ← JSON으로 전송!
-                timeout=self.timeout
+        S3 Presigned URL 대신 업로드된 바이트를 요청 본문으로 스트리밍하여
+        AI 서버가 S3에서 다시 내려받는 과정을 생략한다.
+        
+        Args:
+            file_obj: 읽기 가능한 파일 객체 (처음부터 읽음)
+            content_type: 이미지 MIME 타입
+        
+        Returns:
+            dict: analyze_image 와 동일한 구조
+        """
+        
+        def send(base_url, timeout):
+            file_obj.seek(0)  # 재시도 시 처음부터 다시 전송
+            response = self.session.post(
+                f"{base_url}{settings.AI_INLINE_ENDPOINT}",
+                data=file_obj,  # ← 파일 객체 그대로 스트리밍 (복사 없음)
+                headers={
+                    'Content-Type': content_type or 'application/octet-stream',
+                    'X-Request-Version': 'Multi Person Deepfake detection'
+                },
+                timeout=timeout
             )
-            
             response.raise_for_status()
-            result = response.json()
-            
-            processing_time = int((time.time() - start_time) * 1000)
-            
-            return {
-                'success': True,
-                'face_count': result.get('face_count', 0),
-                'face_quality_scores': result.get('face_quality_scores', []),
-                'processing_time': processing_time
-            }
+            return response.json()
         
-        except requests.exceptions.RequestException as e:
-            SystemLog.objects.create(
-                log_level='error',
-                log_category='detection',
-                message=f'AI 모델 분석 실패: {str(e)}',
-                error_code='AI_API_ERROR'
-            )
-            
-            return {
-                'success': False,
-                'error': 'AI 분석 중 오류가 발생했습니다. 다시 시도해주세요.',
-                'processing_time': int((time.time() - start_time) * 1000)
-            }
+        # 파일 객체 하나를 공유하므로 헤징(동시 중복 전송)은 하지 않음
+        return self._detect(send, self._get_mock_image_response, 'AI 모델 분석 실패', hedge=False)
     
     def analyze_video(self, s3_url):
         """
@@ -91,27 +109,92 @@ class AIModelService:
             dict: 이미지 분석과 동일한 구조
         """
         
+        return self._detect(
+            lambda base_url, timeout: self._post_url(base_url, s3_url, timeout),
+            self._get_mock_video_response,
+            '영상 AI 분석 실패'
+        )
+    
+    def _post_url(self, base_url, s3_url, timeout):
+        """URL 전달 방식 /detect_deepfake 호출"""
+        payload = {
+            "request_version": "Multi Person Deepfake detection",
+            "InputUrl": s3_url
+        }
+        
+        response = self.session.post(
+            f"{base_url}/detect_deepfake",
+            json=payload,  # ← JSON으로 전송!
+            timeout=timeout
+        )
+        
+        response.raise_for_status()
+        return response.json()
+    
+    def _detect(self, send, mock_response, log_message, hedge=True):
+        """
+        AI 서버 호출 공통 처리 (백엔드 선택, 마감 시간, 재시도/헤징, 실패 로그, 응답 정규화)
+        
+        Args:
+            send: (백엔드 URL, (connect, read) 타임아웃)을 받아 요청을 보내고
+                  응답 JSON(dict)을 반환하는 함수
+            mock_response: AI 서버가 없을 때 사용할 Mock 응답 함수
+            log_message: 실패 로그 메시지
+            hedge: p95 초과 시 중복 요청 허용 여부
+        """
+        
         start_time = time.time()
+        deadline = self.deadline or Deadline.for_profile(self.profile)
         
-        if not self.check_health():
-            print("⚠️ AI 서버 없음 - Mock 데이터 반환")
-            return self._get_mock_video_response(start_time)
+        # 마감 시간이 지난 요청은 AI 서버로 보내지 않고 폐기 (오래된 Zoom 프레임 등)
+        if deadline.expired():
+            return self._deadline_exceeded_response(start_time)
         
-        try:
-            payload = {
-                "request_version": "Multi Person Deepfake detection",
-                "InputUrl": s3_url
-            }
+        # 🔧 AI 서버 연결 확인 (백엔드별 서킷 브레이커 상태 기준, 매 요청 health 호출 없음)
+        first_backend = self.pool.pick()
+        if first_backend is None:
+            if not _unavailable.is_set():
+                _unavailable.set()
+                logger.warning('사용 가능한 AI 서버가 없어 Mock 데이터를 반환합니다.')
+            return mock_response(start_time)
+        if _unavailable.is_set():
+            _unavailable.clear()
+            logger.info('AI 서버 연결이 복구되었습니다.')
+        
+        def call(backend=None):
+            tried = []
             
-            response = requests.post(
-                f"{self.fastapi_url}/detect_deepfake",
-                json=payload,
-                timeout=self.timeout
-            )
+            def attempt(timeout):
+                # 재시도는 가능하면 다른 백엔드로
+                target = backend if backend is not None and not tried else self.pool.pick(exclude=tried)
+                if target is None:
+                    raise requests.exceptions.ConnectionError('사용 가능한 AI 서버가 없습니다.')
+                tried.append(target)
+                
+                try:
+                    with self.pool.track(target):
+                        result = send(target.url, timeout)
+                except DeadlineExceeded:
+                    raise
+                except requests.exceptions.RequestException as e:
+                    target.record_failure(e)
+                    raise
+                target.record_success()
+                return result
             
-            response.raise_for_status()
-            result = response.json()
+            # 정상 백엔드가 없으면 재시도 중단 (장애 중인 서버에 부하 누적 방지)
+            return call_with_retries(attempt, deadline, can_retry=self.pool.has_healthy)
+        
+        # 실제 AI 서버 호출 (새로운 명세)
+        try:
+            hedge_delay = get_hedge_delay(self.profile) if hedge else None
+            if hedge_delay is not None and self.pool.has_healthy():
+                # 중복 요청은 그 시점에 가장 한가한 백엔드로
+                result = call_hedged(lambda: call(first_backend), hedge_delay, deadline, hedge_call=call)
+            else:
+                result = call(first_backend)
             
+            latency_tracker.observe(self.profile, time.time() - start_time)
             processing_time = int((time.time() - start_time) * 1000)
             
             return {
@@ -122,10 +205,14 @@ class AIModelService:
             }
         
         except requests.exceptions.RequestException as e:
-            SystemLog.objects.create(
+            if isinstance(e, DeadlineExceeded) or deadline.expired():
+                return self._deadline_exceeded_response(start_time)
+            
+            get_write_buffer().create(
+                SystemLog,
                 log_level='error',
                 log_category='detection',
-                message=f'영상 AI 분석 실패: {str(e)}',
+                message=f'{log_message}: {str(e)}',
                 error_code='AI_API_ERROR'
             )
             
@@ -135,6 +222,15 @@ class AIModelService:
                 'processing_time': int((time.time() - start_time) * 1000)
             }
 
+    def _deadline_exceeded_response(self, start_time):
+        """마감 시간 초과 응답 (AI 서버 장애가 아니므로 로그/브레이커에 반영하지 않음)"""
+        return {
+            'success': False,
+            'error': 'AI 분석 마감 시간이 지나 요청을 폐기했습니다.',
+            'deadline_exceeded': True,
+            'processing_time': int((time.time() - start_time) * 1000)
+        }
+
     def _get_mock_image_response(self, start_time):
         """
         🔧 Mock 이미지 분석 응답 (AI 서버 없을 때)
@@ -162,7 +258,8 @@ class AIModelService:
             'success': True,
             'face_count': face_count,
             'face_quality_scores': face_quality_scores,
-            'processing_time': processing_time
+            'processing_time': processing_time,
+            'is_mock': True
         }
     
     def _get_mock_video_response(self, start_time):
@@ -171,13 +268,28 @@ class AIModelService:
         """
         return self._get_mock_image_response(start_time)
     
+    def get_health_state(self):
+        """캐시된 AI 서버 풀 상태 (라이브 호출 없음)"""
+        snapshot = self.pool.health_snapshot()
+
+        if snapshot['state'] == AICircuitBreaker.OPEN:
+            snapshot['status'] = 'unhealthy'
+        elif snapshot['state'] == AICircuitBreaker.HALF_OPEN:
+            snapshot['status'] = 'degraded'
+        else:
+            snapshot['status'] = 'healthy'
+        return snapshot
+
     def check_health(self):
-        """FastAPI 서버 상태 확인"""
-        try:
-            response = requests.get(
-                f"{self.fastapi_url}/health",
-                timeout=10  # 빠른 타임아웃
-            )
-            return response.status_code == 200
-        except:
-            return False
\ No newline at end of file
+        """FastAPI 서버 상태 직접 확인 (라이브 호출, 백엔드 중 하나라도 정상이면 True)"""
+        for backend in self.pool.backends:
+            try:
+                response = self.session.get(
+                    f"{backend.url}/health",
+                    timeout=get_ai_timeout(settings.AI_HEALTH_TIMEOUT)  # 빠른 타임아웃
+                )
+                if response.status_code == 200:
+                    return True
+            except:
+                continue
+        return False
\ No newline at end of file
@@ -0,0 +1,283 @@
+"""
+FastAPI AI 서버 스텁 (표준 라이브러리만 사용, Django 불필요)
+
+AI 서버 명세(/health, /detect_deepfake)를 그대로 흉내 내면서
+지연 시간 분포, 오류율, 얼굴 수를 설정할 수 있어 용량 산정/부하 테스트에 사용한다.
+
+사용법:
+    python -m detection.stub_server --port 8001 --latency lognormal:120:0.4 --error-rate 0.01
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LatencyDistribution:
+    """
+    지연 시간 분포 (ms)
+
+    형식:
+        fixed:MS
+        uniform:MIN:MAX
+        normal:MEAN:STD
+        lognormal:MEDIAN:SIGMA
+    """
+
+    def __init__(self, spec='fixed:100'):
+        kind, *params = spec.split(':')
+        self.kind = kind
+        self.params = [float(p) for p in params]
+
+        expected = {'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2}
+        if expected.get(kind) != len(self.params):
+            raise ValueError(f'잘못된 지연 시간 분포: {spec}')
+
+    def sample(self, rng):
+        """지연 시간 1개 (초)"""
+        if self.kind == 'fixed':
+            ms = self.params[0]
+        elif self.kind == 'uniform':
+            ms = rng.uniform(*self.params)
+        elif self.kind == 'normal':
+            ms = rng.gauss(*self.params)
+        else:
+            median, sigma = self.params
+            ms = median * rng.lognormvariate(0, sigma)
+        return max(0.0, ms) / 1000
+
+
+class StubConfig:
+    """스텁 응답 설정"""
+
+    def __init__(self, latency='fixed:100', batch_item_ms=0.0, error_rate=0.0,
+                 stall_rate=0.0, stall_ms=30000.0, faces='1:3', deepfake_rate=0.3,
+                 result_url_base=None, seed=None):
+        self.latency = LatencyDistribution(latency)
+        self.batch_item_ms = batch_item_ms
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall_ms = stall_ms
+        self.min_faces, self.max_faces = (int(n) for n in faces.split(':'))
+        self.deepfake_rate = deepfake_rate
+        self.result_url_base = result_url_base
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def draw(self, fn, *args):
+        """스레드 간 공유 난수 생성기 사용"""
+        with self._rng_lock:
+            return fn(self._rng, *args)
+
+
+class StubStats:
+    """요청 통계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.items = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'items': self.items,
+                'errors': self.errors,
+                'in_flight': self.in_flight,
+                'max_in_flight': self.max_in_flight,
+            }
+
+
+class StubAIHandler(BaseHTTPRequestHandler):
+    """/health, /detect_deepfake 핸들러"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive 지원
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/health':
+            self._send_json(200, {'status': 'ok', 'stats': self.server.stats.snapshot()})
+        else:
+            self._send_json(404, {'detail': 'Not Found'})
+
+    def do_POST(self):
+        if self.path.split('?')[0].rstrip('/') != '/detect_deepfake':
+            self._send_json(404, {'detail': 'Not Found'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        content_type = self.headers.get('Content-Type', '')
+
+        # JSON(URL 전달 / 배치) 또는 이미지 바이트(inline) 요청
+        input_urls = None
+        if 'json' in content_type:
+            try:
+                payload = json.loads(body or b'{}')
+            except ValueError:
+                self._send_json(422, {'detail': 'Invalid JSON'})
+                return
+            if 'InputUrls' in payload:
+                input_urls = payload['InputUrls']
+            elif not payload.get('InputUrl'):
+                self._send_json(422, {'detail': 'InputUrl is required'})
+                return
+        elif not body:
+            self._send_json(422, {'detail': 'Empty body'})
+            return
+
+        item_count = len(input_urls) if input_urls is not None else 1
+        config = self.server.config
+        stats = self.server.stats
+
+        with stats.lock:
+            stats.requests += 1
+            stats.items += item_count
+            stats.in_flight += 1
+            stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+
+        try:
+            if config.draw(lambda rng: rng.random()) < config.stall_rate:
+                time.sleep(config.stall_ms / 1000)
+            else:
+                delay = config.draw(config.latency.sample)
+                time.sleep(delay + config.batch_item_ms * (item_count - 1) / 1000)
+
+            if config.draw(lambda rng: rng.random()) < config.error_rate:
+                with stats.lock:
+                    stats.errors += 1
+                self._send_json(503, {'detail': 'Stub injected error'})
+                return
+
+            if input_urls is not None:
+                self._send_json(200, {'results': [self._detection() for _ in input_urls]})
+            else:
+                self._send_json(200, self._detection())
+        finally:
+            with stats.lock:
+                stats.in_flight -= 1
+
+    def _detection(self):
+        config = self.server.config
+        face_count = config.draw(lambda rng: rng.randint(config.min_faces, config.max_faces))
+
+        faces = []
+        for i in range(face_count):
+            faces.append({
+                'face_id': i + 1,
+                'rate': round(config.draw(lambda rng: rng.uniform(0.5, 0.99)), 2),
+                'is_deepfake': config.draw(lambda rng: rng.random()) < config.deepfake_rate,
+                'ResultUrl': (
+                    f'{config.result_url_base.rstrip("/")}/results/{uuid.uuid4().hex}.jpg'
+                    if config.result_url_base else None
+                ),
+            })
+
+        return {'face_count': face_count, 'face_quality_scores': faces}
+
+    def _send_json(self, status_code, data):
+        body = json.dumps(data).encode()
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class StubAIServer(ThreadingHTTPServer):
+    """스텁 AI 서버 (요청마다 스레드)"""
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=8001, config=None, verbose=False):
+        super().__init__((host, port), StubAIHandler)
+        self.config = config or StubConfig()
+        self.stats = StubStats()
+        self.verbose = verbose
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start_in_thread(self):
+        """백그라운드 스레드에서 실행 (벤치마크 명령에서 사용)"""
+        thread = threading.Thread(target=self.serve_forever, name='stub-ai-server', daemon=True)
+        thread.start()
+        return thread
+
+
+def add_stub_arguments(parser, prefix=''):
+    """스텁 설정 인자 등록 (CLI / 벤치마크 명령 공용)"""
+    parser.add_argument(f'--{prefix}latency', default='fixed:100',
+                        help='지연 시간 분포 (fixed:MS, uniform:MIN:MAX, normal:MEAN:STD, lognormal:MEDIAN:SIGMA)')
+    parser.add_argument(f'--{prefix}batch-item-ms', type=float, default=0.0,
+                        help='배치 요청의 항목당 추가 지연(ms)')
+    parser.add_argument(f'--{prefix}error-rate', type=float, default=0.0,
+                        help='503 응답 비율 (0-1)')
+    parser.add_argument(f'--{prefix}stall-rate', type=float, default=0.0,
+                        help='응답 지연(타임아웃 유발) 비율 (0-1)')
+    parser.add_argument(f'--{prefix}stall-ms', type=float, default=30000.0,
+                        help='응답 지연 시간(ms)')
+    parser.add_argument(f'--{prefix}faces', default='1:3',
+                        help='얼굴 수 범위 MIN:MAX')
+    parser.add_argument(f'--{prefix}deepfake-rate', type=float, default=0.3,
+                        help='얼굴별 딥페이크 판정 비율 (0-1)')
+    parser.add_argument(f'--{prefix}result-url-base', default=None,
+                        help='ResultUrl 접두사 (없으면 null)')
+    parser.add_argument(f'--{prefix}seed', type=int, default=None,
+                        help='난수 시드')
+
+
+def config_from_options(options, prefix=''):
+    """add_stub_arguments 로 받은 값 → StubConfig"""
+    key = prefix.replace('-', '_')
+    return StubConfig(
+        latency=options[f'{key}latency'],
+        batch_item_ms=options[f'{key}batch_item_ms'],
+        error_rate=options[f'{key}error_rate'],
+        stall_rate=options[f'{key}stall_rate'],
+        stall_ms=options[f'{key}stall_ms'],
+        faces=options[f'{key}faces'],
+        deepfake_rate=options[f'{key}deepfake_rate'],
+        result_url_base=options[f'{key}result_url_base'],
+        seed=options[f'{key}seed'],
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='FastAPI AI 서버 스텁')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    add_stub_arguments(parser)
+    options = vars(parser.parse_args(argv))
+
+    server = StubAIServer(
+        options['host'],
+        options['port'],
+        config=config_from_options(options),
+        verbose=options['verbose']
+    )
+    print(f'스텁 AI 서버 시작: {server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,545 @@
-from django.test import TestCase
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import unquote
+
+import requests
+from django.core.cache import cache, caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from media_files.services import FileService
+from media_files.models import SystemLog
+from media_files.storage import InMemoryS3Client, S3Storage
+from media_files.write_buffer import get_write_buffer
+from users.models import User
+
+from . import preprocess
+from . import jobs
+from .admission import AdmissionController, AdmissionRejected, CacheSemaphore
+from .backend_pool import AIBackendPool
+from .batching import InferenceBatcher
+from .circuit_breaker import AICircuitBreaker
+from .models import AnalysisJob
+from .pipeline import DetectionPipeline, extract_s3_key
+from .result_cache import AnalysisResultCache
+from .retry import Deadline, DeadlineExceeded, call_hedged, call_with_retries
+from .services import AIModelService
+
+
+def make_image(size=(1600, 1200)):
+    """축소 대상이 되는 큰 JPEG"""
+    buffer = io.BytesIO()
+    Image.effect_noise(size, 40).convert('RGB').save(buffer, 'JPEG', quality=95)
+    return SimpleUploadedFile('original.jpg', buffer.getvalue(), 'image/jpeg')
+
+
+@override_settings(
+    AWS_S3_BACKEND='memory',
+    AWS_STORAGE_BUCKET_NAME='test',
+    AI_TRANSPORT_MODE='url',
+    AI_DOWNSCALE_WORKERS=0,
+    AI_ADMISSION_ENABLED=False
+)
+class DownscaleUploadTest(TestCase):
+    """축소본은 AI 서버로만 보내고 저장/기록은 원본 기준인지 확인 (AI_TRANSPORT_MODE 유지)"""
+
+    def setUp(self):
+        InMemoryS3Client.clear()
+        self.user = User.objects.create_user(email='downscale@example.com', nickname='downscale')
+        # 업로드 시스템 로그를 테스트 트랜잭션 안에서 반영 (백그라운드 flush 와 겹치지 않게)
+        self.addCleanup(get_write_buffer().flush)
+
+    def analyze(self, image):
+        """원본 저장 + 추론 → (pipeline, AI 서버가 받은 (이미지 바이트, content_type) 목록)"""
+        sent = []
+
+        def fake_url(service, s3_url):
+            key = extract_s3_key(s3_url)
+            sent.append(InMemoryS3Client._objects[('test', unquote(key))])
+            return {'success': True, 'face_count': 0, 'face_quality_scores': [], 'processing_time': 1}
+
+        def fake_inline(service, file_obj, content_type):
+            sent.append((file_obj.read(), content_type))
+            return {'success': True, 'face_count': 0, 'face_quality_scores': [], 'processing_time': 1}
+
+        # 임시 객체 삭제가 끝날 때까지 기다릴 수 있도록 전용 실행기 사용
+        executor = ThreadPoolExecutor(max_workers=1)
+        pipeline = DetectionPipeline(self.user, profile='image')
+        with mock.patch.object(AIModelService, 'analyze_image', fake_url), \
+                mock.patch.object(AIModelService, 'analyze_image_inline', fake_inline), \
+                mock.patch('detection.pipeline._storage_executor', executor):
+            pipeline.upload_and_infer(image, 'image', 'detection')
+        executor.shutdown(wait=True)
+        return pipeline, sent
+
+    def test_original_is_stored(self):
+        original = make_image()
+        data = original.read()
+        pipeline, sent = self.analyze(original)
+
+        media_file = pipeline.media_file
+        stored, _ = InMemoryS3Client._objects[('test', media_file.s3_key)]
+        self.assertEqual(stored, data)
+        self.assertEqual(media_file.file_size, original.size)
+        self.assertEqual(media_file.file_format, 'jpg')
+
+        record = pipeline.persist(media_file, 'image', 'safe', 0, [])
+        self.assertEqual(record.file_size, original.size)
+
+        # AI 서버에는 축소본 임시 객체의 URL 만 전달하고, 추론이 끝나면 임시 객체 삭제
+        self.assertEqual(len(sent), 1)
+        downscaled, content_type = sent[0]
+        self.assertLess(len(downscaled), original.size)
+        self.assertEqual(content_type, 'image/jpeg')
+        with Image.open(io.BytesIO(downscaled)) as img:
+            self.assertEqual(max(img.size), 1280)
+        self.assertEqual(list(InMemoryS3Client._objects), [('test', media_file.s3_key)])
+
+    def test_small_image_is_sent_as_is(self):
+        # 긴 변이 등급 기준 이하 → 재인코딩하면 작아지더라도 원본 URL 그대로 전달
+        original = make_image((800, 600))
+        data = original.read()
+        self.assertIsNone(preprocess.resize_image_bytes(data, 1280, 85, 'JPEG'))
+
+        pipeline, sent = self.analyze(original)
+        self.assertEqual(sent, [(data, 'image/jpeg')])
+        self.assertEqual(list(InMemoryS3Client._objects), [('test', pipeline.media_file.s3_key)])
+
+    @override_settings(AI_TRANSPORT_MODE='inline')
+    def test_inline_sends_downscaled_bytes(self):
+        original = make_image()
+        data = original.read()
+        pipeline, sent = self.analyze(original)
+
+        self.assertEqual(len(sent), 1)
+        with Image.open(io.BytesIO(sent[0][0])) as img:
+            self.assertEqual(max(img.size), 1280)
+        stored, _ = InMemoryS3Client._objects[('test', pipeline.media_file.s3_key)]
+        self.assertEqual(stored, data)
+
+    @override_settings(AI_DOWNSCALE_WORKERS=1)
+    def test_broken_pool_falls_back_to_original(self):
+        original = make_image()
+        executor = mock.Mock()
+        executor.submit.side_effect = BrokenProcessPool('worker died')
+
+        with mock.patch.object(preprocess, '_executor', executor):
+            self.assertIs(preprocess.downscale_upload(original, 'medium'), original)
+            # 손상된 풀은 버리고 다음 요청에서 새로 생성
+            self.assertIsNone(preprocess._executor)
+        executor.shutdown.assert_called_once()
+
+        executor = mock.Mock()
+        executor.submit.side_effect = TypeError('cannot pickle')
+        with mock.patch.object(preprocess, '_executor', executor):
+            self.assertIs(preprocess.downscale_upload(original, 'medium'), original)
+
+
+class InferenceBatcherTest(TestCase):
+    """대기 시간이 지나 실패한 요청은 이후 배치로 보내지 않는지 확인"""
+
+    def test_timed_out_request_is_not_sent(self):
+        posted = []
+
+        def fake_post_batch(input_urls):
+            posted.append(input_urls)
+            return [{'face_count': 0, 'face_quality_scores': []} for _ in input_urls]
+
+        batcher = InferenceBatcher('http://ai.test', max_size=3, max_wait_ms=300)
+        with mock.patch.object(batcher, '_post_batch', side_effect=fake_post_batch):
+            first = batcher.submit('first')
+            with self.assertRaises(requests.exceptions.Timeout):
+                batcher.analyze('timed-out', timeout=0.05)
+            self.assertEqual(first.result(timeout=2), {'face_count': 0, 'face_quality_scores': []})
+
+            self.assertEqual(batcher.analyze('next', timeout=2)['face_count'], 0)
+
+        self.assertEqual(posted, [['first'], ['next']])
+
+
+def later(seconds):
+    """time 모듈 대신 쓸 객체 (time.time() 만 seconds 뒤로)"""
+    now = time.time() + seconds
+    return mock.Mock(time=lambda: now, monotonic=time.monotonic)
+
+
+@override_settings(AI_BREAKER_MIN_REQUESTS=2, AI_BREAKER_ERROR_THRESHOLD=0.5, AI_BREAKER_RESET_TIMEOUT=30)
+class CircuitBreakerTest(TestCase):
+    """closed → open → half_open(탐색 1개) → closed 전환 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.breaker = AICircuitBreaker(name='test')
+
+    def test_open_half_open_closed(self):
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.snapshot()['state'], AICircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+        with mock.patch('detection.circuit_breaker.time', later(31)):
+            # 대기 시간이 지나면 워커 전체에서 탐색 요청 1개만 허용
+            self.assertTrue(self.breaker.allow_request())
+            self.assertEqual(self.breaker.snapshot()['state'], AICircuitBreaker.HALF_OPEN)
+            self.assertFalse(AICircuitBreaker(name='test').allow_request())
+
+            self.breaker.record_success()
+
+        self.assertEqual(self.breaker.snapshot()['state'], AICircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_failed_probe_reopens(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        with mock.patch('detection.circuit_breaker.time', later(31)):
+            self.assertTrue(self.breaker.allow_request())
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.snapshot()['state'], AICircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+
+@override_settings(AI_RETRY_MAX_ATTEMPTS=100, AI_RETRY_BASE_DELAY=0.05, AI_RETRY_MAX_DELAY=0.05)
+class RetryTest(TestCase):
+    """재시도는 마감 시간 안에서만, 헤징은 지연 시간이 지난 뒤에만 일어나는지 확인"""
+
+    def test_retries_stop_at_deadline(self):
+        attempts = []
+
+        def send(timeout):
+            attempts.append(timeout)
+            raise requests.exceptions.ConnectionError('down')
+
+        deadline = Deadline(0.3)
+        with mock.patch('detection.retry.random.uniform', side_effect=lambda low, high: high):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                call_with_retries(send, deadline)
+
+        # 0.05초 간격이면 최대 약 6번 (100번 한도까지 가지 않음)
+        self.assertGreater(len(attempts), 1)
+        self.assertLessEqual(len(attempts), 7)
+        self.assertTrue(all(read <= 0.3 for _, read in attempts))
+        self.assertLess(time.monotonic(), deadline.expires_at + 0.1)
+
+    def test_expired_deadline_is_not_sent(self):
+        send = mock.Mock()
+        with self.assertRaises(DeadlineExceeded):
+            call_with_retries(send, Deadline(0))
+        send.assert_not_called()
+
+    def test_hedge_replaces_failed_primary(self):
+        hedge_started = threading.Event()
+        threads = []
+
+        def primary():
+            threads.append(threading.current_thread())
+            # 중복 요청이 시작된 뒤 첫 요청 실패
+            hedge_started.wait(2)
+            raise requests.exceptions.ReadTimeout('slow')
+
+        def hedge():
+            hedge_started.set()
+            return 'hedge'
+
+        started = time.monotonic()
+        self.assertEqual(call_hedged(primary, 0.05, Deadline(5), hedge_call=hedge), 'hedge')
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        # 첫 요청은 헤징 스레드 풀을 거치지 않고 호출 스레드에서 실행
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_fast_primary_is_not_hedged(self):
+        with mock.patch('detection.retry._hedge_executor') as executor:
+            self.assertEqual(call_hedged(lambda: 'primary', 0.05, Deadline(5)), 'primary')
+            time.sleep(0.1)
+        executor.submit.assert_not_called()
+
+
+@override_settings(
+    AI_BREAKER_MIN_REQUESTS=1,
+    AI_BREAKER_RESET_TIMEOUT=30,
+    AI_BACKEND_SLOW_START=30,
+    AI_BACKEND_SLOW_START_MIN_WEIGHT=0.1
+)
+class BackendPoolTest(TestCase):
+    """least outstanding 선택, 장애 백엔드 제외, 복구 후 slow-start 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.pool = AIBackendPool(['http://ai-a', 'http://ai-b', 'http://ai-c'])
+        self.a, self.b, self.c = self.pool.backends
+
+    def test_least_outstanding(self):
+        with self.pool.track(self.a), self.pool.track(self.b), self.pool.track(self.b):
+            self.assertIs(self.pool.pick(), self.c)
+            with self.pool.track(self.c), self.pool.track(self.c):
+                self.assertIs(self.pool.pick(), self.a)
+        # 직전에 실패한 백엔드는 가능하면 피함
+        self.assertIn(self.pool.pick(exclude=(self.a, self.b)), [self.c])
+
+    def test_ejection_and_slow_start(self):
+        self.c.record_failure(requests.exceptions.ConnectionError('down'))
+        self.assertEqual(self.pool.stats()[2]['state'], AICircuitBreaker.OPEN)
+        for _ in range(10):
+            self.assertIsNot(self.pool.pick(), self.c)
+
+        with mock.patch('detection.circuit_breaker.time', later(31)):
+            # 복구 확인 시점 → 탐색 요청 1개는 제외된 백엔드로
+            self.assertIs(self.pool.pick(), self.c)
+            self.c.record_success()
+
+        # 복구 직후에는 가중치가 낮아 다른 백엔드가 한가하면 선택되지 않음
+        self.assertEqual(self.pool.stats()[2]['weight'], 0.1)
+        for _ in range(10):
+            self.assertIsNot(self.pool.pick(), self.c)
+        with self.pool.track(self.a), self.pool.track(self.b):
+            self.assertIsNot(self.pool.pick(), self.c)
+
+        with mock.patch('detection.backend_pool.time', later(30)):
+            self.assertEqual(self.pool.stats()[2]['weight'], 1.0)
+            with self.pool.track(self.a), self.pool.track(self.b):
+                self.assertIs(self.pool.pick(), self.c)
+
+
+@override_settings(
+    AWS_STORAGE_BUCKET_NAME='test',
+    AI_TRANSPORT_MODE='url',
+    AI_ADMISSION_ENABLED=True,
+    AI_ADMISSION_USER_LIMIT=1,
+    AI_ADMISSION_LIMITS={'image': 1},
+    AI_ADMISSION_MAX_QUEUE={'image': 0},
+    AI_ADMISSION_RETRY_AFTER=7
+)
+class AdmissionTest(TestCase):
+    """동시 추론 한도를 넘으면 이미지 분석 API가 429/503 + Retry-After 를 반환하는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='admission@example.com', nickname='admission')
+        # 업로드 시스템 로그를 테스트 트랜잭션 안에서 반영 (백그라운드 flush 와 겹치지 않게)
+        self.addCleanup(get_write_buffer().flush)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def analyze(self):
+        with mock.patch.object(FileService, '_save_to_s3', return_value=('detection/a.jpg', 'detection/a.jpg')), \
+                mock.patch.object(S3Storage, 'get_presigned_url', return_value='http://s3.test/a.jpg'), \
+                mock.patch.object(AIModelService, 'analyze_image', side_effect=AssertionError):
+            return self.client.post('/api/detection/image/', {'image': make_image((200, 150))})
+
+    def test_user_limit_returns_429(self):
+        lease = AdmissionController('image', self.user.pk).user_semaphore.try_acquire()
+        self.assertIsNotNone(lease)
+
+        response = self.analyze()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '7')
+        self.assertEqual(response.data['retry_after'], 7)
+
+    def test_full_queue_returns_503(self):
+        # 다른 사용자가 분석 종류 슬롯을 모두 사용 중이고 대기열 길이는 0
+        lease = CacheSemaphore('image', 1, 60).try_acquire()
+        self.assertIsNotNone(lease)
+
+        response = self.analyze()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '7')
+        self.assertEqual(AdmissionController('image', self.user.pk).stats()['queued'], 0)
+
+    @override_settings(AI_ADMISSION_MAX_QUEUE={'image': 1}, AI_ADMISSION_MAX_WAIT=0.05)
+    def test_abandoned_waiter_expires(self):
+        CacheSemaphore('image', 1, 60).try_acquire()
+        controller = AdmissionController('image', self.user.pk)
+        # 대기 중 종료된 워커가 남긴 대기열 자리 (반납되지 않음)
+        self.assertIsNotNone(controller.queue_semaphore.try_acquire())
+
+        self.assertEqual(self.analyze().status_code, 503)
+        self.assertEqual(controller.stats()['queued'], 1)
+
+        # 최대 대기 시간이 지나면 자리가 만료되어 다시 대기할 수 있음
+        with mock.patch('django.core.cache.backends.locmem.time', later(6)):
+            self.assertEqual(controller.stats()['queued'], 0)
+            self.assertIsNotNone(controller.queue_semaphore.try_acquire())
+
+
+@override_settings(
+    AWS_S3_BACKEND='memory',
+    AWS_STORAGE_BUCKET_NAME='test',
+    VIDEO_ANALYSIS_ASYNC=True,
+    AI_ADMISSION_ENABLED=False,
+    ANALYSIS_JOB_MAX_ATTEMPTS=2,
+    ANALYSIS_JOB_RETRY_DELAY=10
+)
+class AnalysisJobTest(TestCase):
+    """영상 분석 작업 등록 → 점유 → 완료/재시도/연기 흐름 확인"""
+
+    def setUp(self):
+        InMemoryS3Client.clear()
+        self.user = User.objects.create_user(email='jobs@example.com', nickname='jobs')
+        # 업로드/실패 시스템 로그를 테스트 트랜잭션 안에서 반영 (백그라운드 flush 와 겹치지 않게)
+        self.addCleanup(get_write_buffer().flush)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def enqueue(self):
+        video = SimpleUploadedFile('clip.mp4', b'\x00' * 1024, 'video/mp4')
+        response = self.client.post('/api/detection/video/', {'video': video})
+        self.assertEqual(response.status_code, 202)
+        return AnalysisJob.objects.get(job_id=response.data['job_id'])
+
+    def test_enqueue_claim_and_complete(self):
+        job = self.enqueue()
+        self.assertEqual(job.status, 'queued')
+        self.assertEqual(job.max_attempts, 2)
+
+        job = jobs.claim_next_job('worker-1')
+        self.assertEqual((job.status, job.attempts, job.locked_by), ('running', 1, 'worker-1'))
+        self.assertIsNone(jobs.claim_next_job('worker-2'))
+
+        result = {'success': True, 'face_count': 1, 'face_quality_scores': [], 'processing_time': 1}
+        with mock.patch.object(AIModelService, 'analyze_video', return_value=result) as analyze_video:
+            job = jobs.process_job(job)
+
+        analyze_video.assert_called_once()
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertIsNone(job.locked_by)
+        self.assertEqual(job.record.analysis_type, 'video')
+
+    def test_failure_backs_off_then_fails(self):
+        self.enqueue()
+        now = timezone.now()
+        failure = {'success': False, 'error': 'AI 서버 오류'}
+
+        with mock.patch.object(AIModelService, 'analyze_video', return_value=failure), \
+                mock.patch('django.utils.timezone.now', return_value=now):
+            job = jobs.process_job(jobs.claim_next_job('worker-1'))
+            self.assertEqual(job.status, 'queued')
+            self.assertEqual(job.available_at, now + timedelta(seconds=10))
+
+            # 대기 시간이 지나기 전에는 다시 점유되지 않음
+            self.assertIsNone(jobs.claim_next_job('worker-1'))
+
+        with mock.patch.object(AIModelService, 'analyze_video', return_value=failure), \
+                mock.patch('django.utils.timezone.now', return_value=now + timedelta(seconds=10)):
+            job = jobs.process_job(jobs.claim_next_job('worker-1'))
+
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+        get_write_buffer().flush()
+        self.assertTrue(SystemLog.objects.filter(error_code='ANALYSIS_JOB_FAILED').exists())
+
+    def test_admission_rejected_defers_without_attempt(self):
+        self.enqueue()
+        now = timezone.now()
+        rejected = AdmissionRejected('혼잡', 503, 7)
+
+        with mock.patch.object(AIModelService, 'analyze_video', side_effect=rejected), \
+                mock.patch('django.utils.timezone.now', return_value=now):
+            job = jobs.process_job(jobs.claim_next_job('worker-1'))
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('queued', 0))
+        self.assertEqual(job.available_at, now + timedelta(seconds=7))
+
+    @override_settings(ANALYSIS_JOB_LOCK_TIMEOUT=60)
+    def test_stale_lock_is_requeued(self):
+        self.enqueue()
+        job = jobs.claim_next_job('worker-1')
+
+        self.assertEqual(jobs.requeue_stale_jobs(), 0)
+        with mock.patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(seconds=61)):
+            self.assertEqual(jobs.requeue_stale_jobs(), 1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'queued')
+        self.assertIsNone(job.locked_by)
+        # 잠금을 잃은 워커는 더 이상 잠금 시간을 갱신하지 못함
+        self.assertFalse(jobs.touch_job(job))
+
+    @override_settings(ANALYSIS_JOB_LOCK_TIMEOUT=0.15)
+    def test_running_job_refreshes_lock(self):
+        self.enqueue()
+        job = jobs.claim_next_job('worker-1')
+        beats = threading.Event()
+
+        def slow_analyze(service, s3_url):
+            # 마감 시간보다 오래 걸리는 추론 동안 잠금 시간 갱신이 일어날 때까지 대기
+            self.assertTrue(beats.wait(2))
+            return {'success': True, 'face_count': 0, 'face_quality_scores': [], 'processing_time': 1}
+
+        with mock.patch.object(AIModelService, 'analyze_video', slow_analyze), \
+                mock.patch.object(jobs, 'touch_job', side_effect=lambda job: beats.set()):
+            job = jobs.process_job(job)
+
+        self.assertEqual(job.status, 'completed')
+
+
+@override_settings(
+    AWS_S3_BACKEND='memory',
+    AWS_STORAGE_BUCKET_NAME='test',
+    AI_TRANSPORT_MODE='url',
+    AI_DOWNSCALE_WORKERS=0,
+    AI_ADMISSION_ENABLED=False
+)
+class ResultCacheTest(TestCase):
+    """같은 내용의 이미지를 다시 올리면 AI 추론 없이 캐시된 결과를 쓰는지 확인"""
+
+    def setUp(self):
+        InMemoryS3Client.clear()
+        cache.clear()
+        caches['ai_results'].clear()
+        self.user = User.objects.create_user(email='result-cache@example.com', nickname='result-cache')
+        # 업로드 시스템 로그를 테스트 트랜잭션 안에서 반영 (백그라운드 flush 와 겹치지 않게)
+        self.addCleanup(get_write_buffer().flush)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def analyze(self, data, name='face.jpg'):
+        image = SimpleUploadedFile(name, data, 'image/jpeg')
+        response = self.client.post('/api/detection/image/', {'image': image})
+        self.assertEqual(response.status_code, 201)
+        return response
+
+    def test_identical_upload_skips_inference(self):
+        data = make_image((400, 300)).read()
+        other = make_image((400, 300)).read()
+        result = {'success': True, 'face_count': 1, 'face_quality_scores': [], 'processing_time': 1}
+
+        with mock.patch.object(AIModelService, 'analyze_image', return_value=result) as analyze_image:
+            first = self.analyze(data)
+            # 파일 이름이 달라도 내용이 같으면 캐시 히트
+            second = self.analyze(data, name='copy.jpg')
+            self.assertEqual(analyze_image.call_count, 1)
+
+            third = self.analyze(other)
+            self.assertEqual(analyze_image.call_count, 2)
+
+        self.assertEqual(
+            [first.data['cache_hit'], second.data['cache_hit'], third.data['cache_hit']],
+            [False, True, False]
+        )
+        self.assertEqual(second.data['face_count'], 1)
+        stats = AnalysisResultCache().stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+    def test_failed_inference_is_not_cached(self):
+        data = make_image((400, 300)).read()
+        failure = {'success': False, 'error': 'AI 서버 오류'}
+        result = {'success': True, 'face_count': 0, 'face_quality_scores': [], 'processing_time': 1}
+
+        with mock.patch.object(AIModelService, 'analyze_image', return_value=failure):
+            image = SimpleUploadedFile('face.jpg', data, 'image/jpeg')
+            self.assertEqual(self.client.post('/api/detection/image/', {'image': image}).status_code, 500)
+
+        with mock.patch.object(AIModelService, 'analyze_image', return_value=result) as analyze_image:
+            self.assertFalse(self.analyze(data).data['cache_hit'])
+        analyze_image.assert_called_once()
 
-# Create your tests here.
@@ -3,6 +3,7 @@ from django.urls import path
 from .views import (
     ImageAnalysisView,
     VideoAnalysisView,
+    AnalysisJobDetailView,
     AnalysisRecordListView,
     AnalysisRecordDetailView,
     AnalysisStatisticsView,
@@ -16,6 +17,9 @@ urlpatterns = [
     path('image/', ImageAnalysisView.as_view(), name='image_analysis'),
     path('video/', VideoAnalysisView.as_view(), name='video_analysis'),
     
+    # 비동기 작업 상태
+    path('jobs/<int:pk>/', AnalysisJobDetailView.as_view(), name='job_detail'),
+    
     # 기록
     path('records/', AnalysisRecordListView.as_view(), name='record_list'),
     path('records/<int:pk>/', AnalysisRecordDetailView.as_view(), name='record_detail'),
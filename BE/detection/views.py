@@ -3,18 +3,37 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.db.models import Count, Q
 from django.conf import settings
+from django.urls import reverse
 import os
 
-from .models import AnalysisRecord
+from .admission import AdmissionRejected, get_admission_stats
+from .batching import get_batch_stats
+from .preprocess import QualityTierStats
+from .jobs import enqueue_video_analysis
+from .pipeline import AnalysisFailedError, DetectionPipeline
+from .result_cache import AnalysisResultCache
+from .models import AnalysisRecord, AnalysisJob
 from .serializers import (
     AnalysisRecordSerializer,
     AnalysisRecordListSerializer,
+    AnalysisJobSerializer,
     ImageAnalysisRequestSerializer,
     VideoAnalysisRequestSerializer,
     AnalysisStatisticsSerializer
 )
 from .services import AIModelService
 from media_files.services import FileService
+from media_files.upload_handlers import get_content_hash
+from media_files.write_buffer import get_write_buffer
+
+
+def admission_rejected_response(error):
+    """동시 추론 한도 초과 응답 (429 / 503 + Retry-After)"""
+    return Response(
+        {'error': str(error), 'retry_after': error.retry_after},
+        status=error.status_code,
+        headers={'Retry-After': str(error.retry_after)}
+    )
 
 
 class ImageAnalysisView(APIView):
@@ -32,106 +51,40 @@ class ImageAnalysisView(APIView):
         image = serializer.validated_data['image']
         analysis_type = serializer.validated_data['analysis_type']
         
-        # ✅ FileService 사용
-        file_service = FileService(request.user)
+        # ✅ 공통 탐지 파이프라인 (추론 1회)
+        pipeline = DetectionPipeline(request.user, request)
         
         try:
-            # ✅ 통합 파일 업로드
-            media_file = file_service.upload_file(
-                uploaded_file=image,
+            output = pipeline.run(
+                image,
                 file_type='image',
                 purpose='detection',
+                analysis_type=analysis_type,
                 is_temporary=True,  # 분석 후 삭제
-                use_s3=True
+                content_hash=get_content_hash(image)
             )
-            
-            # ✅ S3 URL 생성
-            from media_files.storage import S3Storage
-            
-            if media_file.storage_type == 's3':
-                s3_storage = S3Storage()
-                s3_url = s3_storage.get_presigned_url(media_file.s3_key)
-            else:
-                # 로컬 파일인 경우 전체 URL 생성
-                s3_url = request.build_absolute_uri(f'/media/{media_file.file_path}')
-            
-            # AI 분석 (S3 URL 전달)
-            ai_service = AIModelService()
-            result = ai_service.analyze_image(s3_url)
-            
-            if not result['success']:
-                return Response(
-                    {'error': result['error']},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-            
-            # AI 분석
-            ai_service = AIModelService()
-            result = ai_service.analyze_image(s3_url)
-
-            if not result['success']:
-                return Response(...)
-
-            # ✅ ResultUrl을 Presigned URL로 변환 (먼저!)
-            from media_files.storage import S3Storage
-            import re
-
-            for face in result['face_quality_scores']:  # ← result에서 직접!
-                if 'ResultUrl' in face and face['ResultUrl']:
-                    original_url = face['ResultUrl']
-                    
-                    # S3 키 추출
-                    match = re.search(r'amazonaws\.com/(.+?)$', original_url)
-                    if match:
-                        s3_key = match.group(1)
-                        
-                        # Presigned URL 생성
-                        s3_storage = S3Storage()
-                        face['ResultUrl'] = s3_storage.get_presigned_url(s3_key)
-
-            # ✅ 이제 변환된 face_quality_scores로 판정 계산
-            face_scores = result['face_quality_scores']
-            is_any_deepfake = any(face['is_deepfake'] for face in face_scores)
-            avg_confidence = sum(face['rate'] for face in face_scores) / len(face_scores) if face_scores else 0
-
-            # 분석 결과 결정
-            if is_any_deepfake:
-                analysis_result = 'deepfake' if avg_confidence >= 0.8 else 'suspicious'
-            else:
-                analysis_result = 'safe'
-
-            # 분석 기록 저장
-            record = AnalysisRecord.objects.create(
-                user=request.user,
-                analysis_type=analysis_type,
-                file_name=media_file.original_name,
-                file_size=media_file.file_size,
-                file_format=media_file.file_format,
-                original_path=media_file.file_path,
-                analysis_result=analysis_result,
-                confidence_score=avg_confidence * 100,  # 0-100 스케일
-                detection_details=face_scores,  # ✅ 다중 얼굴 결과 저장
-                processing_time=result['processing_time'],
-                ai_model_version='v1.0'
+        except AdmissionRejected as e:
+            return admission_rejected_response(e)
+        except AnalysisFailedError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-            
-            media_file.related_model = 'AnalysisRecord'
-            media_file.related_record_id = record.record_id
-            media_file.save()
-            
-            # ✅ 새로운 API 응답 구조
-            return Response({
-                'record_id': record.record_id,
-                'face_count': result['face_count'],
-                'face_quality_scores': result['face_quality_scores'],
-                'processing_time': result['processing_time']
-            }, status=status.HTTP_201_CREATED)
-        
         except ValueError as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # ✅ 새로운 API 응답 구조
+        return Response({
+            'record_id': output['record'].record_id,
+            'face_count': output['face_count'],
+            'face_quality_scores': output['face_quality_scores'],
+            'processing_time': pipeline.processing_time,
+            'processing_stages': pipeline.timings,
+            'cache_hit': output['cache_hit']
+        }, status=status.HTTP_201_CREATED)
 
 
 class VideoAnalysisView(APIView):
@@ -148,107 +101,67 @@ class VideoAnalysisView(APIView):
         
         video = serializer.validated_data['video']
         
-        # ✅ FileService 사용
-        file_service = FileService(request.user)
+        # ✅ 공통 탐지 파이프라인 (영상 마감 시간 적용)
+        pipeline = DetectionPipeline(request.user, request, profile='video')
         
         try:
-            # ✅ 통합 파일 업로드
-            media_file = file_service.upload_file(
-                uploaded_file=video,
+            media_file = pipeline.upload(
+                video,
                 file_type='video',
                 purpose='detection',
-                is_temporary=True,  # 분석 후 삭제
-                use_s3=True
+                is_temporary=True  # 분석 후 삭제
             )
             
-            # ✅ S3 URL 생성
-            from media_files.storage import S3Storage
+            # ✅ 비동기 모드: 작업 등록 후 즉시 202 응답 (워커가 추론 수행)
+            if settings.VIDEO_ANALYSIS_ASYNC:
+                input_url = None
+                if media_file.storage_type != 's3':
+                    input_url = request.build_absolute_uri(f'/media/{media_file.file_path}')
+                
+                job = enqueue_video_analysis(request.user, media_file, input_url=input_url)
+                
+                return Response({
+                    'job_id': job.job_id,
+                    'status': job.status,
+                    'status_url': request.build_absolute_uri(
+                        reverse('detection:job_detail', args=[job.job_id])
+                    )
+                }, status=status.HTTP_202_ACCEPTED)
             
-            if media_file.storage_type == 's3':
-                s3_storage = S3Storage()
-                s3_url = s3_storage.get_presigned_url(media_file.s3_key)
-            else:
-                # 로컬 파일인 경우 전체 URL 생성
-                s3_url = request.build_absolute_uri(f'/media/{media_file.file_path}')
-            
-            # AI 분석 (S3 URL 전달)
-            ai_service = AIModelService()
-            result = ai_service.analyze_video(s3_url)
-            
-            if not result['success']:
-                return Response(
-                    {'error': result['error']},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-            
-            # AI 분석
-            ai_service = AIModelService()
-            result = ai_service.analyze_image(s3_url)
-
-            if not result['success']:
-                return Response(...)
-
-            # ✅ ResultUrl을 Presigned URL로 변환 (먼저!)
-            from media_files.storage import S3Storage
-            import re
-
-            for face in result['face_quality_scores']:  # ← result에서 직접!
-                if 'ResultUrl' in face and face['ResultUrl']:
-                    original_url = face['ResultUrl']
-                    
-                    # S3 키 추출
-                    match = re.search(r'amazonaws\.com/(.+?)$', original_url)
-                    if match:
-                        s3_key = match.group(1)
-                        
-                        # Presigned URL 생성
-                        s3_storage = S3Storage()
-                        face['ResultUrl'] = s3_storage.get_presigned_url(s3_key)
-
-            # ✅ 이제 변환된 face_quality_scores로 판정 계산
-            face_scores = result['face_quality_scores']
-            is_any_deepfake = any(face['is_deepfake'] for face in face_scores)
-            avg_confidence = sum(face['rate'] for face in face_scores) / len(face_scores) if face_scores else 0
-
-            # 분석 결과 결정
-            if is_any_deepfake:
-                analysis_result = 'deepfake' if avg_confidence >= 0.8 else 'suspicious'
-            else:
-                analysis_result = 'safe'
-            
-            # 분석 기록 저장
-            record = AnalysisRecord.objects.create(
-                user=request.user,
-                analysis_type='video',
-                file_name=media_file.original_name,
-                file_size=media_file.file_size,
-                file_format=media_file.file_format,
-                original_path=media_file.file_path,
-                analysis_result=analysis_result,
-                confidence_score=avg_confidence * 100,  # 0-100 스케일
-                detection_details=face_scores,  # ✅ 다중 얼굴 결과 저장
-                processing_time=result['processing_time'],
-                ai_model_version='v1.0'
+            input_url = pipeline.locate(media_file)
+            output = pipeline.analyze(media_file, input_url, 'video', kind='video')
+        except AdmissionRejected as e:
+            return admission_rejected_response(e)
+        except AnalysisFailedError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-            
-            # ✅ 관계 연결
-            media_file.related_model = 'AnalysisRecord'
-            media_file.related_record_id = record.record_id
-            media_file.save()
-            
-            # ✅ 새로운 API 응답 구조
-            return Response({
-                'record_id': record.record_id,
-                'face_count': result['face_count'],
-                'face_quality_scores': result['face_quality_scores'],
-                'processing_time': result['processing_time']
-            }, status=status.HTTP_201_CREATED)
-        
         except ValueError as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # ✅ 새로운 API 응답 구조
+        return Response({
+            'record_id': output['record'].record_id,
+            'face_count': output['face_count'],
+            'face_quality_scores': output['face_quality_scores'],
+            'processing_time': pipeline.processing_time,
+            'processing_stages': pipeline.timings
+        }, status=status.HTTP_201_CREATED)
+
+
+class AnalysisJobDetailView(generics.RetrieveAPIView):
+    """비동기 분석 작업 상태 조회 API"""
+    
+    serializer_class = AnalysisJobSerializer
+    
+    def get_queryset(self):
+        return AnalysisJob.objects.filter(
+            user=self.request.user
+        ).select_related('record')
 
 
 class AnalysisRecordListView(generics.ListAPIView):
@@ -300,6 +213,10 @@ class AnalysisRecordDetailView(generics.RetrieveDestroyAPIView):
             except:
                 pass
         
+        # Zoom 캡처 기록이면 세션 보고서 스냅샷도 다시 만들도록 삭제
+        from zoom.reports import invalidate_snapshots
+        invalidate_snapshots(session__captures__record=instance)
+        
         # 분석 기록 삭제
         instance.delete()
 
@@ -337,9 +254,21 @@ class AIHealthCheckView(APIView):
     
     def get(self, request):
         ai_service = AIModelService()
-        is_healthy = ai_service.check_health()
+        health = ai_service.get_health_state()
         
         return Response({
-            'status': 'healthy' if is_healthy else 'unhealthy',
-            'fastapi_url': ai_service.fastapi_url
+            'status': health['status'],
+            'fastapi_url': settings.FASTAPI_URL,
+            'fastapi_urls': settings.FASTAPI_URLS,
+            'breaker_state': health['state'],
+            'error_rate': health['error_rate'],
+            'recent_requests': health['recent_requests'],
+            'recent_errors': health['recent_errors'],
+            'window_seconds': health['window_seconds'],
+            'backends': health['backends'],
+            'result_cache': AnalysisResultCache().stats(),
+            'batching': get_batch_stats(),
+            'admission': get_admission_stats(),
+            'quality_tiers': QualityTierStats().stats(),
+            'write_buffer': get_write_buffer().stats()
         })
\ No newline at end of file
@@ -0,0 +1,173 @@
+import io
+import math
+import threading
+import time
+import uuid
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from media_files.storage import create_s3_client
+
+
+def percentile(sorted_values, pct):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class _EmptyBody:
+    """AWSResponse 용 빈 응답 본문"""
+
+    def stream(self, **kwargs):
+        yield b''
+
+
+def _fake_send(request, **kwargs):
+    """네트워크 전송 대신 200 응답 (S3 왕복을 뺀 클라이언트 측 비용만 측정)"""
+    return AWSResponse(request.url, 200, {'ETag': '"benchmark"'}, _EmptyBody())
+
+
+class Command(BaseCommand):
+    """
+    S3 클라이언트 생성 방식별 처리량 벤치마크
+
+    per-call: 작업마다 boto3.client('s3') 를 새로 생성 (기존 S3Storage() 동작)
+    shared:   튜닝된 클라이언트 1개를 모든 스레드가 공유 (get_s3_client())
+
+    기본은 네트워크 전송을 가로채 200 응답을 돌려주므로 클라이언트 생성/서명/직렬화 비용만 측정한다.
+    --live 를 주면 설정된 버킷에 실제로 업로드하고 벤치마크 객체를 삭제한다.
+
+    사용법:
+        python manage.py benchmark_s3 --iterations 200 --threads 8
+        python manage.py benchmark_s3 --ops upload --live --object-kb 256
+    """
+
+    help = 'S3 클라이언트를 작업마다 생성할 때와 공유할 때의 처리량/지연 시간을 비교합니다.'
+
+    MODES = ('per-call', 'shared')
+    OPS = ('presign', 'upload')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', nargs='+', choices=self.MODES, default=list(self.MODES),
+                            help='측정할 클라이언트 생성 방식')
+        parser.add_argument('--ops', nargs='+', choices=self.OPS, default=list(self.OPS),
+                            help='측정할 작업 (presign: 서명 URL 생성, upload: upload_fileobj)')
+        parser.add_argument('--iterations', type=int, default=200, help='방식/작업별 반복 수')
+        parser.add_argument('--threads', type=int, default=8, help='동시 실행 스레드 수')
+        parser.add_argument('--object-kb', type=int, default=64, help='업로드 객체 크기(KB)')
+        parser.add_argument('--live', action='store_true',
+                            help='실제 S3 버킷 사용 (AWS_STORAGE_BUCKET_NAME 과 자격 증명 필요)')
+
+    def handle(self, *args, **options):
+        self.live = options['live']
+        self.bucket = settings.AWS_STORAGE_BUCKET_NAME or 'benchmark-bucket'
+        self.payload = b'\0' * (options['object_kb'] * 1024)
+        self.prefix = f'benchmark/{uuid.uuid4().hex}'
+        self.uploaded = []
+        self.uploaded_lock = threading.Lock()
+
+        self.client_options = {'region_name': settings.AWS_REGION or 'ap-northeast-2'}
+        if self.live:
+            self.client_options.update(
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            )
+        else:
+            # 서명만 가능하면 되므로 더미 자격 증명 사용 (자격 증명 조회 체인을 타지 않음)
+            self.client_options.update(aws_access_key_id='benchmark', aws_secret_access_key='benchmark')
+            self.stdout.write('네트워크 전송을 가로채 200 응답을 반환합니다 (--live 로 실제 S3 측정).')
+
+        shared = self.make_client(shared=True)
+        try:
+            for op in options['ops']:
+                for mode in options['modes']:
+                    result = self.run(mode, op, shared, options['iterations'], options['threads'])
+                    self.report(mode, op, result)
+        finally:
+            if self.live and self.uploaded:
+                for i in range(0, len(self.uploaded), 1000):
+                    shared.delete_objects(Bucket=self.bucket, Delete={
+                        'Objects': [{'Key': key} for key in self.uploaded[i:i + 1000]],
+                        'Quiet': True,
+                    })
+
+    def make_client(self, shared):
+        if shared:
+            client = create_s3_client(**self.client_options)
+        else:
+            # 기존 S3Storage() 와 같은 방식 (기본 세션, 기본 Config)
+            client = boto3.client('s3', **self.client_options)
+        if not self.live:
+            client.meta.events.register('before-send.s3', _fake_send)
+        return client
+
+    def run(self, mode, op, shared, iterations, threads):
+        latencies = []
+        lock = threading.Lock()
+        counter = iter(range(iterations))
+        errors = []
+
+        def worker():
+            while True:
+                with lock:
+                    i = next(counter, None)
+                if i is None:
+                    return
+                started = time.perf_counter()
+                try:
+                    client = shared if mode == 'shared' else self.make_client(shared=False)
+                    self.perform(client, op, f'{self.prefix}/{mode}-{i}')
+                except Exception as e:
+                    with lock:
+                        errors.append(e)
+                    continue
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+
+        wall_started = time.perf_counter()
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+
+        return {
+            'latencies': sorted(latencies),
+            'wall_time': time.perf_counter() - wall_started,
+            'errors': errors,
+        }
+
+    def perform(self, client, op, key):
+        if op == 'presign':
+            client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket, 'Key': key},
+                ExpiresIn=settings.AWS_PRESIGNED_URL_EXPIRATION
+            )
+        else:
+            client.upload_fileobj(io.BytesIO(self.payload), self.bucket, key,
+                                  ExtraArgs={'ContentType': 'application/octet-stream'})
+            if self.live:
+                with self.uploaded_lock:
+                    self.uploaded.append(key)
+
+    def report(self, mode, op, result):
+        latencies = result['latencies']
+        throughput = len(latencies) / result['wall_time'] if result['wall_time'] else 0.0
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'[{op} / {mode}]'))
+        self.stdout.write(f'  성공 {len(latencies)}건, 실패 {len(result["errors"])}건')
+        self.stdout.write(f'  처리량 {throughput:.1f} ops/s (총 {result["wall_time"]:.2f}s)')
+        self.stdout.write(
+            f'  지연 p50 {percentile(latencies, 50) * 1000:.1f}ms'
+            f' / p95 {percentile(latencies, 95) * 1000:.1f}ms'
+            f' / p99 {percentile(latencies, 99) * 1000:.1f}ms'
+        )
+        if result['errors']:
+            self.stdout.write(self.style.WARNING(f'  첫 오류: {result["errors"][0]!r}'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from media_files.write_buffer import WriteBehindBuffer
+
+
+class Command(BaseCommand):
+    """
+    종료된 워커가 남긴 쓰기 저널 반영
+
+    워커는 쓰기 버퍼를 처음 사용할 때 같은 서버의 남은 저널을 자동으로 복구한다.
+    배포 직후 요청이 들어오기 전에 미리 반영하거나, 복구가 실패했을 때 수동으로 실행한다.
+
+    사용법:
+        python manage.py flush_write_journal
+    """
+
+    help = '종료된 워커가 남긴 쓰기 저널(WRITE_BUFFER_JOURNAL_DIR)을 DB에 반영합니다.'
+
+    def handle(self, *args, **options):
+        buffer = WriteBehindBuffer()
+        recovered = buffer.recover()
+        self.stdout.write(f'저널 반영 완료: {recovered}건 ({buffer.journal_dir})')
@@ -6,6 +6,7 @@ from django.core.files.uploadedfile import UploadedFile
 from django.utils import timezone
 from .models import MediaFile, SystemLog
 from .storage import S3Storage
+from .write_buffer import get_write_buffer
 
 
 
@@ -57,6 +58,36 @@ class FileService:
         # 1. 파일 검증
         self._validate_file(uploaded_file, file_type)
         
+        # 2~3. 파일명 생성 및 저장
+        stored = self.store_file(uploaded_file, purpose, use_s3=use_s3)
+        
+        # 4~6. DB 저장 및 로그 기록
+        return self.register_file(
+            uploaded_file,
+            stored,
+            file_type=file_type,
+            purpose=purpose,
+            is_temporary=is_temporary,
+            metadata=metadata
+        )
+    
+    def validate_file(self, uploaded_file: UploadedFile, file_type: str):
+        """파일 유효성 검사 (저장 전에 따로 검사할 때 사용)"""
+        self._validate_file(uploaded_file, file_type)
+    
+    def store_file(
+        self,
+        uploaded_file: UploadedFile,
+        purpose: str,
+        use_s3: bool = False
+    ) -> dict:
+        """
+        파일 저장만 수행 (DB 기록 없음, 별도 스레드에서 호출 가능)
+        
+        Returns:
+            dict: register_file 에 넘길 저장 정보
+        """
+        
         # 2. 파일명 생성
         extension = self._get_file_extension(uploaded_file.name)
         unique_filename = self._generate_unique_filename(extension)
@@ -80,6 +111,26 @@ class FileService:
             s3_bucket = None
             storage_type = 'local'
         
+        return {
+            'file_name': unique_filename,
+            'file_format': extension,
+            'file_path': file_path,
+            's3_key': s3_key,
+            's3_bucket': s3_bucket,
+            'storage_type': storage_type,
+        }
+    
+    def register_file(
+        self,
+        uploaded_file: UploadedFile,
+        stored: dict,
+        file_type: str,
+        purpose: str,
+        is_temporary: bool = False,
+        metadata: dict = None
+    ) -> MediaFile:
+        """저장된 파일을 MediaFile 로 기록"""
+        
         # 4. MIME 타입 결정
         mime_type, _ = mimetypes.guess_type(uploaded_file.name)
         if not mime_type:
@@ -89,22 +140,23 @@ class FileService:
         media_file = MediaFile.objects.create(
             user=self.user,
             original_name=uploaded_file.name,
-            file_name=unique_filename,
+            file_name=stored['file_name'],
             file_size=uploaded_file.size,
             file_type=file_type,
-            file_format=extension,
+            file_format=stored['file_format'],
             mime_type=mime_type,
-            storage_type=storage_type,
-            file_path=file_path,
-            s3_key=s3_key,
-            s3_bucket=s3_bucket,
+            storage_type=stored['storage_type'],
+            file_path=stored['file_path'],
+            s3_key=stored['s3_key'],
+            s3_bucket=stored['s3_bucket'],
             purpose=purpose,
             is_temporary=is_temporary,
             metadata=metadata or {}
         )
         
         # 6. 로그 기록
-        SystemLog.objects.create(
+        get_write_buffer().create(
+            SystemLog,
             user=self.user,
             log_level='info',
             log_category='system',
@@ -240,7 +292,8 @@ class FileService:
             media_file.save()
         
         # 로그 기록
-        SystemLog.objects.create(
+        get_write_buffer().create(
+            SystemLog,
             user=self.user,
             log_level='info',
             log_category='system',
@@ -317,7 +370,8 @@ class FileService:
             media_file.save()
         
         # 로그 기록
-        SystemLog.objects.create(
+        get_write_buffer().create(
+            SystemLog,
             user=self.user,
             log_level='info',
             log_category='system',
@@ -364,7 +418,8 @@ class FileService:
                 media_file.delete()
                 deleted_count += 1
             except Exception as e:
-                SystemLog.objects.create(
+                get_write_buffer().create(
+                    SystemLog,
                     log_level='error',
                     log_category='system',
                     message=f'임시 파일 삭제 실패: {media_file.original_name}',
@@ -373,7 +428,8 @@ class FileService:
                 )
         
         # 로그 기록
-        SystemLog.objects.create(
+        get_write_buffer().create(
+            SystemLog,
             log_level='info',
             log_category='system',
             message=f'임시 파일 정리 완료: {deleted_count}개 삭제'
@@ -1,23 +1,151 @@
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 import logging
+import os
 import tempfile
+import threading
+from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
 
+class InMemoryS3Client:
+    """
+    로컬 테스트/벤치마크용 S3 대체 클라이언트 (프로세스 메모리에 저장)
+    
+    S3Storage 가 사용하는 boto3 client 메서드만 같은 시그니처로 제공한다.
+    AWS_S3_BACKEND = 'memory' 일 때 사용된다.
+    """
+    
+    _objects = {}  # (bucket, key) → (bytes, content_type), 프로세스 공유
+    _lock = threading.Lock()
+    
+    def __init__(self, region_name=None):
+        self.region_name = region_name or settings.AWS_REGION
+    
+    def upload_fileobj(self, file_obj, bucket, key, ExtraArgs=None):
+        content_type = (ExtraArgs or {}).get('ContentType')
+        with self._lock:
+            self._objects[(bucket, key)] = (file_obj.read(), content_type)
+    
+    def upload_file(self, file_path, bucket, key, ExtraArgs=None):
+        with open(file_path, 'rb') as f:
+            self.upload_fileobj(f, bucket, key, ExtraArgs=ExtraArgs)
+    
+    def delete_object(self, Bucket, Key):
+        with self._lock:
+            self._objects.pop((Bucket, Key), None)
+        return {}
+    
+    def delete_objects(self, Bucket, Delete):
+        with self._lock:
+            for obj in Delete['Objects']:
+                self._objects.pop((Bucket, obj['Key']), None)
+        return {'Errors': []}
+    
+    def head_object(self, Bucket, Key):
+        with self._lock:
+            obj = self._objects.get((Bucket, Key))
+        if obj is None:
+            raise ClientError(
+                {'Error': {'Code': '404', 'Message': 'Not Found'}},
+                'HeadObject'
+            )
+        return {'ContentLength': len(obj[0]), 'ContentType': obj[1]}
+    
+    def download_fileobj(self, bucket, key, file_obj):
+        with self._lock:
+            obj = self._objects.get((bucket, key))
+        if obj is None:
+            raise ClientError(
+                {'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}},
+                'GetObject'
+            )
+        file_obj.write(obj[0])
+    
+    def generate_presigned_url(self, client_method, Params, ExpiresIn=3600):
+        # 실제 S3 와 같은 호스트 형식 (ResultUrl 키 추출 정규식과 호환)
+        return (
+            f"https://{Params['Bucket']}.s3.{self.region_name}.amazonaws.com/"
+            f"{quote(Params['Key'])}?X-Amz-Expires={ExpiresIn}&X-Amz-Signature=local"
+        )
+    
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._objects.clear()
+
+
+def create_s3_client(**overrides):
+    """
+    S3 클라이언트 새로 생성 (연결 풀/keep-alive/재시도 설정 적용)
+
+    생성 시 엔드포인트 해석·자격 증명 조회·서비스 모델 로딩이 일어나므로 비용이 크다.
+    보통은 get_s3_client() 의 공유 클라이언트를 사용한다.
+
+    Args:
+        overrides: boto3 client 인자 덮어쓰기 (벤치마크 등)
+    """
+    options = {
+        'aws_access_key_id': settings.AWS_ACCESS_KEY_ID,
+        'aws_secret_access_key': settings.AWS_SECRET_ACCESS_KEY,
+        'region_name': settings.AWS_REGION,
+        'config': Config(
+            max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=settings.AWS_S3_TCP_KEEPALIVE,
+            retries={
+                'mode': settings.AWS_S3_RETRY_MODE,
+                'max_attempts': settings.AWS_S3_MAX_ATTEMPTS,
+            },
+        ),
+    }
+    options.update(overrides)
+    # boto3 기본 세션은 스레드 안전하지 않으므로 클라이언트마다 세션 생성
+    return boto3.session.Session().client('s3', **options)
+
+
+_s3_clients = {}
+_s3_clients_pid = None
+_s3_clients_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    프로세스 공유 S3 클라이언트
+
+    boto3 client 는 스레드 안전하므로 요청/스레드가 같은 클라이언트와 연결 풀을 공유한다.
+    fork 된 워커는 부모의 연결을 물려받지 않도록 처음 사용할 때 새로 만든다.
+    AWS_S3_BACKEND 별로 따로 보관한다 (테스트에서 설정을 바꾸는 경우).
+    """
+    global _s3_clients_pid
+
+    backend = settings.AWS_S3_BACKEND
+    client = _s3_clients.get(backend)
+    if client is not None and _s3_clients_pid == os.getpid():
+        return client
+
+    with _s3_clients_lock:
+        if _s3_clients_pid != os.getpid():
+            _s3_clients.clear()
+            _s3_clients_pid = os.getpid()
+
+        client = _s3_clients.get(backend)
+        if client is None:
+            client = InMemoryS3Client() if backend == 'memory' else create_s3_client()
+            _s3_clients[backend] = client
+        return client
+
+
 class S3Storage:
     """AWS S3 스토리지 관리"""
     
+    DELETE_BATCH_SIZE = 1000  # DeleteObjects 요청당 최대 키 수
+    
     def __init__(self):
-        """S3 클라이언트 초기화"""
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
-        )
+        """S3 클라이언트 초기화 (프로세스 공유 클라이언트 사용, 생성 비용 없음)"""
+        self.s3_client = get_s3_client()
         self.bucket_name = settings.AWS_STORAGE_BUCKET_NAME
     
     def upload(self, file_obj, s3_key, content_type=None):
@@ -83,6 +211,33 @@ class S3Storage:
             logger.error(f"S3 삭제 실패: {str(e)}")
             return False
     
+    def delete_many(self, s3_keys):
+        """
+        S3에서 여러 파일 일괄 삭제 (요청 1번에 최대 DELETE_BATCH_SIZE 개)
+        
+        Args:
+            s3_keys: 삭제할 S3 키 목록
+        
+        Returns:
+            list: 삭제하지 못한 S3 키 (없는 키는 삭제된 것으로 본다)
+        """
+        failed = []
+        s3_keys = list(s3_keys)
+        for i in range(0, len(s3_keys), self.DELETE_BATCH_SIZE):
+            batch = s3_keys[i:i + self.DELETE_BATCH_SIZE]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                failed.extend(error['Key'] for error in response.get('Errors', []))
+            except ClientError as e:
+                logger.error(f"S3 일괄 삭제 실패: {str(e)}")
+                failed.extend(batch)
+        
+        logger.info(f"S3 일괄 삭제: {len(s3_keys) - len(failed)}/{len(s3_keys)}")
+        return failed
+    
     def get_presigned_url(self, s3_key, expiration=None):
         """
         파일 다운로드용 서명된 URL 생성
@@ -1,3 +1,100 @@
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from unittest import mock
+
+from django.db import IntegrityError, OperationalError
 from django.test import TestCase
 
-# Create your tests here.
+from . import write_buffer
+from .models import SystemLog
+from .write_buffer import WriteBehindBuffer, read_journal
+
+
+def dead_pid():
+    """이미 종료된 프로세스의 PID"""
+    process = subprocess.Popen(['true'])
+    process.wait()
+    return process.pid
+
+
+class WriteBehindBufferTest(TestCase):
+    """저널 복구가 한 워커에서만 일어나고, 반영 실패한 쓰기가 버려지지 않는지 확인"""
+
+    def setUp(self):
+        self.journal_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.journal_dir, ignore_errors=True)
+
+    def make_buffer(self):
+        # 백그라운드 flush 가 테스트 중에 끼어들지 않도록 간격을 길게
+        return WriteBehindBuffer(journal_dir=self.journal_dir, flush_interval=3600)
+
+    def write_orphan_journal(self, count):
+        buffer = self.make_buffer()
+        name = f'{buffer.host}-{dead_pid()}-00000001{WriteBehindBuffer.JOURNAL_SUFFIX}'
+        with open(os.path.join(self.journal_dir, name), 'w', encoding='utf-8') as f:
+            for index in range(count):
+                op = {
+                    'op': 'create',
+                    'model': 'media_files.SystemLog',
+                    'fields': {'log_level': 'info', 'log_category': 'system', 'message': f'log-{index}'},
+                }
+                f.write(json.dumps(op) + '\n')
+        return name
+
+    def test_recover_claims_each_journal_once(self):
+        self.write_orphan_journal(3)
+        first, second = self.make_buffer(), self.make_buffer()
+        nested = []
+
+        def read_and_race(path):
+            # 첫 워커가 저널을 읽는 사이 동시에 시작한 다른 워커가 복구 시도
+            if not nested:
+                nested.append(second.recover())
+            return read_journal(path)
+
+        with mock.patch.object(write_buffer, 'read_journal', side_effect=read_and_race):
+            self.assertEqual(first.recover(), 3)
+
+        self.assertEqual(nested, [0])
+        self.assertEqual(SystemLog.objects.count(), 3)
+        self.assertEqual(os.listdir(self.journal_dir), [])
+
+    def test_recover_failure_releases_claim(self):
+        name = self.write_orphan_journal(2)
+        buffer = self.make_buffer()
+
+        with mock.patch.object(write_buffer, 'apply_ops', side_effect=OperationalError('down')):
+            with self.assertRaises(OperationalError):
+                buffer.recover()
+        self.assertEqual(os.listdir(self.journal_dir), [name])
+
+        self.assertEqual(buffer.recover(), 2)
+        self.assertEqual(SystemLog.objects.count(), 2)
+
+    def test_flush_requeues_after_db_error(self):
+        buffer = self.make_buffer()
+        for index in range(3):
+            buffer.create(SystemLog, log_level='info', log_category='system', message=f'log-{index}')
+
+        apply_ops = write_buffer.apply_ops
+        # 한꺼번에 반영 실패 → 한 건씩 반영 중 첫 건 성공, 두 번째 건에서 DB 오류
+        side_effects = [IntegrityError('fk'), None, OperationalError('down')]
+
+        def flaky_apply(ops, batch_size=None):
+            effect = side_effects.pop(0)
+            if effect is not None:
+                raise effect
+            return apply_ops(ops, batch_size=batch_size)
+
+        with mock.patch.object(write_buffer, 'apply_ops', side_effect=flaky_apply):
+            self.assertEqual(buffer.flush(), 1)
+
+        self.assertEqual(buffer.stats()['pending'], 2)
+        self.assertEqual(len(os.listdir(self.journal_dir)), 1)
+
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(SystemLog.objects.count(), 3)
+        self.assertEqual(os.listdir(self.journal_dir), [])
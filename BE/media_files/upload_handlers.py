@@ -0,0 +1,72 @@
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+
+class Sha256UploadMixin:
+    """
+    업로드 스트리밍 중 SHA-256 계산
+
+    청크가 들어올 때마다 해시를 갱신하므로 업로드가 끝난 뒤
+    파일을 다시 읽을 필요가 없다. 결과는 업로드 파일의 `sha256` 속성에 저장된다.
+    """
+
+    def new_file(self, *args, **kwargs):
+        # MemoryFileUploadHandler.new_file 은 StopFutureHandlers 를 던지므로 먼저 초기화
+        self._sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def _update_hash(self, raw_data):
+        self._sha256.update(raw_data)
+
+    def _attach_hash(self, uploaded_file):
+        if uploaded_file is not None:
+            uploaded_file.sha256 = self._sha256.hexdigest()
+        return uploaded_file
+
+
+class HashingMemoryFileUploadHandler(Sha256UploadMixin, MemoryFileUploadHandler):
+    """메모리 업로드 핸들러 + SHA-256"""
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.activated:
+            self._update_hash(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        return self._attach_hash(super().file_complete(file_size))
+
+
+class HashingTemporaryFileUploadHandler(Sha256UploadMixin, TemporaryFileUploadHandler):
+    """임시 파일 업로드 핸들러 + SHA-256"""
+
+    def receive_data_chunk(self, raw_data, start):
+        self._update_hash(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        return self._attach_hash(super().file_complete(file_size))
+
+
+def get_content_hash(uploaded_file):
+    """
+    업로드 파일의 SHA-256 반환
+
+    업로드 핸들러가 계산한 값이 있으면 그대로 쓰고,
+    없으면 (핸들러를 거치지 않은 파일) 청크 단위로 직접 계산한다.
+    """
+    content_hash = getattr(uploaded_file, 'sha256', None)
+    if content_hash:
+        return content_hash
+
+    sha256 = hashlib.sha256()
+    uploaded_file.seek(0)
+    for chunk in uploaded_file.chunks():
+        sha256.update(chunk)
+    uploaded_file.seek(0)
+
+    uploaded_file.sha256 = sha256.hexdigest()
+    return uploaded_file.sha256
@@ -0,0 +1,507 @@
+import atexit
+import json
+import logging
+import os
+import socket
+import threading
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer:
+    """
+    워커별 쓰기 지연(write-behind) 버퍼
+
+    요청마다 바로 실행하던 부수적인 쓰기(시스템 로그 INSERT, 카운터 증가 등)를
+    모아 두었다가 WRITE_BUFFER_MAX_ROWS 개가 쌓이거나 WRITE_BUFFER_FLUSH_INTERVAL 초마다
+    bulk_create / bulk_update / 카운터별 UPDATE 1회로 한 트랜잭션에 반영한다.
+
+    - create: INSERT (bulk_create)
+    - update: 같은 행의 여러 변경은 마지막 값으로 합쳐서 UPDATE (bulk_update)
+    - increment: 같은 행의 증가분을 합쳐 F() 로 UPDATE
+    - upsert: 고유 키 행의 증가분/최댓값을 합쳐 UPDATE, 행이 없으면 INSERT (집계 테이블용)
+
+    응답에 ID가 필요한 행(AnalysisRecord, ZoomCapture 등)과 다른 요청이 바로 조회하는 관계
+    (MediaFile.related_record_id 등)는 이 버퍼를 쓰지 않는다.
+
+    장애 대비:
+        모든 쓰기는 메모리에 쌓기 전에 로컬 저널(JSON Lines)에 추가된다.
+        반영에 성공하면 저널을 지우고, 워커가 비정상 종료되면 같은 서버의
+        다음 워커가 시작할 때(또는 flush_write_journal 커맨드로) 남은 저널을 다시 반영한다.
+        복구하는 워커는 저널 이름을 먼저 바꿔(.claimed) 가져가므로 동시에 시작한 워커끼리 겹치지 않는다.
+        반영 직후 저널을 지우기 전에 종료되면 일부 쓰기가 두 번 반영될 수 있다 (at-least-once).
+    """
+
+    JOURNAL_SUFFIX = '.jsonl'
+    CLAIMED_SUFFIX = '.claimed'
+
+    def __init__(self, journal_dir=None, max_rows=None, flush_interval=None, fsync=None):
+        self.journal_dir = str(journal_dir or settings.WRITE_BUFFER_JOURNAL_DIR)
+        self.max_rows = max_rows or settings.WRITE_BUFFER_MAX_ROWS
+        self.flush_interval = flush_interval or settings.WRITE_BUFFER_FLUSH_INTERVAL
+        self.fsync = settings.WRITE_BUFFER_FSYNC if fsync is None else fsync
+        self.host = socket.gethostname()
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pid = None
+        self._reset()
+
+        self.flushes = 0
+        self.flushed_ops = 0
+        self.failures = 0
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def create(self, model, **fields):
+        """INSERT 예약"""
+        self._append({'op': 'create', 'model': model._meta.label, 'fields': self._dump(model, fields)})
+
+    def update(self, instance, **fields):
+        """
+        UPDATE 예약 (인스턴스 속성은 바로 변경)
+
+        auto_now 필드(updated_at 등)는 bulk_update 에서 갱신되지 않으므로 지금 시각으로 채운다.
+        """
+        model = type(instance)
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) and field.name not in fields:
+                fields[field.name] = timezone.now()
+
+        for name, value in fields.items():
+            setattr(instance, name, value)
+
+        self._append({
+            'op': 'update',
+            'model': model._meta.label,
+            'pk': instance.pk,
+            'fields': self._dump(model, fields),
+        })
+
+    def increment(self, model, pk, **deltas):
+        """카운터 증가 예약"""
+        deltas = {name: int(delta) for name, delta in deltas.items() if delta}
+        if deltas:
+            self._append({'op': 'increment', 'model': model._meta.label, 'pk': pk, 'fields': deltas})
+
+    def upsert(self, model, key, increments=None, maxima=None):
+        """
+        집계 행 증가 예약 (key 로 찾은 행이 없으면 생성)
+
+        Args:
+            key: 고유 제약 필드 값 (예: {'session': session, 'bucket': minute})
+            increments: 더할 값 (카운터)
+            maxima: 기존 값과 비교해 큰 값으로 바꿀 필드 (None 은 무시)
+        """
+        self._append(_upsert_op(model, key, increments, maxima, self._dump))
+
+    # ------------------------------------------------------------------
+    # 반영
+    # ------------------------------------------------------------------
+    def flush(self):
+        """
+        쌓인 쓰기를 DB에 반영
+
+        실패하면 쓰기를 버퍼 앞쪽에 되돌려 두고 다음 flush 에서 다시 시도한다.
+
+        Returns:
+            int: 반영한 쓰기 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._pid != os.getpid():
+                    return 0
+                ops = self._ops
+                files = self._journal_files + ([self._journal_path] if self._journal else [])
+                self._close_journal()
+                self._ops = []
+                self._journal_files = []
+
+            if not ops:
+                self._remove_files(files)
+                return 0
+
+            try:
+                apply_ops(ops, batch_size=self.max_rows)
+            except IntegrityError:
+                # 참조 행이 삭제된 경우 등 → 한 건씩 반영하고 실패한 쓰기만 버림
+                remaining = self._apply_one_by_one(ops)
+                if remaining:
+                    # 한 건씩 반영하던 중 DB 오류 → 남은 쓰기만 되돌림 (저널은 지우지 않음)
+                    self._requeue(remaining, files)
+                    return len(ops) - len(remaining)
+            except Exception:
+                logger.exception('쓰기 버퍼 반영 실패 (%d건, 다음 flush 에서 재시도)', len(ops))
+                self._requeue(ops, files)
+                return 0
+
+            self._remove_files(files)
+            with self._lock:
+                self.flushes += 1
+                self.flushed_ops += len(ops)
+            return len(ops)
+
+    def stats(self):
+        """현재 워커의 버퍼 상태"""
+        with self._lock:
+            return {
+                'enabled': settings.WRITE_BUFFER_ENABLED,
+                'pending': len(self._ops),
+                'flushes': self.flushes,
+                'flushed_ops': self.flushed_ops,
+                'failures': self.failures,
+                'max_rows': self.max_rows,
+                'flush_interval': self.flush_interval,
+            }
+
+    def recover(self):
+        """
+        같은 서버에서 종료된 워커가 남긴 저널 반영
+
+        Returns:
+            int: 반영한 쓰기 수
+        """
+        try:
+            names = os.listdir(self.journal_dir)
+        except FileNotFoundError:
+            return 0
+
+        recovered = 0
+        for name in sorted(names):
+            path = os.path.join(self.journal_dir, name)
+
+            if name.endswith(self.CLAIMED_SUFFIX):
+                # 복구하던 워커가 반영 도중 종료된 저널은 다시 가져옴
+                journal, claimer = name[:-len(self.CLAIMED_SUFFIX)].rsplit('.', 1)
+                if not claimer.isdigit() or _pid_alive(int(claimer)):
+                    continue
+            elif name.endswith(self.JOURNAL_SUFFIX):
+                journal = name
+            else:
+                continue
+
+            host, pid = journal[:-len(self.JOURNAL_SUFFIX)].rsplit('-', 2)[:2]
+            if host != self.host or _pid_alive(int(pid)):
+                continue
+
+            # 이름 변경에 성공한 워커만 반영 (동시에 시작한 워커가 같은 저널을 두 번 반영하지 않음)
+            claimed = os.path.join(self.journal_dir, f'{journal}.{os.getpid()}{self.CLAIMED_SUFFIX}')
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+
+            try:
+                ops = read_journal(claimed)
+                if ops:
+                    apply_ops(ops, batch_size=self.max_rows)
+                    logger.warning('쓰기 저널 복구: %s (%d건)', journal, len(ops))
+            except Exception:
+                # 다음 복구에서 다시 시도하도록 원래 이름으로 되돌림
+                os.rename(claimed, os.path.join(self.journal_dir, journal))
+                raise
+            self._remove_files([claimed])
+            recovered += len(ops)
+        return recovered
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _append(self, op):
+        line = json.dumps(op, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # fork 된 워커에서 처음 사용 → 부모의 버퍼/저널/스레드를 물려받지 않음
+                self._reset()
+                self._start()
+
+            if self._journal is None:
+                self._open_journal()
+            self._journal.write(line)
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+
+            self._ops.append(op)
+            full = len(self._ops) >= self.max_rows
+
+        if full:
+            self.flush()
+
+    def _apply_one_by_one(self, ops):
+        """
+        쓰기를 한 건씩 반영 (IntegrityError 인 쓰기만 버림)
+
+        Returns:
+            list: 다른 DB 오류로 반영하지 못한 쓰기 (오류가 난 쓰기부터 끝까지)
+        """
+        for index, op in enumerate(ops):
+            try:
+                apply_ops([op])
+            except IntegrityError:
+                logger.exception('쓰기 버퍼 항목 반영 실패 (버림): %s', op)
+            except Exception:
+                logger.exception('쓰기 버퍼 반영 실패 (%d건, 다음 flush 에서 재시도)', len(ops) - index)
+                return ops[index:]
+        return []
+
+    def _requeue(self, ops, files):
+        """반영하지 못한 쓰기를 버퍼 앞쪽에 되돌림 (저널 파일도 다음 flush 까지 유지)"""
+        with self._lock:
+            self._ops = ops + self._ops
+            self._journal_files = files + self._journal_files
+            self.failures += 1
+
+    def _reset(self):
+        self._ops = []
+        self._journal = None
+        self._journal_path = None
+        self._journal_files = []
+        self._sequence = 0
+
+    def _start(self):
+        self._pid = os.getpid()
+        os.makedirs(self.journal_dir, exist_ok=True)
+
+        thread = threading.Thread(target=self._run, name='write-behind-flusher', daemon=True)
+        thread.start()
+
+    def _run(self):
+        stop = threading.Event()
+        while not stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            finally:
+                # 플러시 스레드의 DB 연결은 요청 사이클 밖이므로 직접 정리
+                connection.close()
+
+    def _open_journal(self):
+        self._sequence += 1
+        name = f'{self.host}-{self._pid}-{self._sequence:08d}{self.JOURNAL_SUFFIX}'
+        self._journal_path = os.path.join(self.journal_dir, name)
+        self._journal = open(self._journal_path, 'a', encoding='utf-8')
+
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _remove_files(self, paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _dump(self, model, fields):
+        """필드 값 → 저널에 쓸 수 있는 값 (FK는 attname 기준 PK)"""
+        instance = model(**fields)
+        result = {}
+        for name in fields:
+            field = model._meta.get_field(name)
+            result[field.attname] = field.value_from_object(instance)
+        return result
+
+
+def read_journal(path):
+    """저널 파일 → 쓰기 목록 (마지막 줄이 잘렸으면 무시)"""
+    ops = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                ops.append(json.loads(line))
+            except ValueError:
+                logger.warning('쓰기 저널의 손상된 줄 무시: %s', path)
+    return ops
+
+
+def apply_ops(ops, batch_size=None):
+    """쓰기 목록을 한 트랜잭션에서 반영 (INSERT → UPDATE → 카운터 → 집계 행 순)"""
+    creates = defaultdict(list)
+    updates = defaultdict(dict)
+    increments = defaultdict(lambda: defaultdict(int))
+    upserts = {}
+
+    for op in ops:
+        model = apps.get_model(op['model'])
+
+        if op['op'] == 'create':
+            creates[model].append(model(**_load(model, op['fields'])))
+        elif op['op'] == 'update':
+            updates[model].setdefault(op['pk'], {}).update(_load(model, op['fields']))
+        elif op['op'] == 'increment':
+            for name, delta in op['fields'].items():
+                increments[(model, op['pk'])][name] += delta
+        else:
+            # 같은 키의 증가분은 더하고 최댓값은 큰 값만 남김
+            key = (model, json.dumps(op['key'], cls=DjangoJSONEncoder, sort_keys=True))
+            merged = upserts.setdefault(key, {'key': op['key'], 'fields': defaultdict(int), 'max': {}})
+            for name, delta in op['fields'].items():
+                merged['fields'][name] += delta
+            maxima = _load(model, op['max'])
+            for attname, value in maxima.items():
+                current = merged['max'].get(attname)
+                merged['max'][attname] = value if current is None else max(current, value)
+
+    with transaction.atomic():
+        for model, objs in creates.items():
+            model.objects.bulk_create(objs, batch_size=batch_size)
+
+        for model, rows in updates.items():
+            # 바꾼 필드 조합별로 bulk_update 1회
+            groups = defaultdict(list)
+            for pk, values in rows.items():
+                obj = model(pk=pk)
+                for attname, value in values.items():
+                    setattr(obj, attname, value)
+                groups[tuple(sorted(values))].append(obj)
+
+            for attnames, objs in groups.items():
+                model.objects.bulk_update(objs, _field_names(model, attnames), batch_size=batch_size)
+
+        for (model, pk), deltas in increments.items():
+            model.objects.filter(pk=pk).update(
+                **{name: F(name) + delta for name, delta in deltas.items()}
+            )
+
+        for (model, _), merged in upserts.items():
+            _apply_upsert(model, _load(model, merged['key']), merged['fields'], merged['max'])
+
+
+def _upsert_op(model, key, increments, maxima, dump):
+    increments = {name: int(delta) for name, delta in (increments or {}).items() if delta}
+    maxima = {name: value for name, value in (maxima or {}).items() if value is not None}
+    return {
+        'op': 'upsert',
+        'model': model._meta.label,
+        'key': dump(model, key),
+        'fields': increments,
+        'max': dump(model, maxima),
+    }
+
+
+def _apply_upsert(model, key, increments, maxima):
+    """
+    집계 행 UPDATE, 없으면 INSERT
+
+    동시에 다른 워커가 같은 행을 먼저 만들면(IntegrityError) 다시 UPDATE 한다.
+    """
+    changes = {name: F(name) + delta for name, delta in increments.items()}
+    changes.update({
+        attname: Greatest(Coalesce(F(attname), Value(value)), Value(value))
+        for attname, value in maxima.items()
+    })
+
+    if changes and model.objects.filter(**key).update(**changes):
+        return
+    if not changes and model.objects.filter(**key).exists():
+        return
+
+    try:
+        with transaction.atomic():
+            model.objects.create(**key, **increments, **maxima)
+    except IntegrityError:
+        model.objects.filter(**key).update(**changes)
+
+
+def _load(model, values):
+    """저널 값 → 필드 값"""
+    fields = {f.attname: f for f in model._meta.concrete_fields}
+    return {attname: fields[attname].to_python(value) for attname, value in values.items()}
+
+
+def _attnames(model, fields):
+    """필드 이름 → attname (FK 는 인스턴스 대신 PK)"""
+    result = {}
+    for name, value in fields.items():
+        field = model._meta.get_field(name)
+        result[field.attname] = value.pk if field.is_relation and hasattr(value, 'pk') else value
+    return result
+
+
+def _field_names(model, attnames):
+    fields = {f.attname: f.name for f in model._meta.concrete_fields}
+    return [fields[attname] for attname in attnames]
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _DirectWriter:
+    """WRITE_BUFFER_ENABLED=False 일 때 같은 인터페이스로 바로 실행"""
+
+    def create(self, model, **fields):
+        model.objects.create(**fields)
+
+    def update(self, instance, **fields):
+        for name, value in fields.items():
+            setattr(instance, name, value)
+        update_fields = list(fields)
+        if any(f.name == 'updated_at' for f in type(instance)._meta.concrete_fields):
+            update_fields.append('updated_at')
+        instance.save(update_fields=update_fields)
+
+    def increment(self, model, pk, **deltas):
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if deltas:
+            model.objects.filter(pk=pk).update(
+                **{name: F(name) + delta for name, delta in deltas.items()}
+            )
+
+    def upsert(self, model, key, increments=None, maxima=None):
+        op = _upsert_op(model, key, increments, maxima, lambda model, fields: fields)
+        _apply_upsert(
+            model,
+            _load(model, _attnames(model, op['key'])),
+            op['fields'],
+            _load(model, _attnames(model, op['max']))
+        )
+
+    def flush(self):
+        return 0
+
+    def stats(self):
+        return {'enabled': False}
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+_direct_writer = _DirectWriter()
+
+
+def get_write_buffer():
+    """프로세스 공유 쓰기 버퍼 (처음 사용할 때 이전 워커의 저널 복구)"""
+    global _buffer
+
+    if not settings.WRITE_BUFFER_ENABLED:
+        return _direct_writer
+
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                buffer = WriteBehindBuffer()
+                try:
+                    buffer.recover()
+                except Exception:
+                    logger.exception('쓰기 저널 복구 실패 (flush_write_journal 로 다시 시도)')
+                atexit.register(buffer.flush)
+                _buffer = buffer
+    return _buffer
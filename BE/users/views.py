@@ -112,6 +112,19 @@ class AppSettingView(generics.RetrieveUpdateAPIView):
             user=self.request.user
         )
         return setting
+    
+    def perform_update(self, serializer):
+        serializer.save()
+        
+        # 진행 중인 Zoom 세션이 바뀐 캡처 간격을 바로 쓰도록 세션 상태 캐시 삭제
+        from zoom.models import ZoomSession
+        from zoom.services import ActiveSessionState
+        ActiveSessionState.invalidate(
+            ZoomSession.objects.filter(
+                user=self.request.user,
+                session_status='active'
+            ).values_list('session_id', flat=True)
+        )
 
 
 class UserDeleteView(APIView):
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ZoomConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "zoom"
+
+    def ready(self):
+        from . import checks  # noqa: F401 (시스템 체크 등록)
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from detection.checks import is_process_local_cache
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """Zoom 세션 상태와 SSE 이벤트 우편함은 공유 캐시가 있어야 워커 간에 전달됨"""
+    if settings.DEBUG:
+        return []
+
+    aliases = [alias for alias in ('default', 'zoom_events') if is_process_local_cache(alias)]
+    if not aliases:
+        return []
+    return [
+        Warning(
+            f"Zoom 세션 상태/이벤트 캐시({', '.join(aliases)})가 프로세스 로컬 캐시입니다.",
+            hint="다른 워커가 받은 캡처의 판정 결과(push=true)와 세션 종료가 전달되지 않습니다. "
+                 "워커가 여러 개면 CACHE_BACKEND / ZOOM_EVENT_CACHE_BACKEND 를 Redis 등 공유 백엔드로 지정하세요.",
+            id='zoom.W001',
+        )
+    ]
@@ -0,0 +1,135 @@
+import logging
+import os
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from detection.models import AnalysisRecord
+from media_files.models import MediaFile
+from media_files.storage import S3Storage
+
+from .models import ZoomCapture, ZoomSession
+from .reports import build_snapshot, media_files_for
+
+logger = logging.getLogger(__name__)
+
+
+class StorageCleanupError(Exception):
+    """저장소 파일 일부를 삭제하지 못함 (작업 재시도 대상)"""
+
+
+def compactable_captures(session):
+    """
+    압축 대상 캡처
+
+    경고를 발생시킨 캡처와 의심/딥페이크 판정 캡처(경고 전후 증거 프레임 포함)는 원본 그대로 보존하고,
+    안전 판정 캡처만 요약 기록으로 합친다.
+    """
+    return ZoomCapture.objects.filter(
+        session=session,
+        alert_triggered=False,
+        record__analysis_result='safe'
+    )
+
+
+def finalize_session(session):
+    """
+    종료된 세션 마무리 (AnalysisJob 'zoom_finalize')
+
+    1. 안전 판정 캡처를 ZOOM_FINALIZE_BATCH_SIZE 개씩 요약 기록으로 압축
+       (저장소 파일을 먼저 일괄 삭제하고 DB 행을 지우므로 중간에 실패해도 재시도하면 이어서 진행)
+    2. 최종 통계로 보고서 스냅샷 재생성
+
+    Returns:
+        AnalysisRecord | None: 세션 요약 기록 (압축할 캡처가 없었으면 None)
+    """
+    while True:
+        batch = list(
+            compactable_captures(session)
+            .select_related('record')
+            .order_by('capture_id')[:settings.ZOOM_FINALIZE_BATCH_SIZE]
+        )
+        if not batch:
+            break
+        _compact_batch(session, batch)
+
+    session.refresh_from_db()
+    session.finalized_at = timezone.now()
+    session.save(update_fields=['finalized_at'])
+
+    build_snapshot(session)
+    return session.summary_record
+
+
+def _compact_batch(session, captures):
+    """캡처 묶음 1개를 요약 기록에 합치고 원본 파일/행 삭제"""
+    media_files = media_files_for(captures)
+    _delete_stored_files(media_files.values())
+
+    records = [capture.record for capture in captures]
+    count = len(captures)
+
+    with transaction.atomic():
+        # 같은 세션을 동시에 마무리하지 않도록 잠금
+        session = ZoomSession.objects.select_for_update().get(pk=session.pk)
+        summary = session.summary_record
+
+        if summary is None:
+            summary = AnalysisRecord(
+                user=session.user,
+                analysis_type='zoom',
+                file_format='summary',
+                original_path='',
+                analysis_result='safe',
+                confidence_score=0,
+                file_size=0,
+                processing_time=0,
+                ai_model_version=settings.AI_MODEL_VERSION
+            )
+
+        # 신뢰도는 압축된 캡처 전체의 평균
+        previous = session.compacted_captures
+        total = previous + count
+        summary.confidence_score = round(
+            (float(summary.confidence_score) * previous
+             + sum(float(record.confidence_score) for record in records)) / total, 2
+        )
+        summary.file_size += sum(record.file_size for record in records)
+        summary.processing_time += sum(record.processing_time for record in records)
+        summary.file_name = f'{session.session_name} 안전 캡처 요약 ({total}건)'[:255]
+        summary.save()
+
+        ZoomSession.objects.filter(pk=session.pk).update(
+            summary_record=summary,
+            compacted_captures=F('compacted_captures') + count,
+            compacted_participants=(
+                F('compacted_participants') + sum(capture.participant_count for capture in captures)
+            )
+        )
+
+        MediaFile.objects.filter(
+            file_id__in=[media_file.file_id for media_file in media_files.values()]
+        ).delete()
+        # ZoomCapture 는 AnalysisRecord 삭제 시 함께 삭제됨 (CASCADE)
+        AnalysisRecord.objects.filter(record_id__in=[record.record_id for record in records]).delete()
+
+    logger.info(f"Zoom 세션 {session.pk} 캡처 {count}건 압축 (누적 {total}건)")
+
+
+def _delete_stored_files(media_files):
+    """원본 파일 삭제 (S3 는 DeleteObjects 로 일괄 삭제)"""
+    s3_keys = []
+    for media_file in media_files:
+        if media_file.storage_type == 's3' and media_file.s3_key:
+            s3_keys.append(media_file.s3_key)
+        elif media_file.storage_type == 'local':
+            file_full_path = os.path.join(settings.MEDIA_ROOT, media_file.file_path)
+            if os.path.exists(file_full_path):
+                os.remove(file_full_path)
+
+    if s3_keys:
+        failed = S3Storage().delete_many(s3_keys)
+        if failed:
+            raise StorageCleanupError(f"S3 파일 {len(failed)}개를 삭제하지 못했습니다.")
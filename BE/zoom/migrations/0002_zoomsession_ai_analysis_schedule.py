@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-17 01:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoom', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='zoomsession',
+            name='ai_analysis_interval',
+            field=models.IntegerField(blank=True, null=True, verbose_name='다음 AI 분석까지 간격(초)'),
+        ),
+        migrations.AddField(
+            model_name='zoomsession',
+            name='last_ai_analysis_time',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='마지막 AI 분석 시간'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1 on 2026-10-17 02:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoom', '0002_zoomsession_ai_analysis_schedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ZoomSessionReport',
+            fields=[
+                ('session', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='report_snapshot', serialize=False, to='zoom.zoomsession', verbose_name='세션')),
+                ('payload', models.BinaryField(verbose_name='압축된 보고서')),
+                ('digest', models.CharField(max_length=64, verbose_name='보고서 해시')),
+                ('capture_count', models.IntegerField(verbose_name='캡처 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+            ],
+            options={
+                'verbose_name': 'Zoom 세션 보고서',
+                'verbose_name_plural': 'Zoom 세션 보고서 목록',
+                'db_table': 'zoom_session_reports',
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1 on 2026-10-17 02:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('detection', '0006_analysisjob_zoom_finalize'),
+        ('zoom', '0003_zoomsessionreport'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='zoomsession',
+            name='compacted_captures',
+            field=models.IntegerField(default=0, verbose_name='압축된 캡처 수'),
+        ),
+        migrations.AddField(
+            model_name='zoomsession',
+            name='compacted_participants',
+            field=models.IntegerField(default=0, verbose_name='압축된 캡처 참가자 수 합계'),
+        ),
+        migrations.AddField(
+            model_name='zoomsession',
+            name='finalized_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='마무리 일시'),
+        ),
+        migrations.AddField(
+            model_name='zoomsession',
+            name='summary_record',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='zoom_summary_session', to='detection.analysisrecord', verbose_name='압축 요약 기록'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1 on 2026-10-17 02:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zoom', '0004_zoomsession_compaction'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ZoomSessionMinute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField(verbose_name='구간 시작 (분)')),
+                ('captures', models.IntegerField(default=0, verbose_name='캡처 수')),
+                ('analysed_frames', models.IntegerField(default=0, verbose_name='AI 분석 프레임 수')),
+                ('alerts', models.IntegerField(default=0, verbose_name='경고 수')),
+                ('max_confidence', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, verbose_name='최고 신뢰도 점수 (%)')),
+                ('participant_total', models.IntegerField(default=0, verbose_name='참가자 수 합계')),
+                ('participant_max', models.IntegerField(blank=True, null=True, verbose_name='최대 참가자 수')),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='minutes', to='zoom.zoomsession', verbose_name='세션')),
+            ],
+            options={
+                'verbose_name': 'Zoom 세션 분 단위 집계',
+                'verbose_name_plural': 'Zoom 세션 분 단위 집계 목록',
+                'db_table': 'zoom_session_minutes',
+                'ordering': ['bucket'],
+                'constraints': [models.UniqueConstraint(fields=('session', 'bucket'), name='zoom_minute_session_bucket')],
+            },
+        ),
+    ]
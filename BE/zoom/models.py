@@ -35,6 +35,24 @@ class ZoomSession(models.Model):
         blank=True, 
         verbose_name='마지막 AI 분석 시간'
     )
+    ai_analysis_interval = models.IntegerField(
+        null=True,
+        blank=True,
+        verbose_name='다음 AI 분석까지 간격(초)'
+    )
+    
+    # ✅ 종료 후 마무리 작업: 안전 판정 캡처는 요약 기록 1개로 압축
+    summary_record = models.OneToOneField(
+        'detection.AnalysisRecord',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='zoom_summary_session',
+        verbose_name='압축 요약 기록'
+    )
+    compacted_captures = models.IntegerField(default=0, verbose_name='압축된 캡처 수')
+    compacted_participants = models.IntegerField(default=0, verbose_name='압축된 캡처 참가자 수 합계')
+    finalized_at = models.DateTimeField(null=True, blank=True, verbose_name='마무리 일시')
     
     class Meta:
         db_table = 'zoom_sessions'
@@ -88,4 +106,73 @@ class ZoomCapture(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.session.session_name} - {self.capture_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
\ No newline at end of file
+        return f"{self.session.session_name} - {self.capture_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+
+class ZoomSessionReport(models.Model):
+    """
+    종료된 Zoom 세션 보고서 스냅샷
+
+    종료 후에는 바뀌지 않으므로 보고서 전체를 압축(JSON+zlib)해 한 행에 저장한다.
+    서명 URL은 만료되므로 저장하지 않고 조회 시 다시 서명한다.
+    """
+
+    session = models.OneToOneField(
+        ZoomSession,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='report_snapshot',
+        verbose_name='세션'
+    )
+    payload = models.BinaryField(verbose_name='압축된 보고서')
+    digest = models.CharField(max_length=64, verbose_name='보고서 해시')
+    capture_count = models.IntegerField(verbose_name='캡처 수')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+
+    class Meta:
+        db_table = 'zoom_session_reports'
+        verbose_name = 'Zoom 세션 보고서'
+        verbose_name_plural = 'Zoom 세션 보고서 목록'
+
+    def __str__(self):
+        return f"{self.session_id} 보고서 ({self.capture_count}건)"
+
+
+class ZoomSessionMinute(models.Model):
+    """
+    Zoom 세션 분 단위 집계 (타임라인용)
+
+    캡처를 받을 때마다 해당 분의 행을 upsert 하므로
+    타임라인은 캡처 목록 대신 이 테이블(세션 1시간당 60행)만 읽는다.
+    """
+
+    session = models.ForeignKey(
+        ZoomSession,
+        on_delete=models.CASCADE,
+        related_name='minutes',
+        verbose_name='세션'
+    )
+    bucket = models.DateTimeField(verbose_name='구간 시작 (분)')
+    captures = models.IntegerField(default=0, verbose_name='캡처 수')
+    analysed_frames = models.IntegerField(default=0, verbose_name='AI 분석 프레임 수')
+    alerts = models.IntegerField(default=0, verbose_name='경고 수')
+    max_confidence = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name='최고 신뢰도 점수 (%)'
+    )
+    participant_total = models.IntegerField(default=0, verbose_name='참가자 수 합계')
+    participant_max = models.IntegerField(null=True, blank=True, verbose_name='최대 참가자 수')
+
+    class Meta:
+        db_table = 'zoom_session_minutes'
+        verbose_name = 'Zoom 세션 분 단위 집계'
+        verbose_name_plural = 'Zoom 세션 분 단위 집계 목록'
+        ordering = ['bucket']
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'bucket'], name='zoom_minute_session_bucket'),
+        ]
+
+    def __str__(self):
+        return f"{self.session_id} {self.bucket.strftime('%Y-%m-%d %H:%M')}"
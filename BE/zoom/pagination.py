@@ -0,0 +1,20 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class ZoomCaptureCursorPagination(CursorPagination):
+    """
+    세션 캡처 목록 커서 페이지네이션 (최신순)
+
+    OFFSET 없이 (capture_timestamp, capture_id) 인덱스 위치에서 이어 읽으므로
+    긴 세션의 뒤쪽 페이지도 앞쪽 페이지와 같은 비용으로 조회된다.
+    """
+
+    ordering = ('-capture_timestamp', '-capture_id')
+    page_size_query_param = 'page_size'
+
+    def get_page_size(self, request):
+        # 설정값을 요청 시점에 읽음 (override_settings/환경별 조정 반영)
+        self.page_size = settings.ZOOM_REPORT_PAGE_SIZE
+        self.max_page_size = settings.ZOOM_REPORT_MAX_PAGE_SIZE
+        return super().get_page_size(request)
@@ -0,0 +1,23 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class RawFrameParser(BaseParser):
+    """
+    이미지 바이트 본문 그대로 읽기 (multipart 파싱 없음)
+
+    Content-Type: image/jpeg, image/webp
+    """
+
+    media_type = 'image/*'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if stream is None:
+            raise ParseError('프레임 데이터가 없습니다.')
+
+        max_size = settings.ZOOM_FRAME_MAX_BYTES
+        data = stream.read(max_size + 1)
+        if len(data) > max_size:
+            raise ParseError(f'프레임 크기는 {max_size // (1024 * 1024)}MB 이하여야 합니다.')
+        return data
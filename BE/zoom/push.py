@@ -0,0 +1,179 @@
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class SessionMailbox:
+    """
+    세션별 이벤트 우편함 ('zoom_events' 공유 캐시, 모든 워커 공유)
+
+    캡처를 받은 워커가 판정 결과를 publish() 하면
+    SSE 스트림을 연 워커가 read_since() 로 가져가 클라이언트에 보낸다.
+    이벤트 ID는 세션별 일련번호이므로 재연결 시 Last-Event-ID 이후부터 이어서 받는다.
+    """
+
+    SEQUENCE_TTL = 60 * 60 * 24
+
+    def __init__(self, session_id):
+        # 이벤트마다 키가 생기므로 세션 상태/슬롯이 있는 기본 캐시와 분리
+        self.store = caches['zoom_events']
+        self.prefix = f'zoom:session:{session_id}:events'
+        self.sequence_key = f'{self.prefix}:seq'
+
+    def publish(self, event, data):
+        """
+        이벤트 추가
+
+        Returns:
+            int: 이벤트 ID
+        """
+        self.store.add(self.sequence_key, 0, timeout=self.SEQUENCE_TTL)
+        try:
+            event_id = self.store.incr(self.sequence_key)
+        except ValueError:
+            self.store.set(self.sequence_key, 1, timeout=self.SEQUENCE_TTL)
+            event_id = 1
+
+        self.store.set(
+            self._event_key(event_id),
+            {'event': event, 'data': data},
+            timeout=settings.ZOOM_PUSH_EVENT_TTL
+        )
+        return event_id
+
+    def read_since(self, last_id):
+        """
+        last_id 이후 이벤트 (만료된 이벤트는 건너뜀)
+
+        Returns:
+            list[tuple]: (이벤트 ID, 이벤트 이름, 데이터)
+        """
+        latest = self.store.get(self.sequence_key, 0)
+        if latest <= last_id:
+            return []
+
+        first = max(last_id + 1, latest - settings.ZOOM_PUSH_MAX_BACKLOG + 1)
+        keys = {self._event_key(i): i for i in range(first, latest + 1)}
+        found = self.store.get_many(list(keys))
+
+        events = []
+        for key, event_id in keys.items():
+            if key in found:
+                events.append((event_id, found[key]['event'], found[key]['data']))
+        return events
+
+    def latest_id(self):
+        return self.store.get(self.sequence_key, 0)
+
+    def _event_key(self, event_id):
+        return f'{self.prefix}:{event_id}'
+
+
+def format_sse(event_id, event, data):
+    """SSE 메시지 1개"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f'id: {event_id}\nevent: {event}\ndata: {payload}\n\n'
+
+
+async def event_stream(mailbox, last_id):
+    """
+    SSE 스트림 (비동기 제너레이터, 대기 중에 워커 스레드를 점유하지 않음)
+
+    ZOOM_PUSH_POLL_INTERVAL 마다 우편함을 확인하고, 보낼 이벤트가 없으면
+    ZOOM_PUSH_KEEPALIVE 마다 주석 줄을 보내 프록시가 연결을 끊지 않게 한다.
+    session_end 이벤트를 보내거나 ZOOM_PUSH_STREAM_TIMEOUT 이 지나면 종료한다.
+    """
+    loop = asyncio.get_running_loop()
+    started = idle_since = loop.time()
+    read_since = sync_to_async(mailbox.read_since, thread_sensitive=False)
+
+    yield f'retry: {settings.ZOOM_PUSH_RETRY_MS}\n\n'
+
+    while loop.time() - started < settings.ZOOM_PUSH_STREAM_TIMEOUT:
+        events = await read_since(last_id)
+        for event_id, event, data in events:
+            last_id = event_id
+            yield format_sse(event_id, event, data)
+            if event == 'session_end':
+                return
+
+        if events:
+            idle_since = loop.time()
+        elif loop.time() - idle_since >= settings.ZOOM_PUSH_KEEPALIVE:
+            yield ': keepalive\n\n'
+            idle_since = loop.time()
+
+        await asyncio.sleep(settings.ZOOM_PUSH_POLL_INTERVAL)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_slots = None
+
+
+def _get_executor():
+    """푸시 모드 캡처 처리용 스레드 풀 (요청 스레드는 접수 응답 후 바로 반환)"""
+    global _executor, _slots
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _slots = threading.BoundedSemaphore(settings.ZOOM_PUSH_MAX_PENDING)
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.ZOOM_PUSH_WORKERS,
+                    thread_name_prefix='zoom-push'
+                )
+    return _executor
+
+
+def reserve_push_slot():
+    """
+    백그라운드 처리 자리 확보 (처리 중 + 대기 중 프레임이 ZOOM_PUSH_MAX_PENDING 개 미만일 때)
+
+    대기 중인 작업마다 프레임 사본을 메모리에 들고 있으므로 자리가 없으면
+    호출한 쪽에서 동기 처리로 전환한다. 확보한 자리는 submit_and_publish() 작업이 끝나면 반납된다.
+
+    Returns:
+        bool: 확보 여부
+    """
+    _get_executor()
+    return _slots.acquire(blocking=False)
+
+
+def submit_and_publish(session_id, process):
+    """
+    process() 를 백그라운드에서 실행하고 결과를 세션 우편함에 게시
+
+    process 는 응답 본문 dict 를 반환하고, 잘못된 입력이면 ValueError 를 던진다.
+    호출 전에 reserve_push_slot() 으로 자리를 확보해야 한다.
+    """
+    mailbox = SessionMailbox(session_id)
+
+    def run():
+        try:
+            mailbox.publish('capture', process())
+        except ValueError as e:
+            mailbox.publish('capture_error', {'error': str(e)})
+        except Exception:
+            logger.exception('Zoom 캡처 백그라운드 처리 실패 (session=%s)', session_id)
+            mailbox.publish('capture_error', {'error': '캡처 처리 중 오류가 발생했습니다.'})
+        finally:
+            _slots.release()
+            # 요청 사이클 밖의 스레드이므로 DB 연결 직접 정리
+            connection.close()
+
+    try:
+        return _get_executor().submit(run)
+    except RuntimeError:
+        # 인터프리터 종료 중 등으로 스레드 풀이 작업을 받지 않음
+        _slots.release()
+        raise
@@ -0,0 +1,181 @@
+import base64
+import hashlib
+import json
+import time
+import zlib
+from datetime import timedelta
+from urllib.parse import parse_qs
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError
+from django.utils import timezone
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from media_files.models import MediaFile
+from media_files.storage import S3Storage
+
+from .models import ZoomCapture, ZoomSessionReport
+from .serializers import ZoomReportCaptureSerializer, ZoomSessionSerializer, resolve_image_url
+from .services import summarize_session
+
+MEDIA_LOOKUP_CHUNK = 500
+
+
+def media_files_for(captures):
+    """
+    캡처들의 원본 파일 정보 (record_id → MediaFile)
+
+    IN 절이 너무 길어지지 않도록 MEDIA_LOOKUP_CHUNK 개씩 나눠 조회한다.
+    """
+    record_ids = [capture.record_id for capture in captures]
+    media_files = {}
+    for i in range(0, len(record_ids), MEDIA_LOOKUP_CHUNK):
+        for media_file in MediaFile.objects.filter(
+            related_model='AnalysisRecord',
+            related_record_id__in=record_ids[i:i + MEDIA_LOOKUP_CHUNK],
+            is_deleted=False
+        ):
+            media_files[media_file.related_record_id] = media_file
+    return media_files
+
+
+def snapshot_ready(session, now=None):
+    """
+    스냅샷을 만들어도 되는 세션인지
+
+    종료 직후에는 다른 워커의 쓰기 버퍼/백그라운드 캡처가 아직 반영 중일 수 있으므로
+    ZOOM_REPORT_SNAPSHOT_GRACE 초가 지난 뒤부터 스냅샷을 만든다.
+    """
+    if session.session_status == 'active' or session.end_time is None:
+        return False
+    now = now or timezone.now()
+    return now >= session.end_time + timedelta(seconds=settings.ZOOM_REPORT_SNAPSHOT_GRACE)
+
+
+def build_snapshot(session):
+    """세션 보고서 전체를 압축해 저장 (캡처/원본 파일 조회는 세션 크기와 무관하게 몇 번)"""
+    captures = list(
+        ZoomCapture.objects.filter(session=session)
+        .select_related('record')
+        .order_by('-capture_timestamp', '-capture_id')
+    )
+
+    payload = {
+        'session': ZoomSessionSerializer(session).data,
+        'summary': summarize_session(session),
+        'captures': ZoomReportCaptureSerializer(
+            captures,
+            many=True,
+            context={'snapshot': True, 'media_files': media_files_for(captures)}
+        ).data,
+    }
+    raw = json.dumps(payload, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')).encode()
+
+    defaults = {
+        'payload': zlib.compress(raw),
+        'digest': hashlib.sha256(raw).hexdigest(),
+        'capture_count': len(captures),
+    }
+    try:
+        report, _ = ZoomSessionReport.objects.update_or_create(session=session, defaults=defaults)
+    except IntegrityError:
+        # 동시에 첫 조회가 들어와 다른 요청이 먼저 만든 경우
+        report = ZoomSessionReport.objects.get(session=session)
+    return report
+
+
+def get_snapshot(session):
+    """저장된 스냅샷 (없으면 생성, 압축 본문은 필요할 때 읽음)"""
+    report = ZoomSessionReport.objects.filter(session=session).defer('payload').first()
+    if report is None:
+        report = build_snapshot(session)
+    return report
+
+
+def invalidate_snapshots(**filters):
+    """캡처가 삭제되는 등 보고서가 바뀌면 스냅샷 삭제 (다음 조회 때 다시 생성)"""
+    ZoomSessionReport.objects.filter(**filters).delete()
+
+
+def encode_cursor(offset):
+    return base64.urlsafe_b64encode(f's={offset}'.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    스냅샷 커서의 위치
+
+    Returns:
+        int | None: 스냅샷 커서가 아니면 None (진행 중일 때 받은 DB 커서 등)
+    """
+    try:
+        values = parse_qs(base64.urlsafe_b64decode(cursor.encode()).decode(), strict_parsing=True)
+        offset = int(values['s'][0])
+    except (ValueError, KeyError, UnicodeDecodeError):
+        return None
+    return offset if offset >= 0 else None
+
+
+def signing_epoch(now=None):
+    """
+    URL 서명 주기 번호와 남은 시간(초)
+
+    같은 주기 안에서는 렌더링된 페이지를 그대로 재사용하므로
+    ZOOM_REPORT_RESIGN_INTERVAL 은 서명 URL 만료 시간보다 짧아야 한다.
+    """
+    now = time.time() if now is None else now
+    interval = settings.ZOOM_REPORT_RESIGN_INTERVAL
+    epoch = int(now // interval)
+    return epoch, max(1, int((epoch + 1) * interval - now))
+
+
+def snapshot_etag(report, alerts_only, offset, page_size, epoch):
+    """보고서 내용 + 조회 조건 + 서명 주기가 같으면 같은 ETag"""
+    key = f'{report.digest}:{int(alerts_only)}:{offset}:{page_size}:{epoch}'
+    return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+
+def render_snapshot_page(report, request, alerts_only, offset, page_size):
+    """스냅샷에서 한 페이지를 꺼내 이미지 URL만 다시 서명"""
+    payload = json.loads(zlib.decompress(report.payload))
+
+    captures = payload['captures']
+    if alerts_only:
+        captures = [c for c in captures if c['record']['is_deepfake']]
+    page = captures[offset:offset + page_size]
+
+    storage = S3Storage()
+    for capture in page:
+        source = capture['record'].pop('image_source')
+        capture['record']['image_url'] = resolve_image_url(source, storage, request)
+
+    url = request.build_absolute_uri()
+    next_link = previous_link = None
+    if offset + page_size < len(captures):
+        next_link = replace_query_param(url, 'cursor', encode_cursor(offset + page_size))
+    if offset > 0:
+        previous = max(0, offset - page_size)
+        previous_link = (
+            replace_query_param(url, 'cursor', encode_cursor(previous))
+            if previous else remove_query_param(url, 'cursor')
+        )
+
+    return {
+        'session': payload['session'],
+        'captures': page,
+        'next': next_link,
+        'previous': previous_link,
+        'summary': payload['summary'],
+    }
+
+
+def cached_snapshot_page(report, request, alerts_only, offset, page_size, etag, ttl):
+    """같은 ETag 에는 같은 본문을 반환 (서명 주기가 끝날 때까지 공유 캐시에 보관)"""
+    key = f'zoom:report:{report.session_id}:{etag[1:-1]}'
+    data = cache.get(key)
+    if data is None:
+        data = render_snapshot_page(report, request, alerts_only, offset, page_size)
+        cache.set(key, data, timeout=ttl)
+    return data
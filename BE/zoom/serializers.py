@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import ZoomSession, ZoomCapture
+from .models import ZoomSession, ZoomCapture, ZoomSessionMinute
+from .services import ALERT_RESULTS
 from detection.serializers import AnalysisRecordSerializer
 
 
@@ -104,7 +105,7 @@ class ZoomCaptureDetailSerializer(serializers.ModelSerializer):
     
     def get_is_deepfake(self, obj):
         """딥페이크 여부"""
-        return obj.record.analysis_result in ['suspicious', 'deepfake']
+        return obj.record.analysis_result in ALERT_RESULTS
     
     def get_confidence(self, obj):
         """신뢰도 점수"""
@@ -149,6 +150,107 @@ class ZoomCaptureSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class ZoomReportCaptureSerializer(serializers.ModelSerializer):
+    """
+    Zoom 세션 보고서용 캡처 Serializer (목록 전용, 캡처당 추가 쿼리 없음)
+    
+    record 는 보고서에 필요한 필드만 담는다 (전체 분석 기록은 captures/<id>/ 에서 조회).
+    원본 파일 정보는 뷰가 페이지 단위로 한 번에 조회해 context['media_files'] 로 넘긴다.
+    """
+    
+    record = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ZoomCapture
+        fields = [
+            'capture_id',
+            'session',
+            'record',
+            'participant_count',
+            'capture_timestamp',
+            'alert_triggered',
+        ]
+        read_only_fields = fields
+    
+    def get_record(self, obj):
+        record = obj.record
+        data = {
+            'record_id': record.record_id,
+            'analysis_result': record.analysis_result,
+            'is_deepfake': record.analysis_result in ALERT_RESULTS,
+            'confidence_score': str(record.confidence_score),
+            'original_path': record.original_path,
+        }
+        
+        source = self._image_source(record)
+        if self.context.get('snapshot'):
+            # 스냅샷에는 만료되는 서명 URL 대신 서명 대상만 저장
+            data['image_source'] = source
+        else:
+            data['image_url'] = resolve_image_url(
+                source, self.context.get('storage'), self.context.get('request')
+            )
+        return data
+    
+    def _image_source(self, record):
+        """원본 이미지 위치 ([저장소 종류, 키/경로] 또는 None)"""
+        if not record.original_path:
+            return None
+        
+        media_file = self.context.get('media_files', {}).get(record.record_id)
+        if media_file is None:
+            return ['local', record.original_path]
+        if media_file.storage_type == 's3' and media_file.s3_key:
+            return ['s3', media_file.s3_key]
+        return ['local', media_file.file_path]
+
+
+def resolve_image_url(source, storage, request):
+    """
+    이미지 위치를 URL로 변환 (S3 는 매번 새로운 Presigned URL)
+    
+    Args:
+        source: ZoomReportCaptureSerializer 가 만든 [저장소 종류, 키/경로]
+        storage: S3Storage (S3 위치가 있을 때만 필요)
+        request: 로컬 파일의 절대 URL 생성용
+    """
+    if source is None:
+        return None
+    
+    kind, key = source
+    if kind == 's3':
+        return storage.get_presigned_url(key)
+    if request:
+        return request.build_absolute_uri(f'/media/{key}')
+    return None
+
+
+class ZoomSessionMinuteSerializer(serializers.ModelSerializer):
+    """Zoom 세션 타임라인 (분 단위 집계) Serializer"""
+    
+    minute = serializers.DateTimeField(source='bucket', read_only=True)
+    average_participants = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ZoomSessionMinute
+        fields = [
+            'minute',
+            'captures',
+            'analysed_frames',
+            'alerts',
+            'max_confidence',
+            'average_participants',
+            'participant_max',
+        ]
+        read_only_fields = fields
+    
+    def get_average_participants(self, obj):
+        """평균 참가자 수"""
+        if obj.captures == 0:
+            return 0.0
+        return round(obj.participant_total / obj.captures, 1)
+
+
 class ZoomSessionStartSerializer(serializers.Serializer):
     """Zoom 세션 시작 Serializer"""
     
@@ -165,4 +267,9 @@ class ZoomCaptureRequestSerializer(serializers.Serializer):
     participant_count = serializers.IntegerField(
         min_value=1,
         help_text="참가자 수"
+    )
+    push = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="true 이면 접수 즉시 응답하고 결과는 세션 이벤트 스트림(SSE)으로 전달"
     )
\ No newline at end of file
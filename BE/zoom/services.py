@@ -0,0 +1,632 @@
+import io
+import math
+import mimetypes
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import Count, Max, Min, Q, Sum
+from PIL import Image
+
+from detection.admission import AdmissionController
+from media_files.write_buffer import get_write_buffer
+from users.models import AppSetting
+
+from .models import ZoomCapture, ZoomSession, ZoomSessionMinute
+
+# 경고로 보는 판정 (간격 단축, 경고 구간 시작, 보고서 경고 캡처)
+ALERT_RESULTS = ('suspicious', 'deepfake')
+
+
+def compute_dhash(image_file, hash_size=8):
+    """
+    difference hash (dHash) 계산
+
+    그레이스케일 (hash_size+1) x hash_size 로 축소한 뒤
+    가로로 인접한 픽셀의 밝기 증감을 비트로 기록한다.
+
+    Args:
+        image_file: 이미지 파일 객체
+        hash_size: 해시 한 변 크기 (기본 8 → 64비트)
+
+    Returns:
+        int | None: 해시 값 (이미지를 읽지 못하면 None)
+    """
+    try:
+        image_file.seek(0)
+        with Image.open(image_file) as img:
+            # JPEG는 디코딩 단계에서 축소 (전체 해상도 디코딩 생략)
+            img.draft('L', (hash_size * 8, hash_size * 8))
+            small = img.convert('L').resize(
+                (hash_size + 1, hash_size),
+                Image.Resampling.BILINEAR
+            )
+            pixels = list(small.getdata())
+    except (OSError, ValueError):
+        return None
+    finally:
+        image_file.seek(0)
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+FRAME_FORMATS = {
+    'JPEG': ('image/jpeg', 'jpg'),
+    'WEBP': ('image/webp', 'webp'),
+}
+
+
+def inspect_frame(data, content_type=None):
+    """
+    원본 프레임 바이트 검사 (매직 바이트 + 헤더의 이미지 크기만 확인, 픽셀 디코딩 없음)
+
+    Args:
+        data: 이미지 바이트
+        content_type: 요청 Content-Type (있으면 실제 형식과 일치해야 함)
+
+    Returns:
+        dict: {'format', 'content_type', 'extension', 'width', 'height'}
+
+    Raises:
+        ValueError: 지원하지 않는 형식 / 손상된 헤더 / 허용 범위를 벗어난 크기
+    """
+    if data[:3] == b'\xff\xd8\xff':
+        image_format = 'JPEG'
+    elif data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        image_format = 'WEBP'
+    else:
+        raise ValueError('JPEG 또는 WebP 이미지만 허용됩니다.')
+
+    expected_type, extension = FRAME_FORMATS[image_format]
+    if content_type and content_type.split(';')[0].strip().lower() != expected_type:
+        raise ValueError(f'Content-Type 이 실제 이미지 형식({expected_type})과 다릅니다.')
+
+    try:
+        # Image.open 은 헤더만 읽는다 (load() 전까지 디코딩하지 않음)
+        with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+            actual_format = img.format
+    except (OSError, ValueError, Image.DecompressionBombError):
+        raise ValueError('이미지 헤더를 읽을 수 없습니다.')
+
+    if actual_format != image_format:
+        raise ValueError('이미지 헤더를 읽을 수 없습니다.')
+
+    min_side = settings.ZOOM_FRAME_MIN_SIDE
+    max_side = settings.ZOOM_FRAME_MAX_SIDE
+    if min(width, height) < min_side or max(width, height) > max_side:
+        raise ValueError(f'이미지 크기는 {min_side}~{max_side}px 이어야 합니다.')
+
+    return {
+        'format': image_format,
+        'content_type': expected_type,
+        'extension': extension,
+        'width': width,
+        'height': height,
+    }
+
+
+def hamming_distance(a, b):
+    """두 해시의 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+class FrameDeduplicator:
+    """
+    세션별 마지막 분석 프레임의 dHash 와 판정 결과 보관
+
+    새 프레임이 설정된 해밍 거리 이내이면 이전 판정을 재사용하여
+    AI 호출을 생략한다. 오래된 판정은 ZOOM_FRAME_HASH_MAX_AGE 후 만료된다.
+    """
+
+    def __init__(self, session_id):
+        self.key = f'zoom:session:{session_id}:last_frame'
+        self.max_distance = settings.ZOOM_FRAME_HASH_MAX_DISTANCE
+        self.max_age = settings.ZOOM_FRAME_HASH_MAX_AGE
+
+    def match(self, frame_hash):
+        """
+        이전 분석 프레임과 비교
+
+        Returns:
+            tuple: (재사용할 판정 dict | None, 해밍 거리 | None)
+        """
+        if frame_hash is None:
+            return None, None
+
+        last = cache.get(self.key)
+        if last is None:
+            return None, None
+
+        distance = hamming_distance(frame_hash, last['frame_hash'])
+        if distance > self.max_distance:
+            return None, distance
+
+        return last['verdict'], distance
+
+    def remember(self, frame_hash, analysis_result, confidence_score, detection_details):
+        """분석한 프레임의 해시와 판정 저장"""
+        if frame_hash is None:
+            return
+
+        cache.set(self.key, {
+            'frame_hash': frame_hash,
+            'verdict': {
+                'analysis_result': analysis_result,
+                'confidence_score': float(confidence_score),
+                'detection_details': detection_details,
+            },
+        }, timeout=self.max_age)
+
+    def clear(self):
+        cache.delete(self.key)
+
+
+class FrameRingBuffer:
+    """
+    세션별 미분석 프레임 링 버퍼 (로컬 디스크)
+
+    분석하지 않는 프레임은 S3/DB에 저장하지 않고 최근 ZOOM_FRAME_BUFFER_SIZE 장만 보관한다.
+    경고가 발생하면 drain() 으로 꺼내 경고 직전 증거 프레임으로 저장하고,
+    세션이 끝나면 clear() 로 비운다.
+    버퍼는 요청을 받은 서버의 디스크에 있으므로 서버가 여러 대면 서버별로 따로 쌓인다.
+
+    파일명: {캡처 시각(ms)}_{참가자 수}_{uuid}.{확장자}
+    """
+
+    CLAIMED_SUFFIX = '.claimed'
+
+    def __init__(self, session_id):
+        self.directory = os.path.join(settings.ZOOM_FRAME_BUFFER_DIR, str(session_id))
+        self.size = settings.ZOOM_FRAME_BUFFER_SIZE
+        self.max_age = settings.ZOOM_ALERT_WINDOW
+
+    def push(self, uploaded_file, participant_count, captured_at):
+        """프레임 추가 (가득 차면 가장 오래된 프레임 삭제)"""
+        if self.size <= 0:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        extension = os.path.splitext(uploaded_file.name)[1].lower() or '.jpg'
+        name = f'{int(captured_at.timestamp() * 1000)}_{int(participant_count)}_{uuid.uuid4().hex}{extension}'
+        path = os.path.join(self.directory, name)
+
+        # 임시 파일에 쓴 뒤 이름 변경 → 다른 워커가 쓰는 중인 파일을 읽지 않음
+        uploaded_file.seek(0)
+        with open(path + '.tmp', 'wb') as f:
+            for chunk in uploaded_file.chunks():
+                f.write(chunk)
+        uploaded_file.seek(0)
+        os.replace(path + '.tmp', path)
+
+        for old in self._frames()[:-self.size]:
+            self._remove(old)
+
+    def drain(self, now):
+        """
+        보관 중인 프레임 모두 꺼내기 (ZOOM_ALERT_WINDOW 보다 오래된 프레임은 버림)
+
+        Returns:
+            list[dict]: 오래된 순 {'file', 'participant_count', 'captured_at'}
+        """
+        frames = []
+        for name in self._frames():
+            path = os.path.join(self.directory, name)
+            claimed = path + self.CLAIMED_SUFFIX
+
+            # 이름 변경에 성공한 워커만 프레임을 가져감 (중복 저장 방지)
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+
+            try:
+                timestamp, participant_count, _ = name.split('_', 2)
+                captured_at = datetime.fromtimestamp(int(timestamp) / 1000, tz=dt_timezone.utc)
+                if (now - captured_at).total_seconds() > self.max_age:
+                    continue
+
+                with open(claimed, 'rb') as f:
+                    data = f.read()
+            except (OSError, ValueError):
+                continue
+            finally:
+                self._remove(name + self.CLAIMED_SUFFIX)
+
+            content_type = mimetypes.guess_type(name)[0] or 'image/jpeg'
+            frames.append({
+                'file': SimpleUploadedFile(name.split('_', 2)[2], data, content_type),
+                'participant_count': int(participant_count),
+                'captured_at': captured_at,
+            })
+        return frames
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _frames(self):
+        """보관 중인 프레임 파일명 (오래된 순)"""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+
+        frames = [n for n in names if not n.endswith(('.tmp', self.CLAIMED_SUFFIX))]
+        return sorted(frames, key=lambda n: int(n.split('_', 1)[0]))
+
+    def _remove(self, name):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+
+class AlertWindow:
+    """
+    세션별 최근 경고 판정 (ZOOM_ALERT_WINDOW 초 동안 유지)
+
+    경고 구간 안에 들어온 미분석 프레임은 버퍼에 넣지 않고
+    이 판정으로 바로 저장한다.
+    """
+
+    def __init__(self, session_id):
+        self.key = f'zoom:session:{session_id}:alert_window'
+
+    def open(self, analysis_result, confidence_score, detection_details):
+        cache.set(self.key, {
+            'analysis_result': analysis_result,
+            'confidence_score': float(confidence_score),
+            'detection_details': detection_details,
+        }, timeout=settings.ZOOM_ALERT_WINDOW)
+
+    def get(self):
+        return cache.get(self.key)
+
+    def clear(self):
+        cache.delete(self.key)
+
+
+class ActiveSessionState:
+    """
+    캡처 처리용 세션 상태 (공유 캐시, 튜플 1개로 저장)
+
+    캡처마다 하던 세션 조회(소유자/상태/분석 시각/간격)와 앱 설정 조회를 캐시 조회 1번으로 대신한다.
+    분석 시각/간격이 바뀌면 DB에 먼저 쓰고 캐시에도 반영하며(write-through),
+    세션을 종료하면 별도 키에 종료 표시를 남겨 모든 워커가 더 이상 캡처를 받지 않는다.
+
+    분석 차례는 여전히 DB 조건부 UPDATE(AnalysisScheduler.check)로 확정하므로
+    캐시 값이 잠시 늦더라도 한 요청만 분석한다. 세션 통계(카운터)는 쓰기 버퍼에서 합산된다.
+    워커가 여러 개면 공유 캐시(CACHE_BACKEND)가 필요하다.
+    """
+
+    __slots__ = (
+        'session_id',
+        'user_id',
+        'session_status',
+        'session_name',
+        'start_time',
+        'last_ai_analysis_time',
+        'ai_analysis_interval',
+        'capture_interval',
+    )
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    @classmethod
+    def load(cls, session_id):
+        """
+        세션 상태 (캐시에 없으면 DB에서 세션+앱 설정을 한 번에 읽어 저장)
+
+        종료 표시가 있으면 캐시된 상태보다 우선한다 (캐시 조회는 상태와 함께 1번).
+
+        Returns:
+            ActiveSessionState | None: 세션이 없으면 None
+        """
+        key = cls._key(session_id)
+        ended_key = cls._ended_key(session_id)
+        cached = cache.get_many([key, ended_key])
+        ended = cached.get(ended_key)
+
+        if key in cached:
+            state = cls(*cached[key])
+            if ended is not None:
+                state.session_status = ended
+            return state
+
+        session = (
+            ZoomSession.objects
+            .select_related('user__app_settings')
+            .filter(session_id=session_id)
+            .first()
+        )
+        if session is None:
+            return None
+
+        try:
+            capture_interval = session.user.app_settings.zoom_capture_interval
+        except AppSetting.DoesNotExist:
+            capture_interval = 0
+
+        state = cls(
+            session.session_id,
+            session.user_id,
+            ended or session.session_status,
+            session.session_name,
+            session.start_time,
+            session.last_ai_analysis_time,
+            session.ai_analysis_interval,
+            capture_interval
+        )
+        state.save()
+        return state
+
+    @classmethod
+    def end(cls, session):
+        """
+        종료 표시 저장 + 캐시된 상태 삭제
+
+        종료 표시는 상태와 다른 키에 두므로 진행 중인 캡처의 write-through 가 상태를
+        'active' 로 다시 써도 load() 에서 종료로 덮어쓴다.
+        상태 캐시보다 오래 남도록 ZOOM_SESSION_STATE_TTL 의 2배 동안 유지한다.
+        """
+        cache.set(
+            cls._ended_key(session.session_id),
+            session.session_status,
+            timeout=settings.ZOOM_SESSION_STATE_TTL * 2
+        )
+        cache.delete(cls._key(session.session_id))
+
+    @classmethod
+    def invalidate(cls, session_ids):
+        """캐시 삭제 (앱 설정 변경 등, 다음 캡처가 DB에서 다시 읽음)"""
+        cache.delete_many([cls._key(session_id) for session_id in session_ids])
+
+    def is_active_for(self, user):
+        return self.session_status == 'active' and self.user_id == user.pk
+
+    def to_session(self):
+        """캡처 처리에 필요한 필드만 채운 ZoomSession (DB 조회 없음, update_fields 저장 가능)"""
+        session = ZoomSession(
+            session_id=self.session_id,
+            user_id=self.user_id,
+            session_status=self.session_status,
+            session_name=self.session_name,
+            start_time=self.start_time,
+            last_ai_analysis_time=self.last_ai_analysis_time,
+            ai_analysis_interval=self.ai_analysis_interval
+        )
+        session._state.adding = False
+        return session
+
+    def sync(self, session):
+        """분석 시각/간격 변경 반영 (그 사이 종료된 세션이면 건너뜀)"""
+        if cache.get(self._ended_key(self.session_id)) is not None:
+            return
+
+        self.last_ai_analysis_time = session.last_ai_analysis_time
+        self.ai_analysis_interval = session.ai_analysis_interval
+        self.save()
+
+    def save(self):
+        cache.set(
+            self._key(self.session_id),
+            tuple(getattr(self, name) for name in self.__slots__),
+            timeout=settings.ZOOM_SESSION_STATE_TTL
+        )
+
+    @staticmethod
+    def _key(session_id):
+        return f'zoom:session:{session_id}:state'
+
+    @staticmethod
+    def _ended_key(session_id):
+        return f'zoom:session:{session_id}:ended'
+
+
+class AnalysisScheduler:
+    """
+    세션별 AI 분석 간격 계산
+
+    - suspicious/deepfake 판정 직후에는 최소 간격으로 자주 분석
+    - safe 판정이 이어지면 ZOOM_ANALYSIS_BACKOFF 배씩 간격을 늘림
+    - AI 혼잡도가 높으면 모든 간격을 늘림 (판정 시점에 적용)
+
+    분석 차례 판단은 조건부 UPDATE 한 번으로 처리하므로
+    여러 워커가 같은 세션의 캡처를 동시에 받아도 한 요청만 분석한다.
+    """
+
+    def __init__(self, session, user, state=None):
+        self.session = session
+        self.user = user
+        self.state = state
+        capture_interval = state.capture_interval if state is not None else self._capture_interval()
+        self.min_interval = max(settings.ZOOM_ANALYSIS_MIN_INTERVAL, capture_interval)
+        self.max_interval = max(settings.ZOOM_ANALYSIS_MAX_INTERVAL, self.min_interval)
+        self._previous_analysis_time = session.last_ai_analysis_time
+
+    @property
+    def interval(self):
+        """현재 세션 간격 (혼잡도 반영 전)"""
+        return self.session.ai_analysis_interval or settings.ZOOM_ANALYSIS_BASE_INTERVAL
+
+    def check(self, now):
+        """
+        지금 분석할 차례인지 확인
+
+        Returns:
+            tuple: (분석 여부, 다음 분석까지 남은 초, 혼잡도 배율)
+        """
+        load_factor = self.load_factor()
+        effective = self.interval * load_factor
+
+        last = self.session.last_ai_analysis_time
+        if last is not None and (now - last).total_seconds() < effective:
+            return False, math.ceil(effective - (now - last).total_seconds()), load_factor
+
+        # 차례가 된 것으로 보이면 조건부 UPDATE 로 분석 권한 확보 (첫 캡처는 즉시 분석, 종료된 세션 제외)
+        claimed = ZoomSession.objects.filter(pk=self.session.pk, session_status='active').filter(
+            Q(last_ai_analysis_time__isnull=True)
+            | Q(last_ai_analysis_time__lte=now - timedelta(seconds=effective))
+        ).update(last_ai_analysis_time=now)
+
+        if claimed:
+            self._previous_analysis_time = last
+            self.session.last_ai_analysis_time = now
+            self._write_through()
+            return True, 0, load_factor
+
+        # 다른 요청이 먼저 분석을 시작함 (또는 그 사이 세션이 종료됨 → 호출한 쪽에서 확인)
+        self.session.refresh_from_db(fields=['last_ai_analysis_time', 'ai_analysis_interval', 'session_status'])
+        self._write_through()
+        last = self.session.last_ai_analysis_time or now
+        remaining = self.interval * load_factor - (now - last).total_seconds()
+        return False, max(0, math.ceil(remaining)), load_factor
+
+    def release(self, now):
+        """
+        check() 로 확보한 분석 권한 반납 (프레임을 분석하지 않은 경우)
+
+        그 사이 다른 요청이 분석 시각을 갱신했다면 건드리지 않는다.
+        """
+        ZoomSession.objects.filter(
+            pk=self.session.pk,
+            last_ai_analysis_time=now
+        ).update(last_ai_analysis_time=self._previous_analysis_time)
+        self.session.last_ai_analysis_time = self._previous_analysis_time
+        self._write_through()
+
+    def update_interval(self, analysis_result):
+        """판정 결과로 다음 간격을 정해 저장"""
+        self.session.ai_analysis_interval = self.next_interval(analysis_result)
+        self.session.save(update_fields=['ai_analysis_interval'])
+        self._write_through()
+
+    def next_interval(self, analysis_result):
+        """판정 결과에 따른 다음 간격 (초)"""
+        if analysis_result in ALERT_RESULTS:
+            return self.min_interval
+
+        # 첫 safe 판정은 기본 간격, 이후 배수로 증가
+        previous = self.session.ai_analysis_interval
+        if previous is None:
+            return min(self.max_interval, settings.ZOOM_ANALYSIS_BASE_INTERVAL)
+        return int(min(self.max_interval, max(self.min_interval, previous * settings.ZOOM_ANALYSIS_BACKOFF)))
+
+    def load_factor(self):
+        """zoom 추론 혼잡도 → 간격 배율 (1.0 ~ ZOOM_ANALYSIS_LOAD_MAX_MULTIPLIER)"""
+        stats = AdmissionController('zoom', None).stats()
+        pressure = max(
+            stats['in_flight'] / stats['limit'] if stats['limit'] else 0.0,
+            stats['queued'] / stats['max_queue'] if stats['max_queue'] else 0.0
+        )
+
+        threshold = settings.ZOOM_ANALYSIS_LOAD_THRESHOLD
+        if pressure <= threshold:
+            return 1.0
+
+        ratio = min(1.0, (pressure - threshold) / (1 - threshold)) if threshold < 1 else 1.0
+        return round(1 + ratio * (settings.ZOOM_ANALYSIS_LOAD_MAX_MULTIPLIER - 1), 2)
+
+    def _write_through(self):
+        """세션 상태 캐시에 분석 시각/간격 반영"""
+        if self.state is not None:
+            self.state.sync(self.session)
+
+    def _capture_interval(self):
+        """사용자 앱 설정의 캡처 간격 (분석은 캡처보다 자주 할 수 없음)"""
+        try:
+            return self.user.app_settings.zoom_capture_interval
+        except AppSetting.DoesNotExist:
+            return 0
+
+
+def count_capture(session, alert=False, now=None, participant_count=0, analysed=False, confidence=None):
+    """
+    세션 캡처/경고 수 증가 + 분 단위 집계 upsert
+
+    쓰기 버퍼에서 세션별 증가분을 합쳐 F() 로 DB에서 더하므로
+    동시 요청의 증가분이 유실되지 않고, 프레임마다 UPDATE 하지 않는다.
+    분 단위 집계도 같은 분의 증가분을 합쳐 flush 마다 행당 UPDATE(없으면 INSERT) 1회로 반영된다.
+
+    Args:
+        now: 캡처 수신 시각 (집계 구간 기준)
+        analysed: AI 추론 결과로 판정된 프레임인지 (이전 판정 재사용/폐기는 제외)
+        confidence: AI 판정 신뢰도 (analysed 일 때)
+    """
+    buffer = get_write_buffer()
+    buffer.increment(
+        ZoomSession,
+        session.pk,
+        total_captures=1,
+        suspicious_detections=int(alert)
+    )
+    buffer.upsert(
+        ZoomSessionMinute,
+        key={'session': session, 'bucket': minute_bucket(now or datetime.now(dt_timezone.utc))},
+        increments={
+            'captures': 1,
+            'analysed_frames': int(analysed),
+            'alerts': int(alert),
+            'participant_total': participant_count,
+        },
+        maxima={
+            'max_confidence': confidence if analysed else None,
+            'participant_max': participant_count or None,
+        }
+    )
+
+
+def minute_bucket(moment):
+    """집계 구간 시작 (분 단위로 내림)"""
+    return moment.replace(second=0, microsecond=0)
+
+
+def summarize_session(session):
+    """
+    세션 보고서 요약 (저장된 캡처는 DB 집계 쿼리 1회)
+
+    total_captures/suspicious_detections 는 저장되지 않은 프레임까지 센 세션 통계이고,
+    stored_captures 이하는 실제 저장된 캡처 기준이다 (compacted_captures 는 마무리 작업에서 압축된 수).
+    """
+    stats = ZoomCapture.objects.filter(session=session).aggregate(
+        stored_captures=Count('capture_id'),
+        participant_total=Sum('participant_count'),
+        alert_captures=Count('capture_id', filter=Q(record__analysis_result__in=ALERT_RESULTS)),
+        max_confidence=Max('record__confidence_score'),
+        first_capture=Min('capture_timestamp'),
+        last_capture=Max('capture_timestamp')
+    )
+
+    total = session.total_captures
+    # 마무리 작업에서 요약 기록으로 압축된 캡처도 평균 참가자 수에 포함
+    counted = stats['stored_captures'] + session.compacted_captures
+    participants = (stats['participant_total'] or 0) + session.compacted_participants
+    return {
+        'total_captures': total,
+        'suspicious_detections': session.suspicious_detections,
+        'detection_rate': round(
+            (session.suspicious_detections / total * 100) if total > 0 else 0, 2
+        ),
+        'duration_seconds': session.duration,
+        'average_participants': round(participants / counted if counted > 0 else 0, 1),
+        'stored_captures': stats['stored_captures'],
+        'compacted_captures': session.compacted_captures,
+        'alert_captures': stats['alert_captures'],
+        'max_confidence': (
+            float(stats['max_confidence']) if stats['max_confidence'] is not None else None
+        ),
+        'first_capture': stats['first_capture'],
+        'last_capture': stats['last_capture'],
+    }
@@ -1,3 +1,665 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
 
-# Create your tests here.
+from datetime import timedelta
+
+from django.core.cache import cache, caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from detection.jobs import claim_next_job, enqueue_zoom_finalization, process_job
+from detection.models import AnalysisRecord
+from detection.pipeline import AnalysisFailedError, DetectionPipeline
+from media_files.models import MediaFile
+from media_files.write_buffer import get_write_buffer
+from users.models import User
+
+from . import push
+from .models import ZoomCapture, ZoomSession, ZoomSessionMinute, ZoomSessionReport
+from .services import ActiveSessionState, AnalysisScheduler, FrameRingBuffer, count_capture, inspect_frame
+
+
+def make_frame(seed):
+    """요청마다 다른 JPEG 프레임"""
+    buffer = io.BytesIO()
+    Image.effect_noise((160, 90), 20 + seed).convert('RGB').save(buffer, 'JPEG')
+    return SimpleUploadedFile(f'frame-{seed}.jpg', buffer.getvalue(), 'image/jpeg')
+
+
+def fake_upload_and_infer(inferences=None, delay=0, error=None, faces=None):
+    """
+    AI 서버 없이 동작하는 DetectionPipeline.upload_and_infer 대체 함수
+
+    Args:
+        inferences: 추론 요청마다 content_hash 를 추가할 목록
+        delay: 추론 소요 시간(초)
+        error: 파일 저장 후 발생시킬 예외 (없으면 faces 로 응답)
+        faces: 응답할 얼굴별 결과 (없으면 얼굴 없음)
+    """
+    lock = threading.Lock()
+
+    def upload_and_infer(pipeline, uploaded_file, file_type, purpose,
+                         is_temporary=False, metadata=None, content_hash=None):
+        if inferences is not None:
+            with lock:
+                inferences.append(content_hash)
+        if delay:
+            time.sleep(delay)
+        pipeline.media_file = pipeline.upload(
+            uploaded_file, file_type, purpose,
+            is_temporary=is_temporary, metadata=metadata
+        )
+        pipeline.input_url = pipeline.locate(pipeline.media_file)
+        if error is not None:
+            raise error
+        return {'success': True, 'face_quality_scores': list(faces or []), 'cache_hit': False}
+
+    return upload_and_infer
+
+
+class ZoomSessionTestMixin:
+    """
+    진행 중인 세션 1개와 세션 소유자로 인증된 클라이언트 준비
+
+    캐시와 프레임 버퍼 디렉토리는 테스트마다 새로 쓰고,
+    세션 통계 증가분은 테스트가 끝날 때 쓰기 버퍼에서 반영해 다음 테스트로 넘어가지 않게 한다.
+    """
+
+    nickname = 'zoom'
+
+    def setUp(self):
+        cache.clear()
+        caches['zoom_events'].clear()
+
+        self.buffer_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.buffer_dir, ignore_errors=True)
+        buffer_settings = override_settings(ZOOM_FRAME_BUFFER_DIR=self.buffer_dir)
+        buffer_settings.enable()
+        self.addCleanup(buffer_settings.disable)
+
+        self.user = User.objects.create_user(email=f'zoom-{self.nickname}@example.com', nickname=self.nickname)
+        self.session = ZoomSession.objects.create(
+            user=self.user,
+            session_name=self.nickname,
+            start_time=timezone.now(),
+            session_status='active',
+            **self.session_options()
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.addCleanup(get_write_buffer().flush)
+
+    def session_options(self):
+        """세션 생성 시 추가 필드"""
+        return {}
+
+    def capture(self, screenshot, client=None, **data):
+        return (client or self.client).post(
+            f'/api/zoom/sessions/{self.session.session_id}/capture/',
+            {'screenshot': screenshot, 'participant_count': 2, **data},
+            format='multipart'
+        )
+
+
+class ZoomCaptureConcurrencyTest(ZoomSessionTestMixin, TransactionTestCase):
+    """한 세션에 캡처가 동시에 몰려도 분석은 한 번, 통계는 유실 없이 집계되는지 확인"""
+
+    THREADS = 12
+    nickname = 'race'
+
+    def test_concurrent_captures_analyse_once(self):
+        inferences = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(self.THREADS)
+        responses = []
+        errors = []
+
+        def capture(index):
+            client = APIClient()
+            client.force_authenticate(self.user)
+            try:
+                barrier.wait()
+                response = self.capture(make_frame(index), client=client)
+                with lock:
+                    responses.append(response)
+            except Exception as e:  # noqa: BLE001 - 스레드 예외를 테스트 스레드로 전달
+                with lock:
+                    errors.append(e)
+            finally:
+                connection.close()
+
+        # 추론 중에 다른 요청이 분석 차례를 판단하도록 지연
+        with override_settings(
+            AWS_S3_BACKEND='memory',
+            AWS_STORAGE_BUCKET_NAME='test',
+            AI_ADMISSION_ENABLED=False
+        ), mock.patch.object(DetectionPipeline, 'upload_and_infer', fake_upload_and_infer(inferences, delay=0.2)):
+            threads = [threading.Thread(target=capture, args=(i,)) for i in range(self.THREADS)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(inferences), 1)
+
+        analysed = [r for r in responses if r.data['ai_analyzed']]
+        buffered = [r for r in responses if r.data['buffered']]
+        self.assertEqual(len(analysed), 1)
+        self.assertEqual(len(buffered), self.THREADS - 1)
+
+        # 세션 통계는 쓰기 버퍼를 거쳐 반영됨
+        get_write_buffer().flush()
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.total_captures, self.THREADS)
+        minutes = ZoomSessionMinute.objects.filter(session=self.session)
+        self.assertEqual(sum(m.captures for m in minutes), self.THREADS)
+        self.assertEqual(sum(m.analysed_frames for m in minutes), 1)
+        self.assertEqual(self.session.suspicious_detections, 0)
+        self.assertIsNotNone(self.session.last_ai_analysis_time)
+        self.assertEqual(ZoomCapture.objects.filter(session=self.session).count(), 1)
+
+
+@override_settings(AI_ADMISSION_ENABLED=False)
+class ZoomSessionStateTest(ZoomSessionTestMixin, TestCase):
+    """캡처 처리 중 세션 확인이 캐시된 세션 상태로 이뤄지는지 확인"""
+
+    nickname = 'state'
+
+    def session_options(self):
+        # 방금 분석한 세션 → 다음 프레임들은 버퍼에만 보관
+        return {'last_ai_analysis_time': timezone.now(), 'ai_analysis_interval': 60}
+
+    def test_steady_state_capture_skips_db(self):
+        # 첫 캡처만 세션+앱 설정 조회 1회
+        with self.assertNumQueries(1):
+            self.assertTrue(self.capture(make_frame(0)).data['buffered'])
+        with self.assertNumQueries(0):
+            self.assertTrue(self.capture(make_frame(1)).data['buffered'])
+
+        response = self.client.post(f'/api/zoom/sessions/{self.session.session_id}/end/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.capture(make_frame(2)).status_code, 404)
+
+        other = User.objects.create_user(email='zoom-other@example.com', nickname='other')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.capture(make_frame(3)).status_code, 404)
+
+    def test_end_requires_owner_before_flush(self):
+        other = User.objects.create_user(email='zoom-intruder@example.com', nickname='intruder')
+        self.client.force_authenticate(other)
+
+        with mock.patch.object(get_write_buffer(), 'flush') as flush:
+            response = self.client.post(f'/api/zoom/sessions/{self.session.session_id}/end/')
+        self.assertEqual(response.status_code, 404)
+        flush.assert_not_called()
+
+    def test_end_is_sticky(self):
+        # 종료 직전에 상태를 읽은 캡처 요청
+        state = ActiveSessionState.load(self.session.session_id)
+        session = state.to_session()
+        scheduler = AnalysisScheduler(session, self.user, state=state)
+
+        response = self.client.post(f'/api/zoom/sessions/{self.session.session_id}/end/')
+        self.assertEqual(response.status_code, 200)
+
+        # 늦게 도착한 write-through 가 'active' 상태를 되살리지 않음
+        state.save()
+        self.assertEqual(ActiveSessionState.load(self.session.session_id).session_status, 'completed')
+
+        # 종료된 세션에서는 분석 권한을 확보하지 못함
+        should_analyze, _, _ = scheduler.check(timezone.now() + timedelta(hours=1))
+        self.assertFalse(should_analyze)
+        self.assertEqual(session.session_status, 'completed')
+        self.assertEqual(self.capture(make_frame(0)).status_code, 404)
+
+
+@override_settings(AWS_S3_BACKEND='memory', AWS_STORAGE_BUCKET_NAME='test', AI_ADMISSION_ENABLED=False)
+class ZoomStaticScreenTest(ZoomSessionTestMixin, TestCase):
+    """같은 화면이 이어지면 이전 판정을 이어받아 간격을 늘리고 프레임은 버퍼에만 보관하는지 확인"""
+
+    FRAMES = 24
+    STEP = 5  # 초
+    nickname = 'static'
+
+    def test_identical_frames_back_off(self):
+        inferences = []
+
+        # 노이즈 이미지는 생성할 때마다 달라지므로 한 번 만든 바이트를 반복 전송
+        frame = make_frame(0).read()
+        start = timezone.now()
+        responses = []
+        with mock.patch.object(DetectionPipeline, 'upload_and_infer', fake_upload_and_infer(inferences)):
+            for index in range(self.FRAMES):
+                moment = start + timedelta(seconds=index * self.STEP)
+                with mock.patch('django.utils.timezone.now', return_value=moment):
+                    responses.append(self.capture(SimpleUploadedFile('frame.jpg', frame, 'image/jpeg')))
+
+        # 첫 프레임만 AI 분석, 이후 차례(30초, 75초)는 이전 판정 재사용 → 간격 30 → 45 → 67
+        self.assertEqual(len(inferences), 1)
+        self.assertEqual([r.status_code for r in responses].count(201), 1)
+        inherited = [r.data for r in responses if r.data['inherited']]
+        self.assertEqual(len(inherited), 2)
+        self.assertTrue(all(d['buffered'] and not d['ai_analyzed'] for d in inherited))
+        self.assertEqual(inherited[-1]['analysis_interval'], 67)
+        self.assertEqual(responses[-1].data['next_analysis_in'], 67 - (self.FRAMES - 1 - 15) * self.STEP)
+
+        self.assertEqual(ZoomCapture.objects.filter(session=self.session).count(), 1)
+        get_write_buffer().flush()
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.total_captures, self.FRAMES)
+        self.assertEqual(self.session.ai_analysis_interval, 67)
+        self.assertEqual(self.session.last_ai_analysis_time, start + timedelta(seconds=75))
+
+
+@override_settings(AWS_S3_BACKEND='memory', AWS_STORAGE_BUCKET_NAME='test', AI_ADMISSION_ENABLED=False)
+class ZoomAnalysisFailureTest(ZoomSessionTestMixin, TestCase):
+    """AI 추론이 실패한 프레임은 분석한 것으로 보고하지 않는지 확인"""
+
+    nickname = 'failure'
+
+    def test_failed_inference_is_not_analysed(self):
+        failing = fake_upload_and_infer(error=AnalysisFailedError('AI 모델 분석 실패'))
+        with mock.patch.object(DetectionPipeline, 'upload_and_infer', failing):
+            response = self.capture(make_frame(0))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(response.data['ai_analyzed'])
+        self.assertFalse(response.data['dropped'])
+        self.assertEqual(response.data['analysis_result'], 'safe')
+
+
+@override_settings(AWS_S3_BACKEND='memory', AWS_STORAGE_BUCKET_NAME='test', AI_ADMISSION_ENABLED=False)
+class ZoomPushBacklogTest(ZoomSessionTestMixin, TestCase):
+    """푸시 대기열이 가득 차면 프레임을 메모리에 쌓지 않고 동기 처리하는지 확인"""
+
+    nickname = 'push'
+
+    def test_full_backlog_runs_synchronously(self):
+        push._get_executor()
+        with mock.patch.object(push, '_slots', threading.BoundedSemaphore(1)) as slots, \
+                mock.patch.object(push, 'submit_and_publish') as submit, \
+                mock.patch.object(DetectionPipeline, 'upload_and_infer', fake_upload_and_infer()):
+            slots.acquire()
+            response = self.capture(make_frame(0), push=True)
+
+        submit.assert_not_called()
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(response.data['pending'])
+        self.assertIsNotNone(response.data['capture_id'])
+
+    def test_events_are_kept_out_of_default_cache(self):
+        mailbox = push.SessionMailbox(self.session.session_id)
+        for index in range(3):
+            mailbox.publish('verdict', {'capture_id': index})
+
+        self.assertEqual([event_id for event_id, _, _ in mailbox.read_since(1)], [2, 3])
+        # 이벤트 키가 세션 상태/어드미션 슬롯과 같은 캐시를 차지하지 않음
+        self.assertIsNone(cache.get(mailbox.sequence_key))
+
+
+@override_settings(AWS_S3_BACKEND='memory', AWS_STORAGE_BUCKET_NAME='test', AI_ADMISSION_ENABLED=False)
+class ZoomFrameIngestTest(ZoomSessionTestMixin, TestCase):
+    """원본 프레임 API가 이미지 바이트 본문을 검사하고 잘못된 본문은 처리 전에 거절하는지 확인"""
+
+    nickname = 'frames'
+
+    def session_options(self):
+        # 방금 분석한 세션 → 올바른 프레임은 버퍼에만 보관 (202)
+        return {'last_ai_analysis_time': timezone.now(), 'ai_analysis_interval': 60}
+
+    def post_frame(self, data, content_type='image/jpeg'):
+        return self.client.post(
+            f'/api/zoom/sessions/{self.session.session_id}/frames/?participant_count=2',
+            data,
+            content_type=content_type
+        )
+
+    def encode(self, size=(160, 90), image_format='JPEG'):
+        buffer = io.BytesIO()
+        Image.new('RGB', size, 'gray').save(buffer, image_format)
+        return buffer.getvalue()
+
+    def test_jpeg_and_webp_frames(self):
+        response = self.post_frame(self.encode(), 'image/jpeg')
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(response.data['buffered'])
+
+        response = self.post_frame(self.encode(image_format='WEBP'), 'image/webp')
+        self.assertEqual(response.status_code, 202)
+
+        frame = inspect_frame(self.encode(image_format='WEBP'), 'image/webp; charset=binary')
+        self.assertEqual((frame['extension'], frame['width'], frame['height']), ('webp', 160, 90))
+
+    def test_wrong_content_type(self):
+        # 파서가 받지 않는 형식
+        self.assertEqual(self.post_frame(self.encode(), 'text/plain').status_code, 415)
+        # 본문과 다른 이미지 형식
+        response = self.post_frame(self.encode(), 'image/webp')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Content-Type', response.data['error'])
+
+    def test_bad_magic_bytes(self):
+        png = self.encode(image_format='PNG')
+        self.assertEqual(self.post_frame(png, 'image/png').status_code, 400)
+        self.assertEqual(self.post_frame(b'\x00' * 64).status_code, 400)
+        self.assertEqual(self.post_frame(b'RIFF\x00\x00\x00\x00WAVE', 'image/webp').status_code, 400)
+
+    def test_truncated_header(self):
+        data = self.encode()
+        for length in (3, 20, len(data) // 2):
+            with self.assertRaisesMessage(ValueError, '헤더'):
+                inspect_frame(data[:length], 'image/jpeg')
+        self.assertEqual(self.post_frame(data[:20]).status_code, 400)
+
+    @override_settings(ZOOM_FRAME_MIN_SIDE=32, ZOOM_FRAME_MAX_SIDE=320)
+    def test_out_of_range_size(self):
+        for size in ((16, 90), (160, 16), (640, 90)):
+            response = self.post_frame(self.encode(size))
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('32~320px', response.data['error'])
+
+    @override_settings(ZOOM_FRAME_MAX_BYTES=1024)
+    def test_oversized_body(self):
+        data = make_frame(0).read()
+        self.assertGreater(len(data), 1024)
+        self.assertEqual(self.post_frame(data).status_code, 400)
+        self.assertEqual(ZoomCapture.objects.filter(session=self.session).count(), 0)
+
+
+@override_settings(
+    AWS_S3_BACKEND='memory',
+    AWS_STORAGE_BUCKET_NAME='test',
+    AI_ADMISSION_ENABLED=False,
+    ZOOM_FRAME_BUFFER_SIZE=3,
+    ZOOM_ALERT_WINDOW=300
+)
+class ZoomFrameBufferTest(ZoomSessionTestMixin, TestCase):
+    """미분석 프레임은 최근 N장만 버퍼에 두고, 경고 시 저장, 세션 종료 시 비우는지 확인"""
+
+    nickname = 'buffer'
+
+    def session_options(self):
+        # 방금 분석한 세션 → 다음 분석 차례 전까지 프레임은 버퍼에만 보관
+        # 버퍼 파일명은 ms 단위 캡처 시각이므로 초 단위로 맞춰 비교
+        self.start = timezone.now().replace(microsecond=0)
+        return {'last_ai_analysis_time': self.start, 'ai_analysis_interval': 60}
+
+    def buffer_frames(self, count):
+        for index in range(count):
+            with mock.patch('django.utils.timezone.now', return_value=self.at(index + 1)):
+                response = self.capture(make_frame(index))
+            self.assertEqual(response.status_code, 202)
+            self.assertTrue(response.data['buffered'])
+
+    def at(self, seconds):
+        return self.start + timedelta(seconds=seconds)
+
+    def buffered_names(self):
+        return sorted(os.listdir(os.path.join(self.buffer_dir, str(self.session.session_id))))
+
+    def test_buffer_keeps_latest_frames(self):
+        self.buffer_frames(5)
+
+        names = self.buffered_names()
+        self.assertEqual(len(names), 3)
+        # 가장 최근 3장(3~5초)만 남음
+        self.assertEqual(
+            [int(name.split('_')[0]) for name in names],
+            [int(self.at(s).timestamp() * 1000) for s in (3, 4, 5)]
+        )
+        self.assertEqual(ZoomCapture.objects.filter(session=self.session).count(), 0)
+
+    def test_alert_promotes_buffered_frames(self):
+        self.buffer_frames(5)
+
+        deepfake = fake_upload_and_infer(faces=[{'is_deepfake': True, 'rate': 0.9}])
+        with mock.patch.object(DetectionPipeline, 'upload_and_infer', deepfake), \
+                mock.patch('django.utils.timezone.now', return_value=self.at(200)):
+            response = self.capture(make_frame(9))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(response.data['is_deepfake'])
+        self.assertEqual(response.data['promoted_frames'], 3)
+
+        promoted = ZoomCapture.objects.filter(session=self.session, alert_triggered=False)
+        self.assertEqual(
+            sorted(promoted.values_list('capture_timestamp', flat=True)),
+            [self.at(s) for s in (3, 4, 5)]
+        )
+        self.assertTrue(all(c.record.analysis_result == 'deepfake' for c in promoted))
+        self.assertEqual(ZoomCapture.objects.filter(session=self.session, alert_triggered=True).count(), 1)
+        self.assertEqual(self.buffered_names(), [])
+
+    def test_claimed_frame_is_promoted_once(self):
+        self.buffer_frames(2)
+        frame_buffer = FrameRingBuffer(self.session.session_id)
+        rename = os.rename
+        calls = []
+
+        def other_worker_claims_first(src, dst):
+            # 첫 프레임은 다른 워커가 먼저 이름을 바꿔 가져감
+            calls.append(src)
+            if len(calls) == 1:
+                rename(src, src + FrameRingBuffer.CLAIMED_SUFFIX)
+                raise FileNotFoundError(src)
+            rename(src, dst)
+
+        with mock.patch('zoom.services.os.rename', other_worker_claims_first):
+            frames = frame_buffer.drain(self.at(10))
+
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(frames[0]['captured_at'], self.at(2))
+        # 가져간 프레임은 다시 꺼내지지 않음
+        self.assertEqual(frame_buffer.drain(self.at(10)), [])
+
+    def test_session_end_clears_buffer(self):
+        self.buffer_frames(2)
+        self.assertEqual(len(self.buffered_names()), 2)
+
+        response = self.client.post(f'/api/zoom/sessions/{self.session.session_id}/end/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(os.path.exists(os.path.join(self.buffer_dir, str(self.session.session_id))))
+
+
+@override_settings(AWS_S3_BACKEND='memory', AWS_STORAGE_BUCKET_NAME='test', ZOOM_REPORT_PAGE_SIZE=4)
+class ZoomSessionReportTest(ZoomSessionTestMixin, TestCase):
+    """세션 보고서가 캡처 수와 무관한 쿼리 수로 요약/페이지를 반환하는지 확인"""
+
+    CAPTURES = 10
+    nickname = 'report'
+
+    def session_options(self):
+        return {'total_captures': 30, 'suspicious_detections': 3}
+
+    def setUp(self):
+        super().setUp()
+        for index in range(self.CAPTURES):
+            record = AnalysisRecord.objects.create(
+                user=self.user,
+                analysis_type='zoom',
+                file_name=f'frame-{index}.jpg',
+                file_size=100,
+                file_format='jpg',
+                original_path=f'zoom/frame-{index}.jpg',
+                analysis_result='deepfake' if index % 3 == 0 else 'safe',
+                confidence_score=50 + index,
+                processing_time=10,
+                ai_model_version='test'
+            )
+            MediaFile.objects.create(
+                user=self.user,
+                original_name=f'frame-{index}.jpg',
+                file_name=f'frame-{index}.jpg',
+                file_size=100,
+                file_type='image',
+                file_format='jpg',
+                mime_type='image/jpeg',
+                storage_type='s3',
+                s3_key=f'zoom/frame-{index}.jpg',
+                s3_bucket='test',
+                file_path=f'zoom/frame-{index}.jpg',
+                purpose='zoom',
+                related_model='AnalysisRecord',
+                related_record_id=record.record_id
+            )
+            ZoomCapture.objects.create(
+                session=self.session,
+                record=record,
+                participant_count=index % 4 + 1,
+                alert_triggered=index % 3 == 0
+            )
+        self.url = f'/api/zoom/sessions/{self.session.session_id}/report/'
+
+    def fetch_all(self, url):
+        captures = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            captures.extend(response.data['captures'])
+            url = response.data['next']
+        return response, captures
+
+    def test_summary_and_pages(self):
+        # 세션, 캡처 페이지, 원본 파일, 요약 집계
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+
+        summary = response.data['summary']
+        self.assertEqual(summary['total_captures'], 30)
+        self.assertEqual(summary['stored_captures'], self.CAPTURES)
+        self.assertEqual(summary['alert_captures'], 4)
+        self.assertEqual(summary['average_participants'], 2.3)
+        self.assertEqual(len(response.data['captures']), 4)
+        self.assertIn('X-Amz-Signature', response.data['captures'][0]['record']['image_url'])
+
+        _, captures = self.fetch_all(self.url)
+        ids = [c['capture_id'] for c in captures]
+        self.assertEqual(len(set(ids)), self.CAPTURES)
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+    def test_alerts_only(self):
+        _, captures = self.fetch_all(f'{self.url}?alerts_only=true')
+        self.assertEqual(len(captures), 4)
+        self.assertTrue(all(c['record']['is_deepfake'] for c in captures))
+
+    def complete_session(self):
+        self.session.session_status = 'completed'
+        self.session.end_time = timezone.now() - timedelta(minutes=5)
+        self.session.save()
+
+    def test_completed_session_snapshot(self):
+        _, live = self.fetch_all(self.url)
+        self.complete_session()
+
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        self.assertEqual(ZoomSessionReport.objects.filter(session=self.session).count(), 1)
+        self.assertEqual(response.data['summary']['stored_captures'], self.CAPTURES)
+
+        # 세션, 스냅샷 해시만 조회
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        _, snapshot = self.fetch_all(self.url)
+        self.assertEqual(
+            [c['capture_id'] for c in snapshot],
+            [c['capture_id'] for c in live]
+        )
+        self.assertIn('X-Amz-Signature', snapshot[0]['record']['image_url'])
+        self.assertNotIn('image_source', snapshot[0]['record'])
+
+        _, alerts = self.fetch_all(f'{self.url}?alerts_only=true')
+        self.assertEqual(len(alerts), 4)
+
+    def test_record_delete_invalidates_snapshot(self):
+        self.complete_session()
+        self.client.get(self.url)
+
+        capture = ZoomCapture.objects.filter(session=self.session).first()
+        response = self.client.delete(f'/api/detection/records/{capture.record_id}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(ZoomSessionReport.objects.filter(session=self.session).exists())
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['summary']['stored_captures'], self.CAPTURES - 1)
+
+    @override_settings(ZOOM_FINALIZE_DELAY=0, ZOOM_FINALIZE_BATCH_SIZE=4)
+    def test_finalization_compacts_safe_captures(self):
+        self.complete_session()
+        self.client.get(self.url)
+
+        enqueue_zoom_finalization(self.session)
+        job = process_job(claim_next_job())
+        self.assertEqual(job.status, 'completed')
+
+        self.session.refresh_from_db()
+        self.assertIsNotNone(self.session.finalized_at)
+        self.assertEqual(self.session.compacted_captures, 6)
+        self.assertEqual(job.record, self.session.summary_record)
+
+        # 경고 캡처 4건만 원본 유지 + 요약 기록 1건
+        self.assertEqual(ZoomCapture.objects.filter(session=self.session).count(), 4)
+        self.assertEqual(AnalysisRecord.objects.filter(user=self.user).count(), 5)
+        self.assertEqual(MediaFile.objects.filter(user=self.user).count(), 4)
+
+        response = self.client.get(self.url)
+        summary = response.data['summary']
+        self.assertEqual(summary['stored_captures'], 4)
+        self.assertEqual(summary['compacted_captures'], 6)
+        self.assertEqual(summary['average_participants'], 2.3)
+        _, captures = self.fetch_all(self.url)
+        self.assertTrue(all(c['record']['is_deepfake'] for c in captures))
+
+
+class ZoomSessionTimelineTest(ZoomSessionTestMixin, TestCase):
+    """분 단위 집계가 캡처마다 upsert 되고 타임라인이 집계 행만 읽는지 확인"""
+
+    nickname = 'timeline'
+
+    def setUp(self):
+        super().setUp()
+        self.url = f'/api/zoom/sessions/{self.session.session_id}/timeline/'
+
+    def test_minute_rollups(self):
+        start = timezone.now().replace(second=0, microsecond=0)
+        for minute in range(3):
+            for second in (5, 25, 45):
+                count_capture(
+                    self.session,
+                    alert=minute == 1 and second == 25,
+                    now=start + timedelta(minutes=minute, seconds=second),
+                    participant_count=second // 10,
+                    analysed=second == 25,
+                    confidence=60 + minute
+                )
+        get_write_buffer().flush()
+
+        # 세션, 집계 행
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        timeline = response.data['timeline']
+        self.assertEqual(len(timeline), 3)
+        self.assertEqual([m['captures'] for m in timeline], [3, 3, 3])
+        self.assertEqual([m['alerts'] for m in timeline], [0, 1, 0])
+        self.assertEqual([m['analysed_frames'] for m in timeline], [1, 1, 1])
+        self.assertEqual(timeline[2]['max_confidence'], '62.00')
+        self.assertEqual(timeline[0]['average_participants'], 2.0)
+        self.assertEqual(timeline[0]['participant_max'], 4)
+
+        since = (start + timedelta(minutes=1, seconds=30)).isoformat()
+        response = self.client.get(self.url, {'since': since})
+        self.assertEqual(len(response.data['timeline']), 2)
+
+        response = self.client.get(self.url, {'since': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
@@ -2,10 +2,13 @@ from django.urls import path
 from .views import (
     ZoomSessionStartView,
     ZoomCaptureView,
+    ZoomFrameView,
     ZoomSessionEndView,
     ZoomSessionListView,
     ZoomSessionReportView,
+    ZoomSessionTimelineView,
     ZoomCaptureDetailView,
+    session_events,
 )
 
 app_name = 'zoom'
@@ -18,8 +21,11 @@ urlpatterns = [
     
     # 캡처 분석
     path('sessions/<int:session_id>/capture/', ZoomCaptureView.as_view(), name='capture'),
+    path('sessions/<int:session_id>/frames/', ZoomFrameView.as_view(), name='frames'),
+    path('sessions/<int:session_id>/events/', session_events, name='session_events'),
     path('captures/<int:pk>/', ZoomCaptureDetailView.as_view(), name='capture_detail'),
     
     # 보고서
     path('sessions/<int:session_id>/report/', ZoomSessionReportView.as_view(), name='report'),
+    path('sessions/<int:session_id>/timeline/', ZoomSessionTimelineView.as_view(), name='timeline'),
 ]
\ No newline at end of file
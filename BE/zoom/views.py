@@ -1,21 +1,60 @@
 from rest_framework import status, generics
+from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
+import functools
+import hashlib
+import math
 import os
 
-from .models import ZoomSession, ZoomCapture
+from .models import ZoomSession, ZoomCapture, ZoomSessionMinute
 from .serializers import (
     ZoomSessionSerializer,
-    ZoomCaptureSerializer,
     ZoomSessionStartSerializer,
     ZoomCaptureRequestSerializer,
-    ZoomCaptureDetailSerializer
+    ZoomCaptureDetailSerializer,
+    ZoomReportCaptureSerializer,
+    ZoomSessionMinuteSerializer
 )
-from detection.models import AnalysisRecord
-from detection.services import AIModelService
-from media_files.services import FileService
+from .pagination import ZoomCaptureCursorPagination
+from .parsers import RawFrameParser
+from .reports import (
+    cached_snapshot_page,
+    decode_cursor,
+    get_snapshot,
+    media_files_for,
+    signing_epoch,
+    snapshot_etag,
+    snapshot_ready
+)
+from .push import SessionMailbox, event_stream, reserve_push_slot, submit_and_publish
+from .services import (
+    ALERT_RESULTS,
+    ActiveSessionState,
+    AlertWindow,
+    AnalysisScheduler,
+    FrameDeduplicator,
+    FrameRingBuffer,
+    compute_dhash,
+    count_capture,
+    inspect_frame,
+    minute_bucket,
+    summarize_session
+)
+from detection.admission import AdmissionRejected
+from detection.jobs import enqueue_zoom_finalization
+from detection.pipeline import AnalysisDeadlineExceeded, AnalysisFailedError, DetectionPipeline
+from media_files.storage import S3Storage
+from media_files.upload_handlers import get_content_hash
+from media_files.write_buffer import get_write_buffer
 
 
 class ZoomSessionStartView(APIView):
@@ -48,13 +87,26 @@ class ZoomSessionStartView(APIView):
 
 class ZoomCaptureView(APIView):
     """
-    Zoom 캡처 분석 API (30초 간격 제어)
+    Zoom 캡처 분석 API (세션별 적응형 간격 제어)
+    
+    프론트엔드: 주기적으로 캡처 → 즉시 백엔드 전송
+    백엔드: 세션 위험도와 AI 혼잡도에 따라 정해진 간격마다 AI 서버로 전송 (과부하 방지)
+            응답의 next_analysis_in 으로 다음 분석 시점을 알려준다
     
-    프론트엔드: 5초마다 캡처 → 즉시 백엔드 전송
-    백엔드: 30초에 1번만 AI 서버로 전송 (과부하 방지)
+    저장: 분석한 프레임과 경고 전후 ZOOM_ALERT_WINDOW 초 이내의 프레임만 S3/DB에 저장하고,
+          나머지는 세션별 링 버퍼에만 보관한다 (경고 발생 시 직전 프레임으로 저장)
     """
     
+    UPLOAD_OPTIONS = {
+        'file_type': 'screenshot',
+        'purpose': 'zoom',
+        'is_temporary': False,
+    }
+    
     def post(self, request, session_id):
+        # ✅ 공통 탐지 파이프라인 (Zoom 마감 시간은 요청 시작 시점부터 계산)
+        pipeline = DetectionPipeline(request.user, request, profile='zoom')
+        
         serializer = ZoomCaptureRequestSerializer(data=request.data)
         
         if not serializer.is_valid():
@@ -63,170 +115,439 @@ class ZoomCaptureView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        screenshot = serializer.validated_data['screenshot']
-        participant_count = serializer.validated_data['participant_count']
+        return self.handle_capture(
+            request,
+            pipeline,
+            session_id,
+            serializer.validated_data['screenshot'],
+            serializer.validated_data['participant_count'],
+            serializer.validated_data['push']
+        )
+    
+    def handle_capture(self, request, pipeline, session_id, screenshot, participant_count, push):
+        """검증된 프레임 처리 (multipart 캡처 / 원본 프레임 API 공통)"""
+        content_hash = get_content_hash(screenshot)
         
-        # 세션 확인
-        try:
-            session = ZoomSession.objects.get(
-                session_id=session_id,
-                user=request.user,
-                session_status='active'
-            )
-        except ZoomSession.DoesNotExist:
+        # ✅ 세션 확인 (캐시된 세션 상태, 없을 때만 DB 조회)
+        state = ActiveSessionState.load(session_id)
+        if state is None or not state.is_active_for(request.user):
             return Response(
                 {'error': '활성화된 세션을 찾을 수 없습니다.'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        session = state.to_session()
         
-        # ✅ 30초 경과 확인
+        # ✅ 분석 간격 경과 확인 (위험도/혼잡도 반영, 동시 요청 중 한 요청만 분석)
         now = timezone.now()
-        should_analyze = False
+        scheduler = AnalysisScheduler(session, request.user, state=state)
+        should_analyze, next_analysis_in, load_factor = scheduler.check(now)
+        if session.session_status != 'active':
+            # 캐시된 상태를 읽은 뒤 세션이 종료됨
+            return Response(
+                {'error': '활성화된 세션을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
         
-        if session.last_ai_analysis_time is None:
-            # 첫 캡처 → 즉시 분석
-            should_analyze = True
-        else:
-            # 마지막 AI 분석으로부터 30초 경과 여부 확인
-            time_since_last_analysis = (now - session.last_ai_analysis_time).total_seconds()
-            if time_since_last_analysis >= 30:
-                should_analyze = True
+        frame_buffer = FrameRingBuffer(session_id)
+        alert_window = AlertWindow(session_id)
+        
+        evidence = None
+        if not should_analyze:
+            # ✅ 경고 구간 밖의 미분석 프레임은 링 버퍼에만 보관 (S3/DB 저장 생략)
+            evidence = alert_window.get()
+            if evidence is None:
+                frame_buffer.push(screenshot, participant_count, now)
+                
+                count_capture(session, now=now, participant_count=participant_count)
+                
+                return Response(
+                    self._buffered_payload(pipeline, session, scheduler, now, next_analysis_in, load_factor),
+                    status=status.HTTP_202_ACCEPTED
+                )
         
-        # ✅ FileService로 파일 저장
-        file_service = FileService(request.user)
+        # ✅ 푸시 모드: 접수 즉시 응답하고 업로드/분석 결과는 SSE(/events/)로 전달
+        # 백그라운드 대기열이 가득 차면 동기 처리 (요청 스레드가 처리 속도에 맞춰 조절됨)
+        if push and reserve_push_slot():
+            # 요청이 끝나면 임시 업로드 파일이 지워질 수 있으므로 메모리로 복사
+            screenshot.seek(0)
+            frame = SimpleUploadedFile(screenshot.name, screenshot.read(), screenshot.content_type)
+            
+            submit_and_publish(session_id, functools.partial(
+                self._process, request, pipeline, session, scheduler, frame,
+                participant_count, content_hash, now, should_analyze,
+                next_analysis_in, load_factor, evidence
+            ))
+            
+            return Response({
+                'capture_id': None,
+                'session_id': session.session_id,
+                'timestamp': now.isoformat(),
+                'is_deepfake': False,
+                'queued': False,
+                'buffered': False,
+                'pending': True,
+                'next_analysis_in': next_analysis_in,
+                'analysis_interval': scheduler.interval,
+                'load_factor': load_factor
+            }, status=status.HTTP_202_ACCEPTED)
         
         try:
-            # 파일 업로드 (S3 사용)
-            media_file = file_service.upload_file(
-                uploaded_file=screenshot,
-                file_type='screenshot',
-                purpose='zoom',
-                is_temporary=False,
-                metadata={'session_id': session_id},
-                use_s3=True
+            payload = self._process(
+                request, pipeline, session, scheduler, screenshot,
+                participant_count, content_hash, now, should_analyze,
+                next_analysis_in, load_factor, evidence
             )
-            
-            # S3 URL 생성
-            from media_files.storage import S3Storage
-            
-            if media_file.storage_type == 's3':
-                s3_storage = S3Storage()
-                s3_url = s3_storage.get_presigned_url(media_file.s3_key)
-            else:
-                s3_url = request.build_absolute_uri(f'/media/{media_file.file_path}')
-            
-            # ✅ AI 분석 여부 결정
-            if should_analyze:
-                # AI 분석 수행
-                ai_service = AIModelService()
-                result = ai_service.analyze_image(s3_url)
-                
-                if not result['success']:
-                    # AI 분석 실패 시 기본값
-                    analysis_result = 'safe'
-                    confidence_score = 0
-                    detection_details = None
-                else:
-                    # ResultUrl Presigned URL 변환
-                    import re
-                    for face in result['face_quality_scores']:
-                        if 'ResultUrl' in face and face['ResultUrl']:
-                            original_url = face['ResultUrl']
-                            match = re.search(r'amazonaws\.com/(.+?)$', original_url)
-                            if match:
-                                s3_key = match.group(1)
-                                s3_storage = S3Storage()
-                                face['ResultUrl'] = s3_storage.get_presigned_url(s3_key)
-                    
-                    # 분석 결과 처리
-                    face_scores = result['face_quality_scores']
-                    is_any_deepfake = any(face['is_deepfake'] for face in face_scores)
-                    avg_confidence = sum(face['rate'] for face in face_scores) / len(face_scores) if face_scores else 0
-                    
-                    if is_any_deepfake:
-                        analysis_result = 'deepfake' if avg_confidence >= 0.8 else 'suspicious'
-                    else:
-                        analysis_result = 'safe'
-                    
-                    confidence_score = avg_confidence * 100
-                    detection_details = face_scores
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # ✅ 즉시 응답 (이전 판정을 이어받아 버퍼에만 보관한 프레임은 저장되지 않았으므로 202)
+        return Response(
+            payload,
+            status=status.HTTP_202_ACCEPTED if payload['buffered'] else status.HTTP_201_CREATED
+        )
+    
+    def _buffered_payload(self, pipeline, session, scheduler, now, next_analysis_in, load_factor,
+                          inherited=None, frame_distance=None):
+        """링 버퍼에만 보관한 (저장하지 않은) 프레임의 응답 본문"""
+        return {
+            'capture_id': None,
+            'session_id': session.session_id,
+            'image_url': None,
+            'download_url': None,
+            'timestamp': now.isoformat(),
+            'is_deepfake': False,
+            'confidence': float(inherited['confidence_score']) if inherited else 0.0,
+            'ai_result': {'face_count': 0, 'face_quality_scores': []},
+            'queued': True,
+            'buffered': True,
+            'pending': False,
+            'promoted_frames': 0,
+            'ai_analyzed': False,
+            'dropped': False,
+            'inherited': inherited is not None,
+            'frame_distance': frame_distance,
+            'cache_hit': False,
+            'processing_stages': pipeline.timings,
+            'analysis_result': inherited['analysis_result'] if inherited else None,
+            'next_analysis_in': next_analysis_in,
+            'analysis_interval': scheduler.interval,
+            'load_factor': load_factor
+        }
+    
+    def _process(self, request, pipeline, session, scheduler, screenshot, participant_count,
+                 content_hash, now, should_analyze, next_analysis_in, load_factor, evidence):
+        """
+        프레임 업로드/분석/저장 (요청 스레드 또는 푸시 모드 백그라운드 스레드에서 실행)
+        
+        Returns:
+            dict: 응답 본문 (푸시 모드에서는 capture 이벤트 데이터)
+        
+        Raises:
+            ValueError: 파일 저장 실패 등 잘못된 입력
+        """
+        session_id = session.session_id
+        
+        # ✅ 직전 분석 프레임과 거의 같은 화면이면 이전 판정 재사용
+        frame_hash = None
+        inherited = None
+        frame_distance = None
+        
+        if should_analyze:
+            deduplicator = FrameDeduplicator(session_id)
+            frame_hash = compute_dhash(screenshot)
+            inherited, frame_distance = deduplicator.match(frame_hash)
+            if inherited is not None:
+                # 이전 판정 재사용도 분석 1회로 침 (분석 시각은 check() 에서 기록됨, 간격도 판정대로 조정)
+                scheduler.update_interval(inherited['analysis_result'])
+                next_analysis_in = math.ceil(scheduler.interval * load_factor)
                 
-                # ✅ 마지막 AI 분석 시간 업데이트 (중요!)
-                session.last_ai_analysis_time = now
-                session.save(update_fields=['last_ai_analysis_time'])
+                if inherited['analysis_result'] not in ALERT_RESULTS:
+                    # 안전 판정을 이어받은 프레임은 미분석 프레임처럼 링 버퍼에만 보관 (S3/DB 저장 생략)
+                    FrameRingBuffer(session_id).push(screenshot, participant_count, now)
+                    count_capture(session, now=now, participant_count=participant_count)
+                    return self._buffered_payload(
+                        pipeline, session, scheduler, now, next_analysis_in, load_factor,
+                        inherited=inherited, frame_distance=frame_distance
+                    )
+        
+        # AI 분석 실패/스킵 시 기본값
+        analysis_result = 'safe'
+        confidence_score = 0
+        detection_details = None
+        cache_hit = False
+        dropped = False
+        analysed = False
+        
+        if inherited is not None:
+            analysis_result = inherited['analysis_result']
+            confidence_score = inherited['confidence_score']
+            detection_details = inherited['detection_details']
+        elif evidence is not None:
+            # 경고 구간 안의 프레임은 경고 판정으로 저장 (새 경고로 세지 않음)
+            analysis_result = evidence['analysis_result']
+            confidence_score = evidence['confidence_score']
+            detection_details = evidence['detection_details']
+        
+        upload_options = dict(self.UPLOAD_OPTIONS, metadata={'session_id': session_id})
+        
+        # ✅ AI 분석 여부 결정
+        if should_analyze and inherited is None:
+            # 파일 업로드 + AI 분석 (동일 화면은 캐시된 결과 재사용)
+            try:
+                result = pipeline.upload_and_infer(
+                    screenshot,
+                    content_hash=content_hash,
+                    **upload_options
+                )
+            except (AnalysisDeadlineExceeded, AdmissionRejected):
+                # 마감 시간이 지났거나 AI 서버가 혼잡하면 이 프레임은 분석하지 않고 폐기
+                result = None
+                dropped = True
+            except AnalysisFailedError:
+                result = None
+            
+            if result is not None:
+                detection_details = pipeline.rewrite_result_urls(result['face_quality_scores'])
+                analysis_result, confidence_score = pipeline.score(detection_details)
+                cache_hit = result['cache_hit']
+                analysed = True
                 
-                processing_time = result.get('processing_time', 0)
+                deduplicator.remember(
+                    frame_hash,
+                    analysis_result,
+                    confidence_score,
+                    detection_details
+                )
+            
+            # ✅ 다음 간격 업데이트 (마지막 AI 분석 시간은 check() 에서 기록됨)
+            # 폐기된 프레임은 분석으로 치지 않아 다음 프레임이 바로 분석된다
+            if dropped:
+                scheduler.release(now)
             else:
-                # ✅ AI 분석 스킵 (30초 미경과)
-                analysis_result = 'safe'
-                confidence_score = 0
-                detection_details = None
-                processing_time = 0
+                if result is not None:
+                    scheduler.update_interval(analysis_result)
+                next_analysis_in = math.ceil(scheduler.interval * load_factor)
             
-            # 분석 기록 저장
-            record = AnalysisRecord.objects.create(
-                user=request.user,
-                analysis_type='zoom',
-                file_name=media_file.original_name,
-                file_size=media_file.file_size,
-                file_format=media_file.file_format,
-                original_path=media_file.file_path,
-                analysis_result=analysis_result,
-                confidence_score=confidence_score,
-                detection_details=detection_details,
-                processing_time=processing_time,
-                ai_model_version='v1.0'
+            media_file = pipeline.media_file
+            s3_url = pipeline.input_url
+        else:
+            # 파일 업로드 (S3 사용)
+            media_file = pipeline.upload(screenshot, **upload_options)
+            s3_url = pipeline.locate(media_file)
+        
+        # 분석 기록 저장
+        record = pipeline.persist(
+            media_file,
+            'zoom',
+            analysis_result,
+            confidence_score,
+            detection_details
+        )
+        
+        # Zoom 캡처 기록
+        is_deepfake = analysis_result in ALERT_RESULTS and evidence is None
+        
+        capture = ZoomCapture.objects.create(
+            session=session,
+            record=record,
+            participant_count=participant_count,
+            alert_triggered=is_deepfake
+        )
+        
+        # 세션 통계 + 분 단위 집계 업데이트
+        count_capture(
+            session,
+            alert=is_deepfake,
+            now=now,
+            participant_count=participant_count,
+            analysed=analysed,
+            confidence=confidence_score
+        )
+        
+        # ✅ 경고 발생: 경고 구간 시작 + 버퍼에 있던 직전 프레임 저장
+        promoted = 0
+        if is_deepfake:
+            AlertWindow(session_id).open(analysis_result, confidence_score, detection_details)
+            promoted = self._promote_buffered(
+                request,
+                session,
+                FrameRingBuffer(session_id).drain(now),
+                analysis_result,
+                confidence_score,
+                detection_details
             )
+        
+        return {
+            'capture_id': capture.capture_id,
+            'session_id': session_id,
+            'image_url': s3_url,  # ✅ 수정: None → s3_url
+            'download_url': s3_url,  # ✅ 추가
+            'timestamp': capture.capture_timestamp.isoformat(),
+            'is_deepfake': is_deepfake,
+            'confidence': float(confidence_score),
+            'ai_result': {
+                'face_count': len(detection_details) if detection_details else 0,
+                'face_quality_scores': detection_details or []
+            },
+            # 기존 필드들 (호환성)
+            'queued': not should_analyze,
+            'buffered': False,
+            'pending': False,
+            'promoted_frames': promoted,
+            'ai_analyzed': analysed,
+            'dropped': dropped,
+            'inherited': inherited is not None,
+            'frame_distance': frame_distance,
+            'cache_hit': cache_hit,
+            'processing_stages': pipeline.timings,
+            'analysis_result': analysis_result,
+            'next_analysis_in': next_analysis_in,
+            'analysis_interval': scheduler.interval,
+            'load_factor': load_factor
+        }
+    
+    def _promote_buffered(self, request, session, frames, analysis_result,
+                          confidence_score, detection_details):
+        """
+        링 버퍼의 경고 직전 프레임을 S3/DB에 저장
+        
+        프레임은 분석하지 않았으므로 경고 판정을 그대로 기록하되
+        경고 발생(alert_triggered)으로는 세지 않는다.
+        
+        Returns:
+            int: 저장한 프레임 수
+        """
+        upload_options = dict(self.UPLOAD_OPTIONS, metadata={'session_id': session.session_id})
+        promoted = 0
+        
+        for frame in frames:
+            pipeline = DetectionPipeline(request.user, request, profile='zoom')
+            try:
+                media_file = pipeline.upload(frame['file'], **upload_options)
+            except ValueError:
+                continue
             
-            # 관계 연결
-            media_file.related_model = 'AnalysisRecord'
-            media_file.related_record_id = record.record_id
-            media_file.save()
-            
-            # Zoom 캡처 기록
-            is_deepfake = analysis_result in ['suspicious', 'deepfake']
-            
+            record = pipeline.persist(
+                media_file,
+                'zoom',
+                analysis_result,
+                confidence_score,
+                detection_details
+            )
             capture = ZoomCapture.objects.create(
                 session=session,
                 record=record,
-                participant_count=participant_count,
-                alert_triggered=is_deepfake
+                participant_count=frame['participant_count'],
+                alert_triggered=False
             )
-            
-            # 세션 통계 업데이트
-            session.total_captures += 1
-            if is_deepfake:
-                session.suspicious_detections += 1
-            session.save()
-            
-            # ✅ 즉시 응답
-            return Response({
-                'capture_id': capture.capture_id,
-                'session_id': session.session_id,
-                'image_url': s3_url,  # ✅ 수정: None → s3_url
-                'download_url': s3_url,  # ✅ 추가
-                'timestamp': capture.capture_timestamp.isoformat(),
-                'is_deepfake': is_deepfake,
-                'confidence': float(confidence_score),
-                'ai_result': {
-                    'face_count': len(detection_details) if detection_details else 0,
-                    'face_quality_scores': detection_details or []
-                },
-                # 기존 필드들 (호환성)
-                'queued': not should_analyze,
-                'ai_analyzed': should_analyze,
-                'analysis_result': analysis_result,
-                'next_analysis_in': 30 if should_analyze else int(30 - time_since_last_analysis)
-            }, status=status.HTTP_201_CREATED)
+            # capture_timestamp 는 auto_now_add 이므로 실제 캡처 시각으로 다시 기록
+            ZoomCapture.objects.filter(pk=capture.pk).update(capture_timestamp=frame['captured_at'])
+            promoted += 1
         
+        return promoted
+
+
+class ZoomFrameView(ZoomCaptureView):
+    """
+    Zoom 원본 프레임 수신 API (multipart 없이 이미지 바이트 본문 그대로)
+    
+    POST /api/zoom/sessions/<id>/frames/?participant_count=2&push=true
+    Content-Type: image/jpeg 또는 image/webp
+    
+    매직 바이트와 헤더의 이미지 크기만 검사하고 픽셀은 디코딩하지 않는다.
+    이후 처리(간격 제어/버퍼/분석/푸시)는 캡처 API와 같다.
+    """
+    
+    parser_classes = [RawFrameParser]
+    
+    def post(self, request, session_id):
+        pipeline = DetectionPipeline(request.user, request, profile='zoom')
+        
+        data = request.data
+        if not isinstance(data, bytes) or not data:
+            return Response(
+                {'error': '프레임 데이터가 없습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            frame = inspect_frame(data, request.content_type)
+            participant_count = int(request.query_params.get('participant_count', 1))
         except ValueError as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        if participant_count < 1:
+            return Response(
+                {'error': '참가자 수는 1 이상이어야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        screenshot = SimpleUploadedFile(
+            f'frame.{frame["extension"]}',
+            data,
+            frame['content_type']
+        )
+        # 본문을 이미 메모리에 갖고 있으므로 해시도 여기서 계산 (get_content_hash 가 재사용)
+        screenshot.sha256 = hashlib.sha256(data).hexdigest()
+        
+        push = request.query_params.get('push', '').lower() in ('1', 'true')
+        return self.handle_capture(request, pipeline, session_id, screenshot, participant_count, push)
 
 
-
+async def session_events(request, session_id):
+    """
+    Zoom 세션 판정 결과 스트림 (Server-Sent Events, ASGI 전용)
+    
+    EventSource 는 헤더를 지정할 수 없으므로 ?token= 으로 인증한다.
+    재연결 시 브라우저가 보내는 Last-Event-ID 이후 이벤트부터 이어서 전달한다.
+    
+    이벤트:
+        capture: 캡처 처리 결과 (캡처 API 동기 응답과 같은 형식)
+        capture_error: 캡처 처리 실패
+        session_end: 세션 종료 (스트림 종료)
+    """
+    if not isinstance(request, ASGIRequest):
+        # WSGI 에서는 스트림이 요청 스레드를 계속 점유하므로 지원하지 않음 (클라이언트는 동기 응답 사용)
+        return JsonResponse(
+            {'error': '이벤트 스트림은 ASGI 서버(config.asgi)에서만 지원합니다.'},
+            status=501
+        )
+    
+    key = request.GET.get('token')
+    if not key:
+        scheme, _, key = request.headers.get('Authorization', '').partition(' ')
+        if scheme != 'Token':
+            key = None
+    
+    try:
+        token = await Token.objects.select_related('user').aget(key=key) if key else None
+    except Token.DoesNotExist:
+        token = None
+    
+    if token is None or not token.user.is_active:
+        return JsonResponse({'error': '인증이 필요합니다.'}, status=401)
+    
+    if not await ZoomSession.objects.filter(session_id=session_id, user=token.user).aexists():
+        return JsonResponse({'error': '세션을 찾을 수 없습니다.'}, status=404)
+    
+    try:
+        last_id = int(request.headers.get('Last-Event-ID') or request.GET.get('last_event_id') or 0)
+    except ValueError:
+        last_id = 0
+    
+    response = StreamingHttpResponse(
+        event_stream(SessionMailbox(session_id), last_id),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 비활성화
+    return response
 
 
 class ZoomSessionEndView(APIView):
@@ -245,9 +566,28 @@ class ZoomSessionEndView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
+        # 이 워커에 쌓인 세션 통계 증가분 반영 (다른 워커분은 WRITE_BUFFER_FLUSH_INTERVAL 이내 반영)
+        # 소유자 확인 후에만 실행 → 다른 사용자가 세션 ID 로 동기 flush 를 유발할 수 없음
+        get_write_buffer().flush()
+        session.refresh_from_db(fields=['total_captures', 'suspicious_detections'])
+        
         session.end_time = timezone.now()
         session.session_status = 'completed'
-        session.save()
+        # 진행 중인 캡처 요청의 통계 증가분을 덮어쓰지 않도록 변경한 필드만 저장
+        session.save(update_fields=['end_time', 'session_status'])
+        
+        # 캡처 요청이 캐시된 세션 상태로 계속 받지 않도록 종료 상태 반영
+        ActiveSessionState.end(session)
+        
+        # 저장되지 않은 버퍼 프레임/경고 구간 정리
+        FrameRingBuffer(session_id).clear()
+        AlertWindow(session_id).clear()
+        
+        # 이벤트 스트림 종료 알림
+        SessionMailbox(session_id).publish('session_end', {'session_id': session.session_id})
+        
+        # ✅ 안전 판정 캡처 압축 + 보고서 스냅샷 (분석 워커에서 실행)
+        enqueue_zoom_finalization(session)
         
         # ✅ 응답 구조 변경
         return Response({
@@ -295,8 +635,66 @@ class ZoomCaptureDetailView(generics.RetrieveAPIView):
         ).select_related('record', 'session')
 
 
+class ZoomSessionTimelineView(APIView):
+    """
+    Zoom 세션 타임라인 API (분 단위 집계만 조회)
+    
+    GET /api/zoom/sessions/<id>/timeline/?since=2025-01-11T10:30:00Z
+    
+    캡처가 없던 분은 포함하지 않는다. since 를 주면 그 분부터 다시 받으므로
+    진행 중인 세션은 마지막으로 받은 분을 since 로 보내 이어서 갱신한다.
+    """
+    
+    def get(self, request, session_id):
+        try:
+            session = ZoomSession.objects.get(
+                session_id=session_id,
+                user=request.user
+            )
+        except ZoomSession.DoesNotExist:
+            return Response(
+                {'error': '세션을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        minutes = ZoomSessionMinute.objects.filter(session=session)
+        
+        since = request.query_params.get('since')
+        if since:
+            try:
+                since = parse_datetime(since)
+            except ValueError:
+                since = None
+            if since is None:
+                return Response(
+                    {'error': 'since 는 ISO 8601 시각이어야 합니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            minutes = minutes.filter(bucket__gte=minute_bucket(since))
+        
+        return Response({
+            'session_id': session.session_id,
+            'bucket_seconds': 60,
+            'timeline': ZoomSessionMinuteSerializer(minutes, many=True).data
+        })
+
+
 class ZoomSessionReportView(APIView):
-    """Zoom 세션 보고서 API"""
+    """
+    Zoom 세션 보고서 API
+    
+    GET /api/zoom/sessions/<id>/report/?alerts_only=true&page_size=50&cursor=...
+    
+    요약 통계는 DB 집계 1회로 계산하고, 캡처 목록은 최신순 커서 페이지로 나눠 반환한다.
+    다음 페이지는 응답의 next URL 로 이어서 조회한다.
+    
+    종료된 세션은 바뀌지 않으므로 압축 스냅샷에서 읽고 이미지 URL만 다시 서명한다.
+    ETag 를 보내므로 If-None-Match 가 같으면 본문 없이 304 를 반환한다.
+    """
+    
+    pagination_class = ZoomCaptureCursorPagination
     
     def get(self, request, session_id):
         try:
@@ -310,28 +708,65 @@ class ZoomSessionReportView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # 캡처 목록
+        alerts_only = request.query_params.get('alerts_only', '').lower() in ('1', 'true')
+        
+        # ✅ 종료된 세션은 스냅샷에서 조회
+        if snapshot_ready(session):
+            response = self._snapshot_response(request, session, alerts_only)
+            if response is not None:
+                return response
+        
+        # 캡처 목록 (경고 캡처만 요청하면 의심/딥페이크 판정만)
         captures = ZoomCapture.objects.filter(session=session).select_related('record')
+        if alerts_only:
+            captures = captures.filter(record__analysis_result__in=ALERT_RESULTS)
         
-        # 요약 정보
-        summary = {
-            'total_captures': session.total_captures,
-            'suspicious_detections': session.suspicious_detections,
-            'detection_rate': round(
-                (session.suspicious_detections / session.total_captures * 100)
-                if session.total_captures > 0 else 0, 2
-            ),
-            'duration_seconds': session.duration,
-            'average_participants': round(
-                sum([c.participant_count for c in captures]) / len(captures)
-                if len(captures) > 0 else 0, 1
-            )
-        }
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(captures, request, view=self)
         
         data = {
             'session': ZoomSessionSerializer(session).data,
-            'captures': ZoomCaptureSerializer(captures, many=True).data,
-            'summary': summary
+            'captures': ZoomReportCaptureSerializer(
+                page,
+                many=True,
+                context={
+                    'request': request,
+                    'media_files': media_files_for(page),
+                    'storage': S3Storage()
+                }
+            ).data,
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+            'summary': summarize_session(session)
         }
         
-        return Response(data)
\ No newline at end of file
+        return Response(data)
+    
+    def _snapshot_response(self, request, session, alerts_only):
+        """
+        스냅샷 응답 (진행 중에 받은 DB 커서로 이어 읽는 요청이면 None)
+        """
+        offset = 0
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            offset = decode_cursor(cursor)
+            if offset is None:
+                return None
+        
+        report = get_snapshot(session)
+        page_size = self.pagination_class().get_page_size(request)
+        epoch, ttl = signing_epoch()
+        etag = snapshot_etag(report, alerts_only, offset, page_size, epoch)
+        
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(
+                cached_snapshot_page(report, request, alerts_only, offset, page_size, etag, ttl)
+            )
+        
+        response['ETag'] = etag
+        # 브라우저는 캐시해 두고 매번 ETag 로 재검증
+        response['Cache-Control'] = 'private, no-cache'
+        patch_vary_headers(response, ['Authorization'])
+        return response
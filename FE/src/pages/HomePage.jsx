@@ -1,6 +1,6 @@
 import React, { useState, useRef, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
-import { startZoomSession, sendCapture, endZoomSession } from '../utils/api'
+import { startZoomSession, sendCapture, endZoomSession, openSessionEvents } from '../utils/api'
 import { getToken, logout } from '../utils/auth'  
 import './HomePage.css'
 
@@ -19,6 +19,8 @@ function HomePage() {
   const intervalRef = useRef(null)
   const capturedImagesRef = useRef([])
   const currentNotificationRef = useRef(null)  // ✅ 현재 알림 저장
+  const eventSourceRef = useRef(null)  // ✅ 판정 결과 스트림 (SSE)
+  const pushReadyRef = useRef(false)  // 스트림 연결 중이면 캡처 응답을 기다리지 않음
 
   useEffect(() => {
     requestNotificationPermission()
@@ -30,6 +32,9 @@ function HomePage() {
       if (intervalRef.current) {
         clearInterval(intervalRef.current)
       }
+      if (eventSourceRef.current) {
+        eventSourceRef.current.close()
+      }
       capturedImagesRef.current.forEach(img => {
         if (img.url && img.url.startsWith('blob:')) {
           URL.revokeObjectURL(img.url)
@@ -162,6 +167,21 @@ function HomePage() {
       sessionIdRef.current = sessionData.session_id
       console.log('✅ 백엔드 세션 시작:', sessionData)
 
+      // ✅ 판정 결과 스트림 연결 (실패하면 캡처 응답으로 결과 확인)
+      pushReadyRef.current = false
+      eventSourceRef.current = openSessionEvents(sessionData.session_id, {
+        onOpen: () => {
+          pushReadyRef.current = true
+        },
+        onCapture: (result) => handleCaptureResult(result),
+        onError: (closed) => {
+          pushReadyRef.current = false
+          if (closed) {
+            console.warn('⚠️ 판정 결과 스트림 사용 불가 - 동기 응답 사용')
+          }
+        }
+      })
+
       const stream = await navigator.mediaDevices.getDisplayMedia({
         video: {
           mediaSource: 'screen',
@@ -244,18 +264,18 @@ function HomePage() {
       
       const blob = await (await fetch(base64Image)).blob()
       
-      const formData = new FormData()
-      formData.append('screenshot', blob, `capture_${Date.now()}.jpg`)
-      formData.append('participant_count', 1)
+      // ✅ multipart 없이 JPEG 바이트 그대로 전송
+      const params = new URLSearchParams({ participant_count: 1, push: pushReadyRef.current })
 
       const response = await fetch(
-        `${API_BASE_URL}/zoom/sessions/${sessionIdRef.current}/capture/`,
+        `${API_BASE_URL}/zoom/sessions/${sessionIdRef.current}/frames/?${params}`,
         {
           method: 'POST',
           headers: {
-            'Authorization': `Token ${token}`
+            'Authorization': `Token ${token}`,
+            'Content-Type': 'image/jpeg'
           },
-          body: formData
+          body: blob
         }
       )
 
@@ -266,9 +286,9 @@ function HomePage() {
       const result = await response.json()
       console.log('✅ 백엔드 전송 성공:', result)
 
-      // ✅ 딥페이크 감지 시 시스템 알림 표시 (이전 알림 자동 교체)
-      if (result.is_deepfake) {
-        showDeepfakeNotification(result.confidence, captureTime)
+      // 푸시 모드면 판정 결과는 스트림으로 도착
+      if (!result.pending) {
+        handleCaptureResult(result, captureTime)
       }
 
     } catch (error) {
@@ -276,12 +296,25 @@ function HomePage() {
     }
   }
 
+  const handleCaptureResult = (result, captureTime = result.timestamp) => {
+    // ✅ 딥페이크 감지 시 시스템 알림 표시 (이전 알림 자동 교체)
+    if (result.is_deepfake) {
+      showDeepfakeNotification(result.confidence, captureTime)
+    }
+  }
+
   const handleStopRecording = async () => {
     if (intervalRef.current) {
       clearInterval(intervalRef.current)
       intervalRef.current = null
     }
 
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close()
+      eventSourceRef.current = null
+      pushReadyRef.current = false
+    }
+
     if (streamRef.current) {
       streamRef.current.getTracks().forEach(track => track.stop())
       streamRef.current = null
@@ -1,7 +1,7 @@
 // FE/src/pages/SessionDetailPage.jsx
 import React, { useState, useEffect } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
-import { getZoomSessionDetail } from '../utils/api'
+import { getZoomSessionDetail, getZoomSessionTimeline } from '../utils/api'
 import './SessionDetailPage.css'
 
 function SessionDetailPage() {
@@ -10,6 +10,7 @@ function SessionDetailPage() {
   
   const [session, setSession] = useState(null)
   const [deepfakeCaptures, setDeepfakeCaptures] = useState([])
+  const [timeline, setTimeline] = useState([])  // ✅ 분 단위 집계
   const [selectedImage, setSelectedImage] = useState(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
@@ -24,21 +25,31 @@ function SessionDetailPage() {
       setError(null)
       
       console.log('📡 세션 상세 정보 요청:', sessionId)
-      const data = await getZoomSessionDetail(sessionId)
+      // ✅ 딥페이크로 판정된 캡처만 서버에서 페이지 단위로 받기
+      let data = await getZoomSessionDetail(sessionId, { alertsOnly: true })
+      const deepfakes = [...data.captures]
       
       console.log('✅ 세션 상세 정보 로드 완료:', data)
       
       setSession(data.session)
       
-      // ✅ 딥페이크로 판정된 캡처만 필터링
-      const deepfakes = data.captures.filter(capture => {
-        const result = capture.record?.analysis_result
-        return result === 'deepfake' || result === 'suspicious'
-      })
+      while (data.next) {
+        const cursor = new URL(data.next).searchParams.get('cursor')
+        data = await getZoomSessionDetail(sessionId, { alertsOnly: true, cursor })
+        deepfakes.push(...data.captures)
+      }
       
       console.log('🚨 딥페이크 캡처:', deepfakes)
       setDeepfakeCaptures(deepfakes)
       
+      // 타임라인은 부가 정보이므로 실패해도 페이지는 표시
+      try {
+        const timelineData = await getZoomSessionTimeline(sessionId)
+        setTimeline(timelineData.timeline)
+      } catch (timelineError) {
+        console.warn('⚠️ 타임라인 로드 실패:', timelineError)
+      }
+      
     } catch (err) {
       console.error('❌ 세션 상세 정보 로드 실패:', err)
       setError(err.message)
@@ -149,6 +160,8 @@ function SessionDetailPage() {
     )
   }
 
+  const maxTimelineCaptures = Math.max(1, ...timeline.map(bucket => bucket.captures))
+
   return (
     <div className="detail-container">
       {/* 헤더 */}
@@ -168,6 +181,28 @@ function SessionDetailPage() {
       </header>
 
       <main className="detail-content">
+        {/* 분 단위 타임라인 */}
+        {timeline.length > 0 && (
+          <div className="summary-card">
+            <div className="section-header">
+              <h2>📈 시간대별 캡처</h2>
+              <p className="section-subtitle">
+                막대 높이는 분당 캡처 수, 빨간 막대는 경고가 발생한 분입니다
+              </p>
+            </div>
+            <div className="timeline-chart">
+              {timeline.map((bucket) => (
+                <div
+                  key={bucket.minute}
+                  className={`timeline-bar ${bucket.alerts > 0 ? 'danger' : ''}`}
+                  style={{ height: `${(bucket.captures / maxTimelineCaptures) * 100}%` }}
+                  title={`${bucket.minute} · 캡처 ${bucket.captures} · 분석 ${bucket.analysed_frames} · 경고 ${bucket.alerts}`}
+                />
+              ))}
+            </div>
+          </div>
+        )}
+
         {/* 딥페이크 이미지 목록 */}
         <div className="images-section">
           <div className="section-header">
@@ -17,8 +17,8 @@ const authenticatedFetch = async (url, options = {}) => {
     headers['Authorization'] = `Token ${token}`
   }
   
-  // FormData가 아닌 경우에만 Content-Type 설정
-  if (!(options.body instanceof FormData)) {
+  // FormData·Blob이 아닌 경우에만 Content-Type 설정 (Blob은 자체 type 사용)
+  if (!(options.body instanceof FormData) && !(options.body instanceof Blob)) {
     headers['Content-Type'] = 'application/json'
   }
   
@@ -47,11 +47,13 @@ export const startZoomSession = async (sessionName) => {
 
 /**
  * 화면 캡처 전송 및 분석
+ * push=true 이면 접수 즉시 응답하고 결과는 세션 이벤트 스트림으로 전달된다
  */
-export const sendCapture = async (sessionId, screenshot, participantCount = 1) => {
+export const sendCapture = async (sessionId, screenshot, participantCount = 1, push = false) => {
   const formData = new FormData()
   formData.append('screenshot', screenshot)
   formData.append('participant_count', participantCount)
+  formData.append('push', push)
   
   return authenticatedFetch(`/zoom/sessions/${sessionId}/capture/`, {
     method: 'POST',
@@ -59,6 +61,40 @@ export const sendCapture = async (sessionId, screenshot, participantCount = 1) =
   })
 }
 
+/**
+ * 화면 캡처 원본 전송 (multipart 없이 이미지 바이트 그대로)
+ * frame 은 image/jpeg 또는 image/webp Blob
+ */
+export const sendFrame = async (sessionId, frame, participantCount = 1, push = false) => {
+  const params = new URLSearchParams({ participant_count: participantCount, push })
+
+  return authenticatedFetch(`/zoom/sessions/${sessionId}/frames/?${params}`, {
+    method: 'POST',
+    body: frame
+  })
+}
+
+/**
+ * Zoom 세션 판정 결과 스트림 (Server-Sent Events)
+ * EventSource 는 헤더를 지정할 수 없으므로 토큰을 쿼리로 전달
+ */
+export const openSessionEvents = (sessionId, { onOpen, onCapture, onError } = {}) => {
+  const token = getToken()
+  const source = new EventSource(
+    `${API_BASE_URL}/zoom/sessions/${sessionId}/events/?token=${encodeURIComponent(token)}`
+  )
+
+  source.onopen = () => onOpen && onOpen()
+  source.onerror = () => onError && onError(source.readyState === EventSource.CLOSED)
+
+  source.addEventListener('capture', (event) => {
+    onCapture && onCapture(JSON.parse(event.data))
+  })
+  source.addEventListener('session_end', () => source.close())
+
+  return source
+}
+
 /**
  * Zoom 세션 종료
  */
@@ -83,9 +119,24 @@ export const getZoomSessions = async (status = null) => {
 
 /**
  * 세션 상세 정보 가져오기
+ * 캡처 목록은 페이지 단위 (다음 페이지는 응답 next 의 cursor 로 요청)
+ */
+export const getZoomSessionDetail = async (sessionId, { alertsOnly = false, cursor = null } = {}) => {
+  const params = new URLSearchParams()
+  if (alertsOnly) params.append('alerts_only', 'true')
+  if (cursor) params.append('cursor', cursor)
+
+  const query = params.toString()
+  return authenticatedFetch(`/zoom/sessions/${sessionId}/report/${query ? `?${query}` : ''}`, {
+    method: 'GET'
+  })
+}
+
+/**
+ * 세션 타임라인 (분 단위 집계) 가져오기
  */
-export const getZoomSessionDetail = async (sessionId) => {
-  return authenticatedFetch(`/zoom/sessions/${sessionId}/report/`, {
+export const getZoomSessionTimeline = async (sessionId) => {
+  return authenticatedFetch(`/zoom/sessions/${sessionId}/timeline/`, {
     method: 'GET'
   })
 }